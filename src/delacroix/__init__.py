@@ -1,6 +1,6 @@
 """Delacroix package."""
 
-from .core import Harvester, HarvestResult
+from .core import Harvester, HarvestOutcome, HarvestResult
 from .platforms.registry import PLATFORM_REGISTRY, get_platform
 
-__all__ = ["Harvester", "HarvestResult", "PLATFORM_REGISTRY", "get_platform"]
+__all__ = ["Harvester", "HarvestOutcome", "HarvestResult", "PLATFORM_REGISTRY", "get_platform"]
@@ -0,0 +1,18 @@
+"""Offline benchmarks: a fake-museum server, an end-to-end harvest harness and microbenchmarks."""
+
+from .harvest import HarvestBenchmark, run_harvest_benchmark, run_harvest_benchmarks
+from .micro import BENCHMARKS, MicroResult, find_regressions, load_baseline, run_microbenchmarks, save_baseline
+from .server import FakeMuseum
+
+__all__ = [
+    "BENCHMARKS",
+    "FakeMuseum",
+    "HarvestBenchmark",
+    "MicroResult",
+    "find_regressions",
+    "load_baseline",
+    "run_harvest_benchmark",
+    "run_harvest_benchmarks",
+    "run_microbenchmarks",
+    "save_baseline",
+]
@@ -0,0 +1,158 @@
+"""End-to-end harvest benchmark against the local fake-museum server."""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core import Harvester, HarvestResult
+from ..platforms.registry import get_platform
+from ..render import FRAME_TV_4K
+from ..triage import TriageOptions
+from .server import PLATFORM_PATHS, FakeMuseum
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0-100) of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(durations: Sequence[float]) -> Dict[str, float]:
+    return {
+        "count": len(durations),
+        "p50_ms": percentile(durations, 50) * 1000,
+        "p95_ms": percentile(durations, 95) * 1000,
+        "total_s": sum(durations),
+    }
+
+
+@dataclass
+class HarvestBenchmark:
+    platform: str
+    wall_seconds: float
+    result: HarvestResult
+    requests: int
+    bytes_downloaded: int
+    # Client-side Harvester stages and server-side endpoints, each summarized
+    stages: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    endpoints: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    generated: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def images(self) -> int:
+        return self.result.downloaded
+
+    @property
+    def images_per_second(self) -> float:
+        return self.images / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def requests_per_image(self) -> float:
+        return self.requests / self.images if self.images else float("inf")
+
+    @property
+    def bytes_per_image(self) -> float:
+        return self.bytes_downloaded / self.images if self.images else float("inf")
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "platform": self.platform,
+            "wall_seconds": self.wall_seconds,
+            "images": self.images,
+            "images_per_second": self.images_per_second,
+            "requests": self.requests,
+            "requests_per_image": self.requests_per_image,
+            "bytes_downloaded": self.bytes_downloaded,
+            "bytes_per_image": self.bytes_per_image,
+            "result": asdict(self.result),
+            "stages": self.stages,
+            "endpoints": self.endpoints,
+            "generated": self.generated,
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"{self.platform}: {self.images} images in {self.wall_seconds:.2f}s "
+            f"({self.images_per_second:.2f} img/s, {self.requests_per_image:.1f} req/img, "
+            f"{self.bytes_per_image / 1024:.0f} KiB/img)"
+        ]
+        for kind, rows in (("stage", self.stages), ("endpoint", self.endpoints)):
+            for name, row in rows.items():
+                lines.append(
+                    f"  {kind:<8} {name:<10} n={row['count']:<5} "
+                    f"p50={row['p50_ms']:8.1f}ms p95={row['p95_ms']:8.1f}ms"
+                )
+        if self.generated.get("count"):
+            lines.append(
+                f"  (server generated {self.generated['count']} images, "
+                f"{self.generated['total_s']:.2f}s; rerun for warm-cache numbers)"
+            )
+        return "\n".join(lines)
+
+
+def run_harvest_benchmark(
+    museum: FakeMuseum,
+    platform_name: str,
+    *,
+    max_items: int = 20,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    output_format: str = "jpeg",
+    target_size: Optional[Tuple[int, int]] = FRAME_TV_4K,
+    triage: bool = False,
+    tags: Optional[List[str]] = None,
+    types: Optional[List[str]] = None,
+) -> HarvestBenchmark:
+    """Harvest ``max_items`` from one platform served by ``museum`` into a temp directory."""
+    platform = museum.configure(get_platform(platform_name, seed=seed))
+    stage_times: Dict[str, List[float]] = {}
+    harvester = Harvester(
+        platform,
+        target_size=target_size,
+        workers=workers,
+        output_format=output_format,
+        triage=TriageOptions() if triage else None,
+        stage_observer=lambda stage, seconds: stage_times.setdefault(stage, []).append(seconds),
+    )
+    museum.stats.reset()
+    museum.generate_times.clear()
+    with tempfile.TemporaryDirectory(prefix="delacroix-bench-") as out:
+        start = time.perf_counter()
+        result = harvester.harvest(Path(out), max_items=max_items, tags=tags, types=types)
+        wall = time.perf_counter() - start
+
+    return HarvestBenchmark(
+        platform=platform_name,
+        wall_seconds=wall,
+        result=result,
+        requests=museum.stats.requests,
+        bytes_downloaded=museum.stats.total_bytes,
+        stages={name: summarize(times) for name, times in stage_times.items()},
+        endpoints={name: summarize(times) for name, times in sorted(museum.stats.durations.items())},
+        # Image synthesis on cold runs inflates the image endpoint; shown so it can be discounted
+        generated=summarize(museum.generate_times),
+    )
+
+
+def run_harvest_benchmarks(
+    platforms: Sequence[str] = tuple(PLATFORM_PATHS),
+    *,
+    seed: int = 0,
+    objects: int = 300,
+    latency: float = 0.0,
+    bandwidth: Optional[float] = None,
+    fixtures_dir: Optional[Path] = None,
+    **options,
+) -> List[HarvestBenchmark]:
+    """Start a fake museum and benchmark each platform against it in turn."""
+    with FakeMuseum(
+        seed=seed, objects=objects, latency=latency, bandwidth=bandwidth, fixtures_dir=fixtures_dir
+    ) as museum:
+        return [run_harvest_benchmark(museum, name, seed=seed, **options) for name in platforms]
@@ -0,0 +1,290 @@
+"""Microbenchmarks for the pure-CPU code that runs once per candidate artwork."""
+
+from __future__ import annotations
+
+import json
+import platform as _platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PIL import Image
+
+from .. import knowledge_base, snapshot
+from ..artists import is_famous_artist
+from ..core import Harvester
+from ..knowledge_base import build_smart_queries, extract_period_from_tags, is_artist_famous
+from ..platforms.chicago import ChicagoPlatform
+from ..types import get_type_keywords
+
+BASELINE_VERSION = 1
+
+# Default allowed slowdown (percent of the baseline's per-op time) before a regression is flagged
+DEFAULT_THRESHOLD = 20.0
+
+_FIRST_NAMES = ["Jan", "Pieter", "Maria", "Jean", "Anna", "Giovanni", "Elisabeth", "Carl", "Sofia", "Hans"]
+_LAST_NAMES = ["de Vries", "Moreau", "Rossi", "Schmidt", "Lindqvist", "Novak", "Dupont", "Bakker", "Silva", "Weber"]
+_ATTRIBUTIONS = ["", "", "", "Follower of ", "Workshop of ", "Attributed to ", "Circle of "]
+_TAG_WORDS = ["european", "french", "dutch", "impressionism", "baroque", "landscape", "portrait", "1800s", "1650s", "17th"]
+_TYPES = ["painting", "paintings", "oil", "drawing", "print", "sculpture", "watercolor", "photo", "textile", "unknown"]
+_TITLE_WORDS = ["Still Life", "View of Delft", "Portrait", "Madame", "Æsop", "Nuit étoilée", "(copy)", "No. 3", "—"]
+
+
+@dataclass(frozen=True)
+class MicroResult:
+    name: str
+    ops: int
+    runs: List[float]
+
+    @property
+    def best_seconds(self) -> float:
+        return min(self.runs)
+
+    @property
+    def median_seconds(self) -> float:
+        return statistics.median(self.runs)
+
+    @property
+    def per_op_us(self) -> float:
+        """Best-run microseconds per operation; what baselines are compared on."""
+        return self.best_seconds / self.ops * 1e6
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            **asdict(self),
+            "best_seconds": self.best_seconds,
+            "median_seconds": self.median_seconds,
+            "per_op_us": self.per_op_us,
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def change(self) -> float:
+        return self.current_us / self.baseline_us - 1
+
+
+def candidate_names(count: int, rng: random.Random) -> List[str]:
+    """Artist strings as museums return them: mostly unknown, some famous, some attributed."""
+    famous = [a["name"] for a in knowledge_base.get_artists_db()]
+    names = []
+    for _ in range(count):
+        if rng.random() < 0.2:
+            name = rng.choice(famous)
+        else:
+            name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        names.append(rng.choice(_ATTRIBUTIONS) + name)
+    return names
+
+
+def _synthetic_artists(count: int, rng: random.Random) -> List[Dict]:
+    nationalities = ["French", "Italian", "Dutch", "Spanish", "German", "Flemish", "British", "American"]
+    movements = ["Impressionism", "Baroque", "Romanticism", "Realism", "Renaissance"]
+    artists = []
+    for i in range(count):
+        birth = rng.randint(1400, 1900)
+        artists.append({
+            "name": f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)} {i}",
+            "aliases": [f"Master {i}"] if rng.random() < 0.3 else [],
+            "birth": birth,
+            "death": birth + rng.randint(30, 80),
+            "nationality": rng.choice(nationalities),
+            "movements": [rng.choice(movements)],
+            "priority": rng.randint(10, 95),
+        })
+    return artists
+
+
+def _clear_knowledge_caches() -> None:
+    for finder in (
+        knowledge_base.find_artists_by_period,
+        knowledge_base.find_artists_by_nationality,
+        knowledge_base.find_artists_by_movement,
+    ):
+        finder.cache_clear()
+
+
+@contextmanager
+def artist_db(size: Optional[int], rng: random.Random) -> Iterator[None]:
+    """Temporarily pad the knowledge snapshot with synthetic artists up to ``size`` entries."""
+    base = snapshot.load_snapshot()
+    if size is None or size <= len(base["artists"]):
+        yield
+        return
+    artists = base["artists"] + _synthetic_artists(size - len(base["artists"]), rng)
+    artist_index = dict(base["indexes"]["artist"])
+    for idx, artist in enumerate(artists):
+        for name in [artist["name"], *artist.get("aliases", [])]:
+            artist_index.setdefault(name.lower(), idx)
+    indexes = {
+        **base["indexes"],
+        "artist": artist_index,
+        "nationality": snapshot._index_by(artists, lambda a: [a["nationality"]]),
+        "movement": snapshot._index_by(artists, lambda a: a.get("movements", [])),
+    }
+    snapshot._SNAPSHOT = {**base, "artists": artists, "indexes": indexes}
+    _clear_knowledge_caches()
+    try:
+        yield
+    finally:
+        snapshot._SNAPSHOT = base
+        _clear_knowledge_caches()
+
+
+def _write_source_images(directory: Path, count: int, rng: random.Random) -> List[Tuple[Path, bytes]]:
+    """Encode ``count`` photo-sized JPEGs once; each run rewrites them before cropping."""
+    sources = []
+    for i in range(count):
+        width, height = rng.choice([(4000, 3000), (3000, 4000), (5000, 2500), (2400, 1800)])
+        img = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+        path = directory / f"source-{i}.jpg"
+        img.save(path, quality=90)
+        sources.append((path, path.read_bytes()))
+    return sources
+
+
+# A benchmark builds its workload from (scale, rng, scratch dir) and returns (op count, run), where
+# run() processes the whole workload once and returns the seconds it spent doing so;
+# setup such as restoring files or swapping in a synthetic artist DB stays untimed
+Workload = Tuple[int, Callable[[], float]]
+
+
+def _timed_map(fn: Callable, items: List) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return time.perf_counter() - start
+
+
+def _kb_famous(db_size: Optional[int], count: int) -> Callable[[float, random.Random, Path], Workload]:
+    def setup(scale: float, rng: random.Random, workdir: Path) -> Workload:
+        names = candidate_names(max(1, int(count * scale)), rng)
+
+        def run() -> float:
+            with artist_db(db_size, random.Random(0)):
+                return _timed_map(is_artist_famous, names)
+
+        return len(names), run
+
+    return setup
+
+
+def _artists_famous(scale: float, rng: random.Random, workdir: Path) -> Workload:
+    names = candidate_names(max(1, int(100_000 * scale)), rng)
+    return len(names), lambda: _timed_map(is_famous_artist, names)
+
+
+def _smart_queries(scale: float, rng: random.Random, workdir: Path) -> Workload:
+    calls = [
+        (rng.sample(_TAG_WORDS, rng.randint(0, 3)), [rng.choice(_TYPES)], rng.randint(0, 1000))
+        for _ in range(max(1, int(1_000 * scale)))
+    ]
+
+    def run() -> float:
+        # A fresh DB per run, so the finders' lru_caches start cold each time
+        with artist_db(1_000, random.Random(0)):
+            return _timed_map(lambda call: build_smart_queries(call[0], call[1], seed=call[2]), calls)
+
+    return len(calls), run
+
+
+def _period_from_tags(scale: float, rng: random.Random, workdir: Path) -> Workload:
+    tag_lists = [rng.sample(_TAG_WORDS, rng.randint(1, 4)) for _ in range(max(1, int(100_000 * scale)))]
+    return len(tag_lists), lambda: _timed_map(extract_period_from_tags, tag_lists)
+
+
+def _type_keywords(scale: float, rng: random.Random, workdir: Path) -> Workload:
+    types = [rng.choice(_TYPES) for _ in range(max(1, int(100_000 * scale)))]
+    return len(types), lambda: _timed_map(get_type_keywords, types)
+
+
+def _safe_filename(scale: float, rng: random.Random, workdir: Path) -> Workload:
+    titles = [
+        f"{rng.choice(_TITLE_WORDS)} {rng.choice(_TITLE_WORDS)} {rng.randint(1, 999)}"
+        for _ in range(max(1, int(100_000 * scale)))
+    ]
+    # Every platform has the same implementation
+    return len(titles), lambda: _timed_map(ChicagoPlatform._safe_filename, titles)
+
+
+def _crop_to_aspect(scale: float, rng: random.Random, workdir: Path) -> Workload:
+    sources = _write_source_images(workdir, max(1, int(10 * scale)), rng)
+
+    def run() -> float:
+        elapsed = 0.0
+        for path, data in sources:
+            # Cropping replaces the file; restore the source outside the timed region
+            path.write_bytes(data)
+            start = time.perf_counter()
+            Harvester._crop_to_aspect(path, 16 / 9, (1920, 1080))
+            elapsed += time.perf_counter() - start
+        return elapsed
+
+    return len(sources), run
+
+
+BENCHMARKS: Dict[str, Callable[[float, random.Random, Path], Workload]] = {
+    "knowledge_base.is_artist_famous[snapshot]": _kb_famous(None, 100_000),
+    "knowledge_base.is_artist_famous[db=1000]": _kb_famous(1_000, 10_000),
+    "artists.is_famous_artist": _artists_famous,
+    "knowledge_base.build_smart_queries[db=1000]": _smart_queries,
+    "knowledge_base.extract_period_from_tags": _period_from_tags,
+    "types.get_type_keywords": _type_keywords,
+    "platform._safe_filename": _safe_filename,
+    "Harvester._crop_to_aspect[1920x1080]": _crop_to_aspect,
+}
+
+
+def run_microbenchmarks(
+    names: Optional[List[str]] = None, *, repeat: int = 5, scale: float = 1.0, seed: int = 0
+) -> List[MicroResult]:
+    """Run each benchmark ``repeat`` times on a workload of ``scale`` times its default size."""
+    results = []
+    for name in names or list(BENCHMARKS):
+        with tempfile.TemporaryDirectory(prefix="delacroix-micro-") as workdir:
+            ops, run = BENCHMARKS[name](scale, random.Random(seed), Path(workdir))
+            results.append(MicroResult(name=name, ops=ops, runs=[run() for _ in range(repeat)]))
+    return results
+
+
+def save_baseline(results: List[MicroResult], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": BASELINE_VERSION,
+        "python": sys.version.split()[0],
+        "machine": _platform.machine(),
+        "created": time.time(),
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> Dict[str, float]:
+    """Per-op microseconds by benchmark name from a saved baseline."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path} is not a version {BASELINE_VERSION} baseline")
+    return {name: result["per_op_us"] for name, result in data["results"].items()}
+
+
+def find_regressions(
+    results: List[MicroResult], baseline: Dict[str, float], threshold: float = DEFAULT_THRESHOLD
+) -> List[Regression]:
+    """Benchmarks whose per-op time grew by more than ``threshold`` percent over the baseline."""
+    regressions = []
+    for result in results:
+        before = baseline.get(result.name)
+        if before and result.per_op_us > before * (1 + threshold / 100):
+            regressions.append(Regression(result.name, before, result.per_op_us))
+    return regressions
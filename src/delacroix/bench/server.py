@@ -0,0 +1,427 @@
+"""Local HTTP server imitating every museum API the platforms talk to.
+
+Responses are synthetic but shaped like the real endpoints (Chicago search
+and detail, the Met search/objects, NGA open-data CSVs, Louvre sitemaps and
+object JSON, Rijksmuseum collection search), with JPEG images that vary in
+size and orientation. Files under ``fixtures_dir`` are served verbatim
+instead, so recorded responses can be replayed at the same paths.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from PIL import Image
+
+from ..cache import atomic_write_bytes, cache_dir
+from ..platforms.base import BasePlatform
+
+# Full-resolution sizes handed out to synthetic objects; includes portrait and square
+IMAGE_SIZES = [
+    (4000, 2600),
+    (3200, 2400),
+    (5600, 2400),
+    (2400, 3200),
+    (3000, 3000),
+    (1800, 1200),
+    (6000, 3375),
+]
+
+UNKNOWN_ARTISTS = ["Workshop of Antwerp", "Unknown French Painter", "Follower of Rubens", "Anonymous"]
+
+SEARCH_PAGE = 30
+
+# Paths served per platform, below the server's base URL
+PLATFORM_PATHS = {
+    "chicago": "/chicago/api/v1",
+    "met": "/met/public/collection/v1",
+    "nga": "/nga",
+    "louvre": "/louvre",
+    "rijksmuseum": "/rijks/api/en/collection",
+}
+
+
+@dataclass(frozen=True)
+class FakeObject:
+    id: int
+    title: str
+    artist: str
+    year: int
+    size: Tuple[int, int]
+    color: Tuple[int, int, int]
+
+
+def _objects(seed: int, count: int) -> List[FakeObject]:
+    from ..snapshot import load_snapshot
+
+    famous = [a["name"] for a in load_snapshot()["artists"]]
+    rng = random.Random(seed)
+    subjects = ["Landscape", "Harbor", "Still Life", "River View", "Portrait", "Garden", "Seascape", "Village"]
+    objects = []
+    for i in range(count):
+        artist = rng.choice(famous) if rng.random() < 0.5 else rng.choice(UNKNOWN_ARTISTS)
+        objects.append(FakeObject(
+            id=100000 + i,
+            title=f"{rng.choice(subjects)} {i}",
+            artist=artist,
+            year=rng.randint(1800, 1899),
+            size=rng.choice(IMAGE_SIZES),
+            color=(rng.randrange(256), rng.randrange(256), rng.randrange(256)),
+        ))
+    return objects
+
+
+def _render_jpeg(size: Tuple[int, int], color: Tuple[int, int, int], seed: int) -> bytes:
+    """A smooth, painting-like JPEG: coloured gradients with coarse low-frequency noise."""
+    width, height = size
+    small = (max(1, width // 16), max(1, height // 16))
+    gradient = Image.linear_gradient("L").resize(small)
+    noise = Image.effect_noise(small, 48)
+    tint = Image.new("L", small, color[2])
+    rgb = Image.merge("RGB", (
+        Image.blend(gradient, Image.new("L", small, color[0]), 0.5),
+        Image.blend(noise, Image.new("L", small, color[1]), 0.5),
+        tint.rotate(seed % 360),
+    ))
+    buffer = io.BytesIO()
+    rgb.resize(size, Image.Resampling.BICUBIC).save(buffer, format="JPEG", quality=88)
+    return buffer.getvalue()
+
+
+def _iiif_size(spec: str, size: Tuple[int, int]) -> Tuple[int, int]:
+    """Resolve an IIIF size parameter (``max``, ``w,``, ``!w,h``) against the full size."""
+    width, height = size
+    if spec in ("max", "full"):
+        return size
+    best_fit = spec.startswith("!")
+    w, _, h = spec.lstrip("!").partition(",")
+    scale = 1.0
+    if w and h and best_fit:
+        scale = min(int(w) / width, int(h) / height)
+    elif w:
+        scale = int(w) / width
+    elif h:
+        scale = int(h) / height
+    scale = min(scale, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+class EndpointStats:
+    """Thread-safe per-endpoint request durations and response sizes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = {}
+        self.bytes: Dict[str, int] = {}
+
+    def add(self, endpoint: str, seconds: float, size: int) -> None:
+        with self._lock:
+            self.durations.setdefault(endpoint, []).append(seconds)
+            self.bytes[endpoint] = self.bytes.get(endpoint, 0) + size
+
+    @property
+    def requests(self) -> int:
+        with self._lock:
+            return sum(len(d) for d in self.durations.values())
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(self.bytes.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self.durations.clear()
+            self.bytes.clear()
+
+
+class FakeMuseum:
+    """Serves every platform's API from one local port with configurable latency and bandwidth."""
+
+    def __init__(
+        self,
+        *,
+        seed: int = 0,
+        objects: int = 300,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        fixtures_dir: Optional[Path] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.seed = seed
+        self.objects = _objects(seed, objects)
+        self.by_id = {o.id: o for o in self.objects}
+        # Seconds added before each response, and bytes/second per connection
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.fixtures_dir = fixtures_dir
+        self.stats = EndpointStats()
+        # Generated images persist across runs, so only the first run pays for encoding
+        self.image_cache_dir = cache_dir() / "bench" / "images"
+        self.generate_times: List[float] = []
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeMuseum":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-museum", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeMuseum":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def configure(self, platform: BasePlatform) -> BasePlatform:
+        """Point a platform instance at this server."""
+        platform.base_url = self.base_url + PLATFORM_PATHS[platform.name]
+        if platform.name == "chicago":
+            platform.iiif_url = f"{self.base_url}/chicago/iiif"
+        return platform
+
+    # Response builders, keyed by path; each returns (endpoint, content type, body)
+
+    def _search_ids(self, query: str, limit: int) -> List[int]:
+        digest = int(hashlib.sha1(query.lower().encode("utf-8")).hexdigest(), 16)
+        rng = random.Random(self.seed ^ digest)
+        return [o.id for o in rng.sample(self.objects, min(limit, len(self.objects)))]
+
+    def _object(self, raw_id: str) -> Optional[FakeObject]:
+        digits = "".join(ch for ch in raw_id if ch.isdigit())
+        return self.by_id.get(int(digits)) if digits else None
+
+    def _image(self, obj: FakeObject, size_spec: str = "max") -> bytes:
+        width, height = _iiif_size(size_spec, obj.size)
+        path = self.image_cache_dir / f"{self.seed}-{obj.id}-{width}x{height}.jpg"
+        try:
+            return path.read_bytes()
+        except OSError:
+            pass
+        start = time.perf_counter()
+        data = _render_jpeg((width, height), obj.color, obj.id)
+        self.generate_times.append(time.perf_counter() - start)
+        try:
+            atomic_write_bytes(path, data)
+        except OSError:
+            pass
+        return data
+
+    def respond(self, path: str, query: Dict[str, List[str]]) -> Optional[Tuple[str, str, bytes]]:
+        base = self.base_url
+        parts = [unquote(p) for p in path.strip("/").split("/")]
+        q = (query.get("q") or [""])[0]
+
+        if parts[:4] == ["chicago", "api", "v1", "artworks"] and len(parts) == 5:
+            if parts[4] == "search":
+                limit = int((query.get("limit") or [SEARCH_PAGE])[0])
+                ids = self._search_ids(q, limit)
+                return "search", "application/json", json.dumps({"data": [{"id": i} for i in ids]}).encode()
+            obj = self._object(parts[4])
+            if obj is None:
+                return None
+            data = {
+                "id": obj.id,
+                "title": obj.title,
+                "artist_display": f"{obj.artist}\nFrench, 1840-1926",
+                "date_display": str(obj.year),
+                "place_of_origin": "France",
+                "image_id": f"img-{obj.id}",
+                "artwork_type_title": "Painting",
+                "classification_title": "oil on canvas",
+                "medium_display": "Oil on canvas",
+                "is_public_domain": True,
+            }
+            body = {"data": data, "config": {"iiif_url": f"{base}/chicago/iiif"}}
+            return "metadata", "application/json", json.dumps(body).encode()
+        if parts[:2] == ["chicago", "iiif"] and len(parts) >= 4:
+            obj = self._object(parts[2])
+            if obj is None:
+                return None
+            return "image", "image/jpeg", self._image(obj, parts[4] if len(parts) > 4 else "max")
+
+        if parts[:5] == ["met", "public", "collection", "v1", "search"]:
+            ids = self._search_ids(q, 80)
+            return "search", "application/json", json.dumps({"total": len(ids), "objectIDs": ids}).encode()
+        if parts[:5] == ["met", "public", "collection", "v1", "objects"] and len(parts) == 6:
+            obj = self._object(parts[5])
+            if obj is None:
+                return None
+            body = {
+                "objectID": obj.id,
+                "isPublicDomain": True,
+                "title": obj.title,
+                "artistDisplayName": obj.artist,
+                "artistNationality": "French",
+                "objectDate": str(obj.year),
+                "culture": "European",
+                "classification": "Paintings",
+                "objectName": "Painting",
+                "medium": "Oil on canvas",
+                "primaryImage": f"{base}/met/images/{obj.id}.jpg",
+                "primaryImageSmall": f"{base}/met/images/small/{obj.id}.jpg",
+                "objectURL": f"{base}/met/art/collection/search/{obj.id}",
+            }
+            return "metadata", "application/json", json.dumps(body).encode()
+        if parts[:2] == ["met", "images"]:
+            obj = self._object(parts[-1])
+            if obj is None:
+                return None
+            return "image", "image/jpeg", self._image(obj, "!400,400" if parts[2] == "small" else "max")
+
+        if parts == ["nga", "published_images.csv"]:
+            rows = [{
+                "depictstmsobjectid": o.id,
+                "viewtype": "primary",
+                "iiifurl": f"{base}/nga/iiif/{o.id}",
+                "width": o.size[0],
+                "height": o.size[1],
+                "maxpixels": max(o.size),
+            } for o in self.objects]
+            return "listing", "text/csv", self._csv(rows)
+        if parts == ["nga", "objects.csv"]:
+            rows = [{
+                "objectid": o.id,
+                "title": o.title,
+                "attribution": o.artist,
+                "displaydate": str(o.year),
+                "classification": "Painting",
+                "medium": "oil on canvas",
+            } for o in self.objects]
+            return "listing", "text/csv", self._csv(rows)
+        if parts[:2] == ["nga", "iiif"] and len(parts) >= 4:
+            obj = self._object(parts[2])
+            if obj is None:
+                return None
+            return "image", "image/jpeg", self._image(obj, parts[4] if len(parts) > 4 else "max")
+
+        if parts == ["louvre", "sitemap.xml"]:
+            pages = (len(self.objects) + 99) // 100
+            locs = "".join(f"<sitemap><loc>{base}/louvre/sitemap-{n}.xml</loc></sitemap>" for n in range(pages))
+            xml = f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{locs}</sitemapindex>'
+            return "listing", "application/xml", xml.encode()
+        if len(parts) == 2 and parts[0] == "louvre" and parts[1].startswith("sitemap-"):
+            page = int(parts[1][len("sitemap-"):-len(".xml")])
+            locs = "".join(
+                f"<url><loc>{base}/louvre/ark:/53355/cl{o.id}</loc></url>"
+                for o in self.objects[page * 100:(page + 1) * 100]
+            )
+            xml = f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{locs}</urlset>'
+            return "listing", "application/xml", xml.encode()
+        if parts[:2] == ["louvre", "ark:"] and parts[-1].endswith(".json"):
+            obj = self._object(parts[-1])
+            if obj is None:
+                return None
+            body = {
+                "arkId": f"ark:/53355/cl{obj.id}",
+                "url": f"{base}/louvre/ark:/53355/cl{obj.id}",
+                "title": obj.title,
+                "objectType": "Peinture",
+                "category": "Painting",
+                "creator": [{"label": obj.artist}],
+                "image": [{"urlImage": f"{base}/louvre/images/{obj.id}.jpg", "copyright": "Domaine public"}],
+            }
+            return "metadata", "application/json", json.dumps(body).encode()
+        if parts[:2] == ["louvre", "images"]:
+            obj = self._object(parts[-1])
+            return ("image", "image/jpeg", self._image(obj)) if obj else None
+
+        if parts == ["rijks", "api", "en", "collection"]:
+            art_objects = []
+            for object_id in self._search_ids(q, 100):
+                obj = self.by_id[object_id]
+                art_objects.append({
+                    "objectNumber": f"SK-A-{obj.id}",
+                    "title": obj.title,
+                    "principalOrFirstMaker": obj.artist,
+                    "webImage": {"url": f"{base}/rijks/images/{obj.id}.jpg"},
+                    "dating": {"presentingDate": str(obj.year)},
+                    "objectTypes": ["painting"],
+                    "links": {"web": f"{base}/rijks/collection/SK-A-{obj.id}"},
+                })
+            return "search", "application/json", json.dumps({"artObjects": art_objects}).encode()
+        if parts[:2] == ["rijks", "images"]:
+            obj = self._object(parts[-1])
+            return ("image", "image/jpeg", self._image(obj)) if obj else None
+        return None
+
+    @staticmethod
+    def _csv(rows: List[Dict[str, object]]) -> bytes:
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+        return out.getvalue().encode("utf-8")
+
+    def _fixture(self, path: str) -> Optional[bytes]:
+        if self.fixtures_dir is None:
+            return None
+        candidate = (self.fixtures_dir / unquote(path).lstrip("/")).resolve()
+        if self.fixtures_dir.resolve() not in candidate.parents or not candidate.is_file():
+            return None
+        return candidate.read_bytes()
+
+    def _handler_class(self):
+        museum = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                start = time.perf_counter()
+                url = urlsplit(self.path)
+                fixture = museum._fixture(url.path)
+                if fixture is not None:
+                    endpoint, content_type, body = "fixture", "application/octet-stream", fixture
+                else:
+                    response = museum.respond(url.path, parse_qs(url.query))
+                    if response is None:
+                        endpoint, content_type, body = "not_found", "text/plain", b"not found"
+                    else:
+                        endpoint, content_type, body = response
+                if museum.latency:
+                    time.sleep(museum.latency)
+                self.send_response(404 if endpoint == "not_found" else 200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self._write_throttled(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                museum.stats.add(endpoint, time.perf_counter() - start, len(body))
+
+            def _write_throttled(self, body: bytes) -> None:
+                chunk_size = 64 * 1024
+                for offset in range(0, len(body), chunk_size):
+                    chunk = body[offset:offset + chunk_size]
+                    self.wfile.write(chunk)
+                    if museum.bandwidth:
+                        time.sleep(len(chunk) / museum.bandwidth)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
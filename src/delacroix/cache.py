@@ -0,0 +1,94 @@
+"""Local cache directory helpers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def cache_dir() -> Path:
+    """Return the directory used for Delacroix's local caches and stores."""
+    override = os.environ.get("DELACROIX_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base).expanduser() / "delacroix"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a temp file next to ``path`` and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@dataclass
+class CachedSearch:
+    ids: List[Any]
+    fetched_at: float
+    cursor: int = 0
+
+
+class SearchCache:
+    """On-disk cache of search result ID lists with a TTL and a per-search read cursor.
+
+    The cursor records how far previous runs got through the ID list, so later
+    runs can continue from there instead of re-examining the first results.
+    """
+
+    def __init__(self, directory: Path, *, ttl: float = 24 * 3600) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: Dict[str, Any]) -> Path:
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _read(self, key: Dict[str, Any]) -> Optional[CachedSearch]:
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return CachedSearch(ids=data["ids"], fetched_at=data["fetched_at"], cursor=data.get("cursor", 0))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write(self, key: Dict[str, Any], entry: CachedSearch) -> None:
+        data = {"key": key, "fetched_at": entry.fetched_at, "cursor": entry.cursor, "ids": entry.ids}
+        try:
+            atomic_write_bytes(self._path(key), json.dumps(data, separators=(",", ":"), default=str).encode("utf-8"))
+        except OSError:
+            pass
+
+    def get(self, key: Dict[str, Any]) -> Optional[CachedSearch]:
+        """Return the cached search, or None if it is missing or older than the TTL."""
+        entry = self._read(key)
+        if entry is None or time.time() - entry.fetched_at > self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key: Dict[str, Any], ids: List[Any]) -> CachedSearch:
+        """Store fresh results, keeping the cursor of any previous (expired) entry."""
+        previous = self._read(key)
+        cursor = previous.cursor if previous is not None else 0
+        entry = CachedSearch(ids=list(ids), fetched_at=time.time(), cursor=cursor if cursor < len(ids) else 0)
+        self._write(key, entry)
+        return entry
+
+    def set_cursor(self, key: Dict[str, Any], entry: CachedSearch, cursor: int) -> None:
+        entry.cursor = cursor % len(entry.ids) if entry.ids else 0
+        self._write(key, entry)
@@ -0,0 +1,291 @@
+"""Local catalog of every artwork discovered, kept or not, with full-text search."""
+
+from __future__ import annotations
+
+import random
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .cache import cache_dir
+from .knowledge_base import DEFAULT_SEED, artists_for_tags, is_artist_famous
+from .platforms.base import Artwork
+from .types import compile_filter
+
+# seen: discovered but not (yet) processed; rejected: discovered but not matching
+# that run's types/tags; the others mirror harvest outcomes
+CATALOG_STATUSES = ("seen", "rejected", "kept", "skipped", "failed")
+
+# Recorded by discovery; they never replace an outcome recorded earlier
+DISCOVERY_STATUSES = ("seen", "rejected")
+
+DEFAULT_BATCH_SIZE = 64
+
+# Outcomes that rule an artwork out of offline discovery: already in a library, or
+# rejected for a reason that won't change (failed downloads are retried)
+OFFLINE_EXCLUDED_STATUSES = ("kept", "skipped")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artworks (
+    rowid INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT,
+    artist TEXT,
+    date TEXT,
+    culture TEXT,
+    classification TEXT,
+    query TEXT,
+    image_url TEXT,
+    thumbnail_url TEXT,
+    source_url TEXT,
+    license TEXT,
+    width INTEGER,
+    height INTEGER,
+    status TEXT NOT NULL,
+    reason TEXT,
+    times_seen INTEGER NOT NULL DEFAULT 0,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    UNIQUE (platform, id)
+);
+CREATE INDEX IF NOT EXISTS artworks_status ON artworks (platform, status);
+CREATE VIRTUAL TABLE IF NOT EXISTS artworks_fts USING fts5(
+    title, artist, culture, classification, content='artworks', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS artworks_ai AFTER INSERT ON artworks BEGIN
+    INSERT INTO artworks_fts (rowid, title, artist, culture, classification)
+    VALUES (new.rowid, new.title, new.artist, new.culture, new.classification);
+END;
+CREATE TRIGGER IF NOT EXISTS artworks_ad AFTER DELETE ON artworks BEGIN
+    INSERT INTO artworks_fts (artworks_fts, rowid, title, artist, culture, classification)
+    VALUES ('delete', old.rowid, old.title, old.artist, old.culture, old.classification);
+END;
+CREATE TRIGGER IF NOT EXISTS artworks_au AFTER UPDATE OF title, artist, culture, classification ON artworks BEGIN
+    INSERT INTO artworks_fts (artworks_fts, rowid, title, artist, culture, classification)
+    VALUES ('delete', old.rowid, old.title, old.artist, old.culture, old.classification);
+    INSERT INTO artworks_fts (rowid, title, artist, culture, classification)
+    VALUES (new.rowid, new.title, new.artist, new.culture, new.classification);
+END;
+"""
+
+_ARTWORK_COLUMNS = (
+    "id", "title", "artist", "date", "culture", "classification", "query",
+    "image_url", "thumbnail_url", "source_url", "license",
+)
+
+_COLUMNS = ("platform", *_ARTWORK_COLUMNS, "width", "height", "status", "reason", "times_seen", "first_seen", "last_seen")
+
+# A rediscovery refreshes metadata but keeps the artwork's last outcome
+_KEEP_OUTCOME = (
+    f"excluded.status IN ({', '.join(repr(s) for s in DISCOVERY_STATUSES)}) "
+    f"AND status NOT IN ({', '.join(repr(s) for s in DISCOVERY_STATUSES)})"
+)
+_UPSERT = f"""
+INSERT INTO artworks ({", ".join(_COLUMNS)}) VALUES ({", ".join("?" for _ in _COLUMNS)})
+ON CONFLICT (platform, id) DO UPDATE SET
+    {", ".join(f"{c} = COALESCE(excluded.{c}, {c})" for c in _ARTWORK_COLUMNS[1:])},
+    width = COALESCE(excluded.width, width),
+    height = COALESCE(excluded.height, height),
+    status = CASE WHEN {_KEEP_OUTCOME} THEN status ELSE excluded.status END,
+    reason = CASE WHEN {_KEEP_OUTCOME} THEN reason ELSE excluded.reason END,
+    times_seen = times_seen + excluded.times_seen,
+    last_seen = excluded.last_seen
+"""
+
+
+def catalog_path() -> Path:
+    """Location of the catalog in the local cache directory."""
+    return cache_dir() / "catalog.sqlite"
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix."""
+    words = re.findall(r"\w+", text, flags=re.UNICODE)
+    if not words:
+        return ""
+    terms = [f'"{w}"' for w in words[:-1]] + [f'"{words[-1]}"*']
+    return " ".join(terms)
+
+
+class Catalog:
+    """SQLite catalog keyed by (platform, id); records are buffered and written in batches."""
+
+    def __init__(self, path: Optional[Path] = None, *, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.path = path or catalog_path()
+        self.batch_size = max(1, batch_size)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple[Any, ...]] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Several harvests may share the catalog; wait for each other's batches
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def record(
+        self,
+        platform: str,
+        artwork: Artwork,
+        status: str = "seen",
+        *,
+        reason: Optional[str] = None,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """Add or update an artwork; ``status`` is one of ``CATALOG_STATUSES``."""
+        if status not in CATALOG_STATUSES:
+            raise ValueError(f"status must be one of: {', '.join(CATALOG_STATUSES)}")
+        now = time.time()
+        width, height = size or (None, None)
+        self._pending.append((
+            platform,
+            *(getattr(artwork, c) for c in _ARTWORK_COLUMNS),
+            width,
+            height,
+            status,
+            reason,
+            int(status in DISCOVERY_STATUSES),
+            now,
+            now,
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        conn = self._connect()
+        with conn:
+            conn.executemany(_UPSERT, self._pending)
+        self._pending = []
+
+    def search(
+        self,
+        text: str = "",
+        *,
+        platform: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = 20,
+    ) -> List[Dict[str, Any]]:
+        """Artworks matching ``text`` in title, artist, culture or classification, best first."""
+        self.flush()
+        if not self.path.exists():
+            return []
+        match = fts_query(text)
+        if match:
+            sql = (
+                "SELECT artworks.* FROM artworks_fts JOIN artworks ON artworks.rowid = artworks_fts.rowid "
+                "WHERE artworks_fts MATCH ?"
+            )
+            params: List[Any] = [match]
+        else:
+            sql = "SELECT * FROM artworks WHERE 1=1"
+            params = []
+        if platform:
+            sql += " AND artworks.platform = ?"
+            params.append(platform)
+        if status:
+            sql += " AND artworks.status = ?"
+            params.append(status)
+        sql += " ORDER BY bm25(artworks_fts)" if match else " ORDER BY last_seen DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._connect().execute(sql, params)]
+
+    def candidates(
+        self,
+        platform: str,
+        *,
+        tags: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+        target_size: Optional[Tuple[int, int]] = None,
+        seed: int = DEFAULT_SEED,
+        exclude: Sequence[str] = OFFLINE_EXCLUDED_STATUSES,
+    ) -> Iterator[Artwork]:
+        """Catalogued artworks for offline discovery, filtered and best first.
+
+        ``types`` and ``tags`` filter like online discovery; an artwork also matches the
+        tags if it was found by searching for an artist the tags imply. Famous artists
+        come first, then artworks known to be landscape and at least ``target_size``,
+        then ones of unknown size, then smaller ones; known portrait images are dropped.
+        Ties are broken in a seeded random order.
+        """
+        self.flush()
+        if not self.path.exists():
+            return
+        sql = "SELECT * FROM artworks WHERE platform = ? AND image_url IS NOT NULL"
+        params: List[Any] = [platform]
+        if exclude:
+            sql += f" AND status NOT IN ({', '.join('?' for _ in exclude)})"
+            params.extend(exclude)
+        rows = [
+            dict(row)
+            for row in self._connect().execute(sql, params)
+            if not (row["width"] and row["height"] and row["width"] < row["height"])
+        ]
+
+        matches = compile_filter(types, tags).matches_many(rows)
+        if tags:
+            # Online discovery searches for the tags' artists; honor that here too
+            tag_artists = artists_for_tags(tags)
+            type_matches = compile_filter(types).matches_many(rows)
+            matches = [
+                matched or (type_ok and (row["query"] or row["artist"] or "").lower() in tag_artists)
+                for row, matched, type_ok in zip(rows, matches, type_matches)
+            ]
+        rows = [row for row, matched in zip(rows, matches) if matched]
+
+        famous: Dict[str, bool] = {}
+
+        def rank(row: Dict[str, Any]) -> Tuple[bool, int, int]:
+            artist = row["artist"] or ""
+            if artist not in famous:
+                famous[artist] = is_artist_famous(artist)
+            width, height = row["width"], row["height"]
+            if not width:
+                size_tier = 1
+            elif target_size is None or (width >= target_size[0] and height >= target_size[1]):
+                size_tier = 0
+            else:
+                size_tier = 2
+            return (not famous[artist], size_tier, -(width or 0) * (height or 0))
+
+        random.Random(seed).shuffle(rows)
+        rows.sort(key=rank)
+        for row in rows:
+            yield Artwork(**{c: row[c] for c in _ARTWORK_COLUMNS})
+
+    def count(self, *, platform: Optional[str] = None) -> Dict[str, int]:
+        """Number of artworks per status."""
+        self.flush()
+        if not self.path.exists():
+            return {}
+        sql = "SELECT status, COUNT(*) FROM artworks"
+        params: List[Any] = []
+        if platform:
+            sql += " WHERE platform = ?"
+            params.append(platform)
+        return dict(self._connect().execute(sql + " GROUP BY status", params).fetchall())
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
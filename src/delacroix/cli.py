@@ -1,13 +1,53 @@
 from __future__ import annotations
 
 import argparse
+import json
+import signal
+import subprocess
+import sys
+import time
 from pathlib import Path
 
+from .cache import SearchCache, cache_dir
+from .catalog import CATALOG_STATUSES, Catalog
 from .core import Harvester
+from .daemon import EVICTION_POLICIES
+from .events import EventBus, JsonlSink, PrettyRenderer, PrometheusTextfile
+from .knowledge_base import DEFAULT_SEED
+from .library import FSYNC_POLICIES, MANIFEST_FORMATS, find_manifest
+from .planner import build_query_plan
+from .profiling import DEFAULT_SAMPLE_INTERVAL, PROFILE_MODES, profiled
+from .render import (
+    ENCODE_PROFILES,
+    FRAME_TV_4K,
+    RESAMPLE_FILTERS,
+    RESOLUTION_PRESETS,
+    available_formats,
+    parse_aspect_ratios,
+    parse_resolution,
+)
 from .platforms.registry import PLATFORM_REGISTRY, get_platform
+from .snapshot import snapshot_path, write_snapshot
+from .stats import QueryStatsStore
+from .tracing import NULL_TRACER, Tracer
+from .triage import TriageOptions
 from .types import list_available_types
 
 
+def _resolution(value: str):
+    try:
+        return parse_resolution(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _aspect_ratios(value: str):
+    try:
+        return parse_aspect_ratios(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
 def _list_platforms() -> None:
     for name in sorted(PLATFORM_REGISTRY):
         print(name)
@@ -26,19 +66,353 @@ def _list_types(args: argparse.Namespace) -> None:
         print(f"  - {t}")
 
 
+def _build_snapshot(args: argparse.Namespace) -> None:
+    path = Path(args.path) if args.path else snapshot_path()
+    snapshot = write_snapshot(path)
+    print(
+        f"Snapshot v{snapshot['version']} written to {path} "
+        f"artists={len(snapshot['artists'])} movements={len(snapshot['movements'])} "
+        f"paintings={len(snapshot['paintings'])}"
+    )
+
+
+def _query_stats(args: argparse.Namespace):
+    """The query stats store ``plan`` and ``harvest`` rank queries by, unless ``--no-query-stats``."""
+    return None if args.no_query_stats else QueryStatsStore()
+
+
+def _plan(args: argparse.Namespace) -> None:
+    platform = get_platform(args.platform, seed=args.seed, stats=_query_stats(args)) if args.platform else None
+    tags = args.tags.split(",") if args.tags else None
+    types = args.types.split(",") if args.types else None
+    plan = build_query_plan(tags, types, seed=args.seed, platform=platform)
+    if args.json:
+        print(json.dumps(plan.to_dict(), indent=2, ensure_ascii=False))
+        return
+    print(f"Query plan (seed={plan.seed}):")
+    for q in plan.queries:
+        print(f"  {q.rank:2d}. {q.query} [{q.source}]")
+    if not plan.platform and not args.no_query_stats:
+        print("Seeded order; harvest also ranks queries by the platform's yield statistics (see --platform)")
+    if plan.platform:
+        print(f"Requests for {plan.platform}:")
+        for url in plan.requests:
+            print(f"  {url}")
+
+
+def _build_harvester(args: argparse.Namespace):
+    """Harvester configured from ``harvest`` arguments, with its tracer and event bus."""
+    if args.offline_discovery and args.no_catalog:
+        raise SystemExit("--offline-discovery reads the catalog; it can't be combined with --no-catalog")
+    stats = _query_stats(args)
+    search_cache = None
+    if args.search_cache_ttl > 0:
+        search_cache = SearchCache(cache_dir() / "search" / args.platform, ttl=args.search_cache_ttl * 3600)
+    tracer = Tracer() if args.trace else NULL_TRACER
+    events = _event_bus(args)
+    platform = get_platform(
+        args.platform,
+        seed=args.seed,
+        stats=stats,
+        search_cache=search_cache,
+        max_download_bytes=int(args.max_download_mb * 1024 * 1024) or None,
+        tracer=tracer,
+        events=events,
+    )
+    harvester = Harvester(
+        platform,
+        aspect_ratio=args.aspect_ratio,
+        target_size=args.resolution,
+        resample=args.resample,
+        workers=args.workers,
+        output_format=args.format,
+        encode_profile=args.encode_profile,
+        triage=TriageOptions() if args.triage else None,
+        sidecars=args.sidecars,
+        manifest=None if args.manifest == "none" else args.manifest,
+        fsync=args.fsync,
+        catalog=None if args.no_catalog else Catalog(Path(args.catalog) if args.catalog else None),
+        offline_discovery=args.offline_discovery,
+    )
+    return harvester, tracer, events
+
+
 def _harvest(args: argparse.Namespace) -> None:
-    platform = get_platform(args.platform)
-    harvester = Harvester(platform, aspect_ratio=args.aspect_ratio)
+    if args.queue:
+        _coordinate(args)
+        return
+    harvester, tracer, events = _build_harvester(args)
     tags = args.tags.split(",") if args.tags else None
     types = args.types.split(",") if args.types else None
-    result = harvester.harvest(Path(args.out), max_items=args.max, tags=tags, types=types)
+    profile_path = Path(args.profile) if args.profile else None
+    try:
+        with profiled(profile_path, args.profile_mode, interval=args.profile_interval):
+            result = harvester.harvest(Path(args.out), max_items=args.max, tags=tags, types=types)
+    finally:
+        events.close()
+        if harvester.catalog is not None:
+            harvester.catalog.close()
+    if args.trace:
+        tracer.write(Path(args.trace))
+    if args.events == "-":
+        # stdout carries only the event stream; the result is in harvest_finished
+        return
+    if args.stats == "json":
+        print(json.dumps(result.to_dict(), indent=2))
+        return
     print(
         f"Platform={result.platform} downloaded={result.downloaded} "
         f"skipped_vertical={result.skipped_vertical} "
-        f"skipped_missing_image={result.skipped_missing_image} failed={result.failed}"
+        f"skipped_missing_image={result.skipped_missing_image} failed={result.failed} "
+        f"skipped_triage={result.skipped_triage} bytes_written={result.bytes_written}"
+    )
+    if args.stats == "text":
+        _print_harvest_stats(result)
+
+
+def _coordinate(args: argparse.Namespace) -> None:
+    """Discover candidates into a shared work queue for ``delacroix worker`` processes."""
+    from .workqueue import WorkQueue, enqueue_candidates
+
+    if args.shards < 1:
+        raise SystemExit("--shards must be >= 1")
+    queue = WorkQueue(Path(args.queue))
+    config = {key: value for key, value in vars(args).items() if key != "func"}
+    queue.initialize(shards=args.shards, max_items=args.max, config=config)
+    workers = []
+    local_workers = args.shards if args.local_workers is None else args.local_workers
+    for shard in range(local_workers):
+        command = [sys.executable, "-m", "delacroix.cli", "worker", "--queue", args.queue, "--shard", str(shard)]
+        workers.append(subprocess.Popen(command))
+
+    harvester, _, events = _build_harvester(args)
+    tags = args.tags.split(",") if args.tags else None
+    types = args.types.split(",") if args.types else None
+    try:
+        queued = enqueue_candidates(queue, harvester.platform.name, harvester.discover(tags, types))
+        for worker in workers:
+            worker.wait()
+        while not queue.status().finished:
+            time.sleep(1)
+    finally:
+        events.close()
+        if harvester.catalog is not None:
+            harvester.catalog.close()
+    status = queue.status()
+    queue.close()
+    print(
+        f"Queue={args.queue} queued={queued} kept={status.kept} skipped={status.skipped} "
+        f"failed={status.failed} pending={status.pending}"
+    )
+
+
+def _worker(args: argparse.Namespace) -> None:
+    from .workqueue import WorkQueue, run_worker
+
+    queue = WorkQueue(Path(args.queue))
+    config = queue.meta("config")
+    if config is None:
+        raise SystemExit(f"{args.queue} has no harvest configured; start a coordinator with harvest --queue")
+    harvest_args = argparse.Namespace(**config)
+    # JSON turned tuples into lists
+    harvest_args.aspect_ratio = tuple(harvest_args.aspect_ratio)
+    harvest_args.resolution = tuple(harvest_args.resolution) if harvest_args.resolution else None
+    harvest_args.out = args.out or harvest_args.out
+    # Outputs that can't be shared between processes are per worker, if asked for
+    harvest_args.quiet = args.quiet
+    harvest_args.events = args.events
+    harvest_args.metrics_file = args.metrics_file
+    harvest_args.trace = None
+    harvest_args.profile = None
+
+    harvester, _, events = _build_harvester(harvest_args)
+    tags = harvest_args.tags.split(",") if harvest_args.tags else None
+    types = harvest_args.types.split(",") if harvest_args.types else None
+    try:
+        results = run_worker(harvester, queue, args.shard, Path(harvest_args.out), tags=tags, types=types)
+    finally:
+        events.close()
+        if harvester.catalog is not None:
+            harvester.catalog.close()
+        queue.close()
+    print(
+        f"Worker shard={args.shard} downloaded={sum(r.downloaded for r in results)} "
+        f"failed={sum(r.failed for r in results)} bytes_written={sum(r.bytes_written for r in results)}"
     )
 
 
+def _daemon(args: argparse.Namespace) -> None:
+    from .daemon import LibraryDaemon
+
+    if args.manifest == "none":
+        raise SystemExit("The daemon tracks the library in its manifest; it can't run with --manifest none")
+    harvester, _, events = _build_harvester(args)
+    daemon = LibraryDaemon(
+        harvester,
+        Path(args.out),
+        target_count=args.count,
+        max_bytes=int(args.max_mb * 1024 * 1024) or None,
+        refresh_fraction=args.refresh,
+        eviction=args.eviction,
+        tags=args.tags.split(",") if args.tags else None,
+        types=args.types.split(",") if args.types else None,
+    )
+    # Service managers stop us with SIGTERM; unwind like Ctrl-C so in-flight work is cleaned up
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        daemon.run(interval=args.interval_hours * 3600, cycles=args.cycles)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        events.close()
+        if harvester.catalog is not None:
+            harvester.catalog.close()
+
+
+def _displayed(args: argparse.Namespace) -> None:
+    library_dir = Path(args.dir)
+    manifest = find_manifest(library_dir)
+    if manifest is None:
+        raise SystemExit(f"No library manifest in {library_dir}")
+    try:
+        keys_by_path = {
+            (library_dir / f["path"]).resolve(): (record["platform"], record["id"])
+            for record in manifest.records()
+            for f in record["files"]
+        }
+        keys = []
+        for name in args.files:
+            key = keys_by_path.get(Path(name).resolve()) or keys_by_path.get((library_dir / name).resolve())
+            if key is None:
+                print(f"Not in the library: {name}", file=sys.stderr)
+            else:
+                keys.append(key)
+        marked = manifest.mark_displayed(keys) if keys else 0
+    finally:
+        manifest.close()
+    print(f"Marked {marked} artworks displayed")
+
+
+def _event_bus(args: argparse.Namespace) -> EventBus:
+    sinks = []
+    # Keep stdout parseable when it carries the JSON Lines stream
+    if not args.quiet and args.events != "-":
+        sinks.append(PrettyRenderer())
+    if args.events:
+        sinks.append(JsonlSink(sys.stdout if args.events == "-" else args.events))
+    if args.metrics_file:
+        sinks.append(PrometheusTextfile(args.metrics_file))
+    return EventBus(sinks)
+
+
+def _print_harvest_stats(result) -> None:
+    print(f"Wall time {result.wall_seconds:.2f}s, downloaded {result.bytes_downloaded} bytes, kept {result.bytes_written}")
+    for stage, seconds in result.stage_seconds.items():
+        print(f"  {stage:<12} {seconds:8.2f}s")
+    for host, stats in result.http.items():
+        status = " ".join(f"{code}={n}" for code, n in sorted(stats["status"].items()))
+        print(f"  {host}: {stats['requests']} requests, {stats['bytes']} bytes, errors={stats['errors']} {status}")
+    for name, cache in result.caches.items():
+        print(f"  {name} cache: {cache['hits']} hits, {cache['misses']} misses ({cache['hit_ratio']:.0%})")
+
+
+def _library(args: argparse.Namespace) -> None:
+    library_dir = Path(args.dir)
+    manifest = find_manifest(library_dir)
+    if manifest is None:
+        print(f"No library manifest in {library_dir}")
+        return
+    try:
+        records = manifest.query(platform=args.platform, text=args.search, limit=args.limit)
+    finally:
+        manifest.close()
+    if args.count:
+        print(len(records))
+        return
+    if args.json:
+        for record in records:
+            print(json.dumps(record, ensure_ascii=False))
+        return
+    for record in records:
+        files = ", ".join(f["path"] for f in record["files"])
+        print(f"{record['platform']:<11} {record['artist'][:30]:<30} {record['title'][:50]:<50} {files}")
+    print(f"{len(records)} artworks, {sum(r['bytes'] for r in records)} bytes")
+
+
+def _search(args: argparse.Namespace) -> None:
+    with Catalog(Path(args.catalog) if args.catalog else None) as catalog:
+        results = catalog.search(args.query, platform=args.platform, status=args.status, limit=args.limit)
+    if args.json:
+        for record in results:
+            print(json.dumps(record, ensure_ascii=False))
+        return
+    for record in results:
+        size = f"{record['width']}x{record['height']}" if record["width"] else "?"
+        outcome = record["status"] + (f" ({record['reason']})" if record["reason"] else "")
+        print(
+            f"{record['platform']:<11} {(record['artist'] or '')[:30]:<30} {(record['title'] or '')[:50]:<50} "
+            f"{size:>11} {outcome}"
+        )
+    print(f"{len(results)} artworks")
+
+
+def _bench_harvest(args: argparse.Namespace) -> None:
+    from .bench import run_harvest_benchmarks
+
+    reports = run_harvest_benchmarks(
+        args.platform.split(","),
+        seed=args.seed,
+        objects=args.objects,
+        latency=args.latency_ms / 1000,
+        bandwidth=args.bandwidth_mbps * 1_000_000 / 8 or None,
+        fixtures_dir=Path(args.fixtures) if args.fixtures else None,
+        max_items=args.max,
+        workers=args.workers,
+        output_format=args.format,
+        target_size=args.resolution,
+        triage=args.triage,
+        tags=args.tags.split(",") if args.tags else None,
+        types=args.types.split(",") if args.types else None,
+    )
+    if args.json:
+        print(json.dumps([r.to_dict() for r in reports], indent=2))
+        return
+    for report in reports:
+        print(report.format())
+
+
+def _bench_micro(args: argparse.Namespace) -> None:
+    from .bench import BENCHMARKS, find_regressions, load_baseline, run_microbenchmarks, save_baseline
+
+    names = list(BENCHMARKS)
+    if args.only:
+        patterns = args.only.split(",")
+        names = [name for name in names if any(p in name for p in patterns)]
+        if not names:
+            raise SystemExit(f"No benchmark matches {args.only!r}")
+    baseline = load_baseline(Path(args.compare)) if args.compare else {}
+    results = run_microbenchmarks(names, repeat=args.repeat, scale=args.scale, seed=args.seed)
+    if args.save:
+        save_baseline(results, Path(args.save))
+    regressions = find_regressions(results, baseline, args.threshold)
+
+    if args.json:
+        print(json.dumps({
+            "results": [r.to_dict() for r in results],
+            "regressions": [r.name for r in regressions],
+        }, indent=2))
+    else:
+        for result in results:
+            line = f"{result.name:<46} n={result.ops:<7} {result.per_op_us:10.2f} µs/op"
+            if result.name in baseline:
+                line += f"  ({result.per_op_us / baseline[result.name] - 1:+.1%} vs baseline)"
+            print(line)
+        for regression in regressions:
+            print(f"REGRESSION {regression.name}: {regression.baseline_us:.2f} -> {regression.current_us:.2f} µs/op")
+    if regressions:
+        raise SystemExit(1)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(prog="delacroix")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -50,30 +424,335 @@ def main() -> None:
     types_parser.add_argument("--platform", help="Show types for specific platform")
     types_parser.set_defaults(func=_list_types)
 
-    harvest_parser = sub.add_parser("harvest", help="Harvest images from a platform")
-    harvest_parser.add_argument("--platform", required=True, help="Platform name (chicago, nga, louvre, met, rijksmuseum)")
-    harvest_parser.add_argument("--out", required=True, help="Output directory")
-    harvest_parser.add_argument("--max", type=int, default=5, help="Max items (default: 5)")
-    harvest_parser.add_argument(
+    snapshot_parser = sub.add_parser("snapshot", help="Build the precompiled art knowledge snapshot")
+    snapshot_parser.add_argument("--path", help="Snapshot file (default: in the local cache directory)")
+    snapshot_parser.set_defaults(func=_build_snapshot)
+
+    plan_parser = sub.add_parser("plan", help="Show the reproducible query plan for a harvest")
+    plan_parser.add_argument("--platform", help="Also list the exact search requests for this platform")
+    plan_parser.add_argument("--tags", type=str, default="european,1800s", help="Comma-separated tags (default: 'european,1800s')")
+    plan_parser.add_argument("--types", type=str, default="painting", help="Comma-separated artwork types (default: 'painting')")
+    plan_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Query ordering seed (default: {DEFAULT_SEED})")
+    plan_parser.add_argument(
+        "--no-query-stats",
+        action="store_true",
+        help="Don't rank queries by per-query yield statistics (as harvest --no-query-stats)",
+    )
+    plan_parser.add_argument("--json", action="store_true", help="Print the plan as JSON")
+    plan_parser.set_defaults(func=_plan)
+
+    # Options for building a Harvester, shared by harvest and daemon
+    harvester_options = argparse.ArgumentParser(add_help=False)
+    harvester_options.add_argument("--platform", required=True, help="Platform name (chicago, nga, louvre, met, rijksmuseum)")
+    harvester_options.add_argument(
         "--aspect-ratio",
+        type=_aspect_ratios,
+        default=(16 / 9,),
+        help=(
+            "Target aspect ratio(s) as W:H or decimal, comma-separated for one rendition "
+            "each from a single download, e.g. 16:9,4:3,21:9 (default: 16:9)"
+        ),
+    )
+    harvester_options.add_argument(
+        "--resolution",
+        type=_resolution,
+        default=FRAME_TV_4K,
+        help=(
+            "Cap output at WIDTHxHEIGHT or a preset "
+            f"({', '.join(RESOLUTION_PRESETS)}); default: 3840x2160"
+        ),
+    )
+    harvester_options.add_argument(
+        "--resample",
+        choices=sorted(RESAMPLE_FILTERS),
+        default="lanczos",
+        help="Resampling filter used when downscaling (default: lanczos)",
+    )
+    harvester_options.add_argument(
+        "--format",
+        choices=available_formats(),
+        default="jpeg",
+        help="Output image format (default: jpeg)",
+    )
+    harvester_options.add_argument(
+        "--encode-profile",
+        choices=sorted(ENCODE_PROFILES["jpeg"]),
+        default="balanced",
+        help="Encoder speed/size trade-off (default: balanced)",
+    )
+    harvester_options.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for decode/crop/encode (default: CPU count; 0 renders inline)",
+    )
+    harvester_options.add_argument(
+        "--max-download-mb",
         type=float,
-        default=16 / 9,
-        help="Target aspect ratio, e.g. 1.777 for 16:9",
+        default=200,
+        help="Skip images larger than this many MB; 0 disables the cap (default: 200)",
     )
-    harvest_parser.add_argument(
+    harvester_options.add_argument(
+        "--triage",
+        action="store_true",
+        help=(
+            "Check a small thumbnail first and only download images that are landscape, "
+            "not blank or near-monochrome, and not duplicates"
+        ),
+    )
+    harvester_options.add_argument(
+        "--manifest",
+        choices=[*MANIFEST_FORMATS, "none"],
+        default="jsonl",
+        help="Library manifest written in the output directory (default: jsonl)",
+    )
+    harvester_options.add_argument(
+        "--fsync",
+        choices=FSYNC_POLICIES,
+        default="batch",
+        help="When manifest writes are fsynced: every record, every batch, or never (default: batch)",
+    )
+    harvester_options.add_argument(
+        "--sidecars",
+        action="store_true",
+        help="Also write a .json file per image (metadata is always embedded as EXIF/XMP)",
+    )
+    harvester_options.add_argument(
         "--tags",
         type=str,
         default="european,1800s",
         help="Comma-separated tags to filter (default: 'european,1800s')",
     )
-    harvest_parser.add_argument(
+    harvester_options.add_argument(
         "--types",
         type=str,
         default="painting",
         help="Comma-separated artwork types (default: 'painting')",
     )
+    harvester_options.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Query ordering seed; rotate it for variety (default: {DEFAULT_SEED})",
+    )
+    harvester_options.add_argument(
+        "--no-query-stats",
+        action="store_true",
+        help="Don't rank queries by, or record, per-query yield statistics",
+    )
+    harvester_options.add_argument(
+        "--search-cache-ttl",
+        type=float,
+        default=24,
+        help="Hours to reuse cached search result ID lists; 0 disables the cache (default: 24)",
+    )
+    harvester_options.add_argument(
+        "--events",
+        type=str,
+        default=None,
+        help="Append progress events as JSON Lines to this file, or '-' for stdout (replaces all other output)",
+    )
+    harvester_options.add_argument(
+        "--metrics-file",
+        type=str,
+        default=None,
+        help="Keep Prometheus metrics for the run in this file (for node_exporter's textfile collector)",
+    )
+    harvester_options.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Don't print progress lines",
+    )
+    harvester_options.add_argument(
+        "--catalog",
+        type=str,
+        default=None,
+        help="Catalog of every discovered artwork (default: catalog.sqlite in the cache directory)",
+    )
+    harvester_options.add_argument(
+        "--no-catalog",
+        action="store_true",
+        help="Don't record discovered artworks in the catalog",
+    )
+    harvester_options.add_argument(
+        "--offline-discovery",
+        action="store_true",
+        help=(
+            "Pick candidates from the local catalog (filtered by tags/types, famous and large first) "
+            "instead of searching online; only images are downloaded"
+        ),
+    )
+
+    harvest_parser = sub.add_parser("harvest", parents=[harvester_options], help="Harvest images from a platform")
+    harvest_parser.add_argument("--out", required=True, help="Output directory")
+    harvest_parser.add_argument("--max", type=int, default=5, help="Max items (default: 5)")
+    harvest_parser.add_argument(
+        "--stats",
+        choices=["summary", "text", "json"],
+        default="summary",
+        help="Result report: one-line summary, per-stage/host/cache breakdown, or JSON (default: summary)",
+    )
+    harvest_parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        help="Profile the run and write the result to this file",
+    )
+    harvest_parser.add_argument(
+        "--profile-mode",
+        choices=PROFILE_MODES,
+        default="cprofile",
+        help="cprofile writes pstats; sample writes folded stacks for flame graphs (default: cprofile)",
+    )
+    harvest_parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=DEFAULT_SAMPLE_INTERVAL,
+        help=f"Seconds between stack samples in sample mode (default: {DEFAULT_SAMPLE_INTERVAL})",
+    )
+    harvest_parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        help="Write per-artwork spans as a Chrome trace (open in Perfetto or chrome://tracing)",
+    )
+    harvest_parser.add_argument(
+        "--queue",
+        type=str,
+        default=None,
+        help=(
+            "Coordinate a sharded harvest: discover into this shared SQLite work queue, "
+            "which 'delacroix worker' processes drain"
+        ),
+    )
+    harvest_parser.add_argument(
+        "--shards",
+        type=int,
+        default=4,
+        help="With --queue: number of shards candidates are split into by ID hash (default: 4)",
+    )
+    harvest_parser.add_argument(
+        "--local-workers",
+        type=int,
+        default=None,
+        help="With --queue: workers to start on this host, one per shard from 0 (default: --shards)",
+    )
     harvest_parser.set_defaults(func=_harvest)
 
+    library_parser = sub.add_parser("library", help="Query a harvested library's manifest")
+    library_parser.add_argument("--dir", required=True, help="Library (harvest output) directory")
+    library_parser.add_argument("--platform", help="Only artworks from this platform")
+    library_parser.add_argument("--search", help="Case-insensitive text to match in title, artist, date, culture or classification")
+    library_parser.add_argument("--limit", type=int, help="Show at most this many, newest first")
+    library_parser.add_argument("--count", action="store_true", help="Only print the number of matches")
+    library_parser.add_argument("--json", action="store_true", help="Print matching records as JSON Lines")
+    library_parser.set_defaults(func=_library)
+
+    daemon_parser = sub.add_parser(
+        "daemon",
+        parents=[harvester_options],
+        help="Keep a library at a target size, replacing part of it on a schedule",
+    )
+    daemon_parser.add_argument("--out", required=True, help="Library (harvest output) directory")
+    daemon_parser.add_argument("--count", type=int, required=True, help="Artworks to keep in the library")
+    daemon_parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=0,
+        help="Byte budget for the library's renditions in MB; 0 means no budget (default: 0)",
+    )
+    daemon_parser.add_argument(
+        "--refresh",
+        type=float,
+        default=0.1,
+        help="Fraction of a full library replaced each cycle (default: 0.1)",
+    )
+    daemon_parser.add_argument(
+        "--eviction",
+        choices=EVICTION_POLICIES,
+        default="lru",
+        help=(
+            "Which artworks go first: least recently displayed (see 'delacroix displayed') "
+            "or first added (default: lru)"
+        ),
+    )
+    daemon_parser.add_argument(
+        "--interval-hours",
+        type=float,
+        default=6,
+        help="Hours between the starts of cycles (default: 6)",
+    )
+    daemon_parser.add_argument("--cycles", type=int, help="Exit after this many cycles (default: run until stopped)")
+    daemon_parser.set_defaults(func=_daemon, trace=None)
+
+    displayed_parser = sub.add_parser(
+        "displayed", help="Record that library images were just shown, for the daemon's LRU eviction"
+    )
+    displayed_parser.add_argument("--dir", required=True, help="Library (harvest output) directory")
+    displayed_parser.add_argument("files", nargs="+", help="Rendition files, absolute or relative to the library")
+    displayed_parser.set_defaults(func=_displayed)
+
+    worker_parser = sub.add_parser("worker", help="Drain a sharded harvest's work queue (see harvest --queue)")
+    worker_parser.add_argument("--queue", required=True, help="Work queue file shared with the coordinator")
+    worker_parser.add_argument("--shard", type=int, required=True, help="Shard this worker prefers")
+    worker_parser.add_argument("--out", help="Output directory (default: the coordinator's)")
+    worker_parser.add_argument("--quiet", action="store_true", help="Don't print progress lines")
+    worker_parser.add_argument("--events", help="Append this worker's progress events as JSON Lines, or '-' for stdout")
+    worker_parser.add_argument("--metrics-file", help="Keep this worker's Prometheus metrics in this file")
+    worker_parser.set_defaults(func=_worker)
+
+    search_parser = sub.add_parser("search", help="Search the local catalog of discovered artworks (offline)")
+    search_parser.add_argument("query", nargs="?", default="", help="Words to match in title, artist, culture or classification")
+    search_parser.add_argument("--platform", help="Only artworks from this platform")
+    search_parser.add_argument("--status", choices=CATALOG_STATUSES, help="Only artworks with this outcome")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum results; 0 for all (default: 20)")
+    search_parser.add_argument("--catalog", help="Catalog file (default: catalog.sqlite in the cache directory)")
+    search_parser.add_argument("--json", action="store_true", help="Print one JSON object per artwork")
+    search_parser.set_defaults(func=_search)
+
+    bench_parser = sub.add_parser("bench", help="Run offline benchmarks")
+    bench_sub = bench_parser.add_subparsers(dest="bench_command", required=True)
+    bench_harvest = bench_sub.add_parser(
+        "harvest", help="End-to-end harvest against a local fake-museum server"
+    )
+    bench_harvest.add_argument(
+        "--platform",
+        default=",".join(PLATFORM_REGISTRY),
+        help="Comma-separated platforms to benchmark (default: all)",
+    )
+    bench_harvest.add_argument("--max", type=int, default=20, help="Images to harvest per platform (default: 20)")
+    bench_harvest.add_argument("--objects", type=int, default=300, help="Synthetic objects in the fake collection (default: 300)")
+    bench_harvest.add_argument("--latency-ms", type=float, default=20, help="Added latency per response (default: 20)")
+    bench_harvest.add_argument("--bandwidth-mbps", type=float, default=0, help="Per-connection bandwidth cap; 0 is unlimited (default: 0)")
+    bench_harvest.add_argument("--fixtures", help="Directory of recorded responses served by path before synthetic ones")
+    bench_harvest.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count; 0 renders inline)")
+    bench_harvest.add_argument("--format", choices=available_formats(), default="jpeg", help="Output image format (default: jpeg)")
+    bench_harvest.add_argument("--resolution", type=_resolution, default=FRAME_TV_4K, help="Output cap (default: 3840x2160)")
+    bench_harvest.add_argument("--triage", action="store_true", help="Enable thumbnail-first triage")
+    bench_harvest.add_argument("--tags", type=str, default="", help="Comma-separated tags (default: none)")
+    bench_harvest.add_argument("--types", type=str, default="painting", help="Comma-separated artwork types (default: 'painting')")
+    bench_harvest.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Seed for data and query order (default: {DEFAULT_SEED})")
+    bench_harvest.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    bench_harvest.set_defaults(func=_bench_harvest)
+
+    bench_micro = bench_sub.add_parser(
+        "micro", help="Time the per-candidate knowledge-base, filename and crop hot paths"
+    )
+    bench_micro.add_argument("--only", help="Comma-separated substrings; run benchmarks whose name contains one")
+    bench_micro.add_argument("--repeat", type=int, default=5, help="Runs per benchmark; the best is reported (default: 5)")
+    bench_micro.add_argument("--scale", type=float, default=1.0, help="Multiply every workload size, e.g. 0.1 for a quick run (default: 1)")
+    bench_micro.add_argument("--seed", type=int, default=0, help="Seed for the synthetic workloads (default: 0)")
+    bench_micro.add_argument("--save", help="Write the results as a baseline JSON file")
+    bench_micro.add_argument("--compare", help="Baseline file to compare against; exits 1 on regressions")
+    bench_micro.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="Percent slowdown per op over the baseline that counts as a regression (default: 20)",
+    )
+    bench_micro.add_argument("--json", action="store_true", help="Print the results as JSON")
+    bench_micro.set_defaults(func=_bench_micro)
+
     args = parser.parse_args()
     args.func(args)
 
@@ -1,12 +1,48 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from PIL import Image
 
+from .catalog import Catalog
+from .library import FSYNC_POLICIES, MANIFEST_FORMATS, ManifestWriter, manifest_record, open_manifest
 from .platforms.base import Artwork, BasePlatform
+from .render import (
+    ENCODE_PROFILES,
+    FRAME_TV_4K,
+    RESAMPLE_FILTERS,
+    ImageMetadata,
+    RenderOptions,
+    Rendition,
+    aspect_label,
+    available_formats,
+    render_image,
+)
+from .tracing import Tracer, now_us
+from .triage import ThumbnailTriage, TriageOptions
+from .types import compile_filter_cache_info
 
 
 @dataclass(frozen=True)
@@ -16,14 +52,163 @@ class HarvestResult:
     skipped_vertical: int
     skipped_missing_image: int
     failed: int
+    bytes_written: int = 0
+    # Rejected on the thumbnail (blank, monochrome, too small, duplicate) before downloading
+    skipped_triage: int = 0
+    # Full-size image bytes fetched, whether or not the image was kept
+    bytes_downloaded: int = 0
+    wall_seconds: float = 0.0
+    # Seconds per stage: discovery, metadata, triage, download, check, decode, crop_encode,
+    # write (renditions) and manifest (manifest record and sidecar)
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    # Per host: requests, errors, bytes, seconds and counts by status code
+    http: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Per cache: hits, misses and hit_ratio
+    caches: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# Outcome statuses, in HarvestOutcome.status, events and the catalog
+OUTCOME_STATUSES = ("kept", "skipped", "failed")
+
+
+@dataclass(frozen=True)
+class HarvestOutcome:
+    """What became of one candidate artwork, as yielded by ``Harvester.iter_harvest``."""
+
+    status: str
+    artwork: Artwork
+    # Why it was skipped (missing_image, vertical or a triage check), or the error it failed with
+    reason: Optional[str] = None
+    # Rendition files written, when kept
+    files: Tuple[Path, ...] = ()
+    # Pixel size of the downloaded image, when it got that far
+    size: Optional[Tuple[int, int]] = None
+    bytes_downloaded: int = 0
+    bytes_written: int = 0
+    # Seconds this artwork spent in each stage, starting with the wait for its discovery
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Seconds from discovery to the outcome
+    latency_s: float = 0.0
+
+    @property
+    def kept(self) -> bool:
+        return self.status == "kept"
+
+
+# Harvest stages in pipeline order, as reported in HarvestResult.stage_seconds
+STAGES = ("discovery", "metadata", "triage", "download", "check", "decode", "crop_encode", "write", "manifest")
+
+# Renditions, seconds per render stage, start time (µs) and the pid that rendered
+RenderJobResult = Tuple[List[Rendition], Dict[str, float], float, int]
+
+
+def _render_job(image_path: Path, options: RenderOptions, metadata: Optional[ImageMetadata]) -> RenderJobResult:
+    """Render in a worker process, returning the renditions and how long each render stage took."""
+    start = now_us()
+    timings: Dict[str, float] = {}
+    renditions = render_image(image_path, options, metadata, timings)
+    return renditions, timings, start, os.getpid()
+
+
+def _cache_ratio(hits: int, misses: int) -> Dict[str, float]:
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": hits / total if total else 0.0}
 
 
 class Harvester:
-    def __init__(self, platform: BasePlatform, *, aspect_ratio: float = 16 / 9) -> None:
-        if aspect_ratio <= 0:
+    def __init__(
+        self,
+        platform: BasePlatform,
+        *,
+        aspect_ratio: Union[float, Sequence[float]] = 16 / 9,
+        target_size: Optional[Tuple[int, int]] = FRAME_TV_4K,
+        resample: str = "lanczos",
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        output_format: str = "jpeg",
+        encode_profile: str = "balanced",
+        triage: Optional[TriageOptions] = None,
+        sidecars: bool = False,
+        manifest: Optional[str] = "jsonl",
+        fsync: str = "batch",
+        stage_observer: Optional[Callable[[str, float], None]] = None,
+        tracer: Optional[Tracer] = None,
+        catalog: Optional[Catalog] = None,
+        offline_discovery: bool = False,
+    ) -> None:
+        aspect_ratios = (aspect_ratio,) if isinstance(aspect_ratio, (int, float)) else tuple(aspect_ratio)
+        if not aspect_ratios or any(r <= 0 for r in aspect_ratios):
             raise ValueError("aspect_ratio must be > 0")
+        if len({aspect_label(r) for r in aspect_ratios}) < len(aspect_ratios):
+            raise ValueError("aspect ratios must have distinct labels; each names a rendition file")
+        if resample not in RESAMPLE_FILTERS:
+            raise ValueError(f"resample must be one of: {', '.join(RESAMPLE_FILTERS)}")
         self.platform = platform
-        self.aspect_ratio = aspect_ratio
+        self.aspect_ratios = aspect_ratios
+        if output_format not in available_formats():
+            raise ValueError(f"output_format must be one of: {', '.join(available_formats())}")
+        if encode_profile not in ENCODE_PROFILES[output_format]:
+            raise ValueError(f"encode_profile must be one of: {', '.join(ENCODE_PROFILES[output_format])}")
+        # Decode/crop/encode runs in a process pool; 0 workers renders inline
+        if workers is not None and workers < 0:
+            raise ValueError("workers must be >= 0")
+        # Thumbnail checks before full downloads; None downloads every candidate
+        self.triage = triage
+        # Metadata is always embedded in the image and recorded in the library
+        # manifest; per-image JSON sidecars are opt-in
+        self.sidecars = sidecars
+        if manifest is not None and manifest not in MANIFEST_FORMATS:
+            raise ValueError(f"manifest must be one of: {', '.join(MANIFEST_FORMATS)}")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of: {', '.join(FSYNC_POLICIES)}")
+        self.manifest = manifest
+        self.fsync = fsync
+        # Called with (stage, seconds) for discover/triage/download/check/decode/crop_encode/write/manifest
+        self.stage_observer = stage_observer
+        self._stage_seconds: Dict[str, float] = {}
+        # Per-artwork spans go to the same tracer as the platform's HTTP spans
+        self.tracer = tracer or platform.tracer
+        # Every discovered artwork and its outcome is recorded here, if given; the
+        # platform catalogs what it fetches, matching or not, as it fetches it
+        self.catalog = catalog
+        if catalog is not None and platform.catalog is None:
+            platform.catalog = catalog
+        # Take candidates from the catalog instead of the platform's search APIs;
+        # only image downloads go online
+        if offline_discovery and catalog is None:
+            raise ValueError("offline_discovery needs a catalog")
+        self.offline_discovery = offline_discovery
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.queue_size = queue_size or max(1, 2 * self.workers)
+        self.render_options = RenderOptions(
+            aspect_ratios=aspect_ratios,
+            target_size=target_size,
+            resample=resample,
+            format=output_format,
+            profile=encode_profile,
+            # Pool workers already use every core; only thread the encoder inline
+            threads=(os.cpu_count() or 1) if self.workers == 0 else 1,
+        )
+        # While the Harvester is used as a context manager, one render pool serves every harvest
+        self._keep_pool = False
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "Harvester":
+        self._keep_pool = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the render pool kept between harvests, if any."""
+        self._keep_pool = False
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     def harvest(
         self,
@@ -32,45 +217,454 @@ class Harvester:
         max_items: int = 50,
         tags: Optional[list[str]] = None,
         types: Optional[list[str]] = None,
+        candidates: Optional[Iterable[Artwork]] = None,
+        flush_kept: bool = False,
     ) -> HarvestResult:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        downloaded = 0
-        skipped_vertical = 0
-        skipped_missing_image = 0
-        failed = 0
-
-        # Keep fetching until we get max_items successful downloads
-        for artwork in self.platform.list_artworks(tags=tags, types=types):
-            if downloaded >= max_items:
-                break
-                
-            if not artwork.image_url:
-                skipped_missing_image += 1
-                continue
+        """Download and render up to ``max_items`` artworks.
+
+        Candidates come from ``discover`` unless given, e.g. leased from a shared work queue.
+        Manifest records are written in batches unless ``flush_kept`` (see ``iter_harvest``).
+        """
+        outcomes = self.iter_harvest(
+            output_dir, max_items=max_items, tags=tags, types=types, candidates=candidates, flush_kept=flush_kept
+        )
+        while True:
             try:
-                image_path = self.platform.download_image(artwork, output_dir)
-                if image_path is None:
-                    skipped_missing_image += 1
-                    continue
-                if not self._is_landscape(image_path):
-                    skipped_vertical += 1
-                    image_path.unlink(missing_ok=True)
-                    # Also delete the JSON metadata file if it exists
-                    json_path = image_path.with_suffix('.json')
-                    json_path.unlink(missing_ok=True)
-                    continue
-                self._crop_to_aspect(image_path, self.aspect_ratio)
-                downloaded += 1
-            except Exception:
-                failed += 1
-
-        return HarvestResult(
+                next(outcomes)
+            except StopIteration as stop:
+                return stop.value
+
+    def iter_harvest(
+        self,
+        output_dir: Path,
+        *,
+        max_items: int = 50,
+        tags: Optional[list[str]] = None,
+        types: Optional[list[str]] = None,
+        candidates: Optional[Iterable[Artwork]] = None,
+        flush_kept: bool = True,
+    ) -> Generator[HarvestOutcome, None, HarvestResult]:
+        """Like ``harvest``, but yield each candidate's outcome as soon as it is known.
+
+        With ``flush_kept`` (the default), the manifest is flushed before a kept outcome
+        is reported, so a consumer that stops or crashes mid-run finds every kept
+        artwork it was given in the manifest; otherwise records are written in batches.
+        The run's ``HarvestResult`` is the generator's return value. Closing the
+        generator early stops the run; renders still in flight are discarded.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        self._stage_seconds = {}
+        self.platform.http.stats.reset()
+        search_cache = self.platform.search_cache
+        search_hits, search_misses = (search_cache.hits, search_cache.misses) if search_cache else (0, 0)
+        filter_cache = compile_filter_cache_info()
+        # Outcomes by status, and skips by reason
+        counts: Dict[str, int] = {}
+        bytes_written = 0
+        bytes_downloaded = 0
+        triage = ThumbnailTriage(self.triage, types=types) if self.triage is not None else None
+        events = self.platform.events
+        events.emit("harvest_started", platform=self.platform.name, max_items=max_items, tags=tags, types=types)
+        # CPU-stage jobs in flight, mapped to the artwork, its downloaded file, that
+        # file's size in pixels and bytes, the artwork's stage timings so far, and
+        # when it was discovered
+        pending: Dict[Future, Tuple[Artwork, Path, Tuple[int, int], int, Dict[str, float], float]] = {}
+
+        def tally(outcome: HarvestOutcome) -> HarvestOutcome:
+            nonlocal bytes_written, bytes_downloaded
+            counts[outcome.status] = counts.get(outcome.status, 0) + 1
+            if outcome.status == "skipped":
+                counts[outcome.reason] = counts.get(outcome.reason, 0) + 1
+            bytes_written += outcome.bytes_written
+            bytes_downloaded += outcome.bytes_downloaded
+            return outcome
+
+        def finish(done: Iterable[Future]) -> Iterator[HarvestOutcome]:
+            for future in done:
+                artwork, image_path, size, nbytes, timings, discovered_at = pending.pop(future)
+                error = future.exception()
+                kept = error is None
+                if kept:
+                    renditions, render_timings, start_us, pid = future.result()
+                    self._observe_render(artwork, render_timings, start_us, pid, timings)
+                    written = self._keep(
+                        artwork, image_path, renditions, output_dir, manifest, timings, flush=flush_kept
+                    )
+                    outcome = self._outcome(
+                        "kept",
+                        artwork,
+                        discovered_at,
+                        timings,
+                        renditions=renditions,
+                        size=size,
+                        bytes_downloaded=nbytes,
+                        bytes_written=written,
+                    )
+                else:
+                    self._discard(image_path)
+                    outcome = self._outcome(
+                        "failed", artwork, discovered_at, timings, reason=repr(error), size=size, bytes_downloaded=nbytes
+                    )
+                self.platform.record_query_stats(artwork.query, types, kept=int(kept), rejected=int(not kept))
+                yield tally(outcome)
+
+        try:
+            with self._cpu_pool() as pool, self._manifest_writer(output_dir) as manifest:
+                # Keep fetching until we get max_items successful downloads
+                if candidates is None:
+                    candidates = self.discover(tags, types)
+                for artwork, wait_seconds in self._timed("discover", candidates):
+                    discovered_at = time.perf_counter()
+                    events.emit(
+                        "discovered",
+                        platform=self.platform.name,
+                        id=artwork.id,
+                        title=artwork.title,
+                        artist=artwork.artist,
+                        query=artwork.query,
+                        latency_s=wait_seconds,
+                    )
+                    # Backpressure: wait while the CPU queue is full, or while the
+                    # jobs in flight could already complete the run
+                    while pending and (
+                        len(pending) >= self.queue_size or counts.get("kept", 0) + len(pending) >= max_items
+                    ):
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from finish(done)
+                    if counts.get("kept", 0) >= max_items:
+                        break
+
+                    timings: Dict[str, float] = {"discover": wait_seconds}
+                    if not artwork.image_url:
+                        self.platform.record_query_stats(artwork.query, types, rejected=1)
+                        yield tally(self._outcome("skipped", artwork, discovered_at, timings, reason="missing_image"))
+                        continue
+                    if triage is not None:
+                        with self._stage("triage", artwork, timings) as span:
+                            thumbnail = self.platform.fetch_thumbnail(artwork)
+                            reason = triage.check(thumbnail) if thumbnail is not None else None
+                            span["reason"] = reason
+                        if reason is not None:
+                            self.platform.record_query_stats(artwork.query, types, requests=1, rejected=1)
+                            yield tally(self._outcome("skipped", artwork, discovered_at, timings, reason=reason))
+                            continue
+                    outcome: Optional[HarvestOutcome] = None
+                    size: Optional[Tuple[int, int]] = None
+                    nbytes = 0
+                    image_path: Optional[Path] = None
+                    try:
+                        with self._stage("download", artwork, timings):
+                            image_path = self.platform.download_image(artwork, output_dir)
+                        if image_path is None:
+                            outcome = self._outcome("skipped", artwork, discovered_at, timings, reason="missing_image")
+                        else:
+                            nbytes = image_path.stat().st_size
+                            with self._stage("check", artwork, timings):
+                                size = self._image_size(image_path)
+                            if size[0] < size[1]:
+                                image_path.unlink(missing_ok=True)
+                                outcome = self._outcome(
+                                    "skipped",
+                                    artwork,
+                                    discovered_at,
+                                    timings,
+                                    reason="vertical",
+                                    size=size,
+                                    bytes_downloaded=nbytes,
+                                )
+                            elif pool is None:
+                                metadata = self._image_metadata(artwork)
+                                renditions, render_timings, start_us, pid = _render_job(
+                                    image_path, self.render_options, metadata
+                                )
+                                self._observe_render(artwork, render_timings, start_us, pid, timings)
+                                written = self._keep(
+                                    artwork, image_path, renditions, output_dir, manifest, timings, flush=flush_kept
+                                )
+                                outcome = self._outcome(
+                                    "kept",
+                                    artwork,
+                                    discovered_at,
+                                    timings,
+                                    renditions=renditions,
+                                    size=size,
+                                    bytes_downloaded=nbytes,
+                                    bytes_written=written,
+                                )
+                            else:
+                                metadata = self._image_metadata(artwork)
+                                future = pool.submit(_render_job, image_path, self.render_options, metadata)
+                                pending[future] = (artwork, image_path, size, nbytes, timings, discovered_at)
+                    except Exception as e:
+                        self._discard(image_path)
+                        outcome = self._outcome(
+                            "failed", artwork, discovered_at, timings, reason=repr(e), size=size, bytes_downloaded=nbytes
+                        )
+                    # The download is part of the query's request cost; CPU-stage
+                    # outcomes are recorded when their job finishes
+                    kept = outcome is not None and outcome.kept
+                    self.platform.record_query_stats(
+                        artwork.query, types, requests=1, kept=int(kept), rejected=int(outcome is not None and not kept)
+                    )
+                    if outcome is not None:
+                        yield tally(outcome)
+
+                yield from finish(wait(pending)[0])
+        finally:
+            # Closed early: renders still in flight are not kept, so remove their files
+            for future, (_, image_path, *_) in pending.items():
+                if not future.cancel() and future.exception() is None:
+                    for rendition in future.result()[0]:
+                        rendition.path.unlink(missing_ok=True)
+                image_path.unlink(missing_ok=True)
+            pending.clear()
+            if self.platform.stats is not None:
+                self.platform.stats.save()
+            if self.catalog is not None:
+                self.catalog.flush()
+
+        skipped_vertical = counts.get("vertical", 0)
+        skipped_missing_image = counts.get("missing_image", 0)
+        result = HarvestResult(
             platform=self.platform.name,
-            downloaded=downloaded,
+            downloaded=counts.get("kept", 0),
             skipped_vertical=skipped_vertical,
             skipped_missing_image=skipped_missing_image,
-            failed=failed,
+            failed=counts.get("failed", 0),
+            bytes_written=bytes_written,
+            skipped_triage=counts.get("skipped", 0) - skipped_vertical - skipped_missing_image,
+            bytes_downloaded=bytes_downloaded,
+            wall_seconds=time.perf_counter() - started,
+            stage_seconds=self._stage_totals(),
+            http=self.platform.http.stats.to_dict(),
+            caches=self._cache_stats(search_hits, search_misses, filter_cache),
         )
+        events.emit("harvest_finished", **result.to_dict())
+        return result
+
+    async def aiter_harvest(
+        self,
+        output_dir: Path,
+        *,
+        max_items: int = 50,
+        tags: Optional[list[str]] = None,
+        types: Optional[list[str]] = None,
+        candidates: Optional[Iterable[Artwork]] = None,
+        flush_kept: bool = True,
+    ) -> AsyncIterator[HarvestOutcome]:
+        """``iter_harvest`` for asyncio code; the harvest runs in a worker thread, one outcome at a time."""
+        outcomes = self.iter_harvest(
+            output_dir, max_items=max_items, tags=tags, types=types, candidates=candidates, flush_kept=flush_kept
+        )
+        done = object()
+        try:
+            while True:
+                outcome = await asyncio.to_thread(next, outcomes, done)
+                if outcome is done:
+                    return
+                yield outcome
+        finally:
+            await asyncio.to_thread(outcomes.close)
+
+    def _observe(self, stage: str, seconds: float) -> None:
+        self._stage_seconds[stage] = self._stage_seconds.get(stage, 0.0) + seconds
+        if self.stage_observer is not None:
+            self.stage_observer(stage, seconds)
+
+    def discover(self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Iterable[Artwork]:
+        """Candidate artworks, from the platform or, with offline discovery, the catalog."""
+        if not self.offline_discovery:
+            return self.platform.list_artworks(tags=tags, types=types)
+        return self.catalog.candidates(
+            self.platform.name,
+            tags=tags,
+            types=types,
+            target_size=self.render_options.target_size,
+            seed=self.platform.seed,
+        )
+
+    def _outcome(
+        self,
+        status: str,
+        artwork: Artwork,
+        discovered_at: float,
+        timings: Dict[str, float],
+        *,
+        reason: Optional[str] = None,
+        renditions: Sequence[Rendition] = (),
+        size: Optional[Tuple[int, int]] = None,
+        bytes_downloaded: int = 0,
+        bytes_written: int = 0,
+    ) -> HarvestOutcome:
+        """Build an artwork's outcome, catalog it and emit its event."""
+        outcome = HarvestOutcome(
+            status=status,
+            artwork=artwork,
+            reason=reason,
+            files=tuple(r.path for r in renditions),
+            size=size,
+            bytes_downloaded=bytes_downloaded,
+            bytes_written=bytes_written,
+            timings=timings,
+            latency_s=time.perf_counter() - discovered_at,
+        )
+        if self.catalog is not None:
+            self.catalog.record(self.platform.name, artwork, status, reason=reason, size=size)
+        fields: Dict[str, Any] = {}
+        if status == "kept":
+            fields.update(files=[str(path) for path in outcome.files], bytes=bytes_written)
+        else:
+            fields["error" if status == "failed" else "reason"] = reason
+        if size is not None:
+            fields.update(width=size[0], height=size[1])
+        self.platform.events.emit(
+            status,
+            platform=self.platform.name,
+            id=artwork.id,
+            title=artwork.title,
+            latency_s=outcome.latency_s,
+            timings=timings,
+            **fields,
+        )
+        return outcome
+
+    def _observe_render(
+        self,
+        artwork: Artwork,
+        timings: Dict[str, float],
+        start_us: float,
+        pid: int,
+        artwork_timings: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Observe a render job's stages and trace them back to back, on the process that ran them."""
+        args = self._span_args(artwork)
+        for stage, seconds in timings.items():
+            self._observe(stage, seconds)
+            if artwork_timings is not None:
+                artwork_timings[stage] = artwork_timings.get(stage, 0.0) + seconds
+            self.tracer.add(f"render.{stage}", start_us, seconds * 1e6, pid=pid, tid=pid, args=args)
+            start_us += seconds * 1e6
+
+    @contextmanager
+    def _stage(
+        self, stage: str, artwork: Optional[Artwork] = None, timings: Optional[Dict[str, float]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Observe the block's duration as ``stage`` and trace it as a span; also add it to ``timings``."""
+        start = time.perf_counter()
+        with self.tracer.span(stage, **self._span_args(artwork)) as span:
+            try:
+                yield span
+            finally:
+                seconds = time.perf_counter() - start
+                self._observe(stage, seconds)
+                if timings is not None:
+                    timings[stage] = timings.get(stage, 0.0) + seconds
+
+    @staticmethod
+    def _span_args(artwork: Optional[Artwork]) -> Dict[str, Any]:
+        return {"id": artwork.id, "title": artwork.title} if artwork is not None else {}
+
+    def _stage_totals(self) -> Dict[str, float]:
+        totals = dict(self._stage_seconds)
+        # Metadata requests happen inside discovery; report them separately
+        metadata = self.platform.http.stats.stage_seconds.get("metadata", 0.0)
+        totals["discovery"] = max(0.0, totals.pop("discover", 0.0) - metadata)
+        totals["metadata"] = metadata
+        ordered = {stage: totals.pop(stage) for stage in STAGES if stage in totals}
+        ordered.update(totals)
+        return ordered
+
+    def _cache_stats(
+        self, search_hits: int, search_misses: int, filter_cache: Tuple[int, int]
+    ) -> Dict[str, Dict[str, float]]:
+        caches = {}
+        search_cache = self.platform.search_cache
+        if search_cache is not None:
+            caches["search"] = _cache_ratio(search_cache.hits - search_hits, search_cache.misses - search_misses)
+        hits, misses = compile_filter_cache_info()
+        caches["filter"] = _cache_ratio(hits - filter_cache[0], misses - filter_cache[1])
+        return caches
+
+    def _timed(self, stage: str, items: Iterable[Artwork]) -> Iterator[Tuple[Artwork, float]]:
+        """Yield each of ``items`` with the seconds spent waiting for it, observing that time."""
+        iterator = iter(items)
+        try:
+            while True:
+                start = time.perf_counter()
+                with self._stage(stage) as span:
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                    span.update(self._span_args(item))
+                yield item, time.perf_counter() - start
+        finally:
+            # Let the platform's generator run its cleanup when we stop early
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def _image_metadata(artwork: Artwork) -> ImageMetadata:
+        return ImageMetadata(
+            title=artwork.title,
+            artist=artwork.artist,
+            date=artwork.date,
+            source_url=artwork.source_url,
+            license=artwork.license,
+        )
+
+    def _manifest_writer(self, output_dir: Path) -> ContextManager[Optional[ManifestWriter]]:
+        if self.manifest is None:
+            return nullcontext()
+        return ManifestWriter(open_manifest(output_dir, self.manifest, fsync=self.fsync))
+
+    def _keep(
+        self,
+        artwork: Artwork,
+        image_path: Path,
+        renditions: List[Rendition],
+        output_dir: Path,
+        manifest: Optional[ManifestWriter],
+        timings: Optional[Dict[str, float]] = None,
+        *,
+        flush: bool = False,
+    ) -> int:
+        """Record a rendered artwork in the manifest and sidecar; returns bytes written."""
+        with self._stage("manifest", artwork, timings):
+            # Sidecar first: if it can't be written, the artwork fails without a manifest record
+            written = sum(r.bytes for r in renditions) + self._write_sidecar(image_path, artwork)
+            if manifest is not None:
+                manifest.add(manifest_record(self.platform.name, artwork, renditions, output_dir))
+                if flush:
+                    manifest.flush()
+            return written
+
+    def _discard(self, image_path: Optional[Path]) -> None:
+        """Remove what a failed artwork left in the output directory: its download and sidecar."""
+        if image_path is None:
+            return
+        image_path.unlink(missing_ok=True)
+        if self.sidecars:
+            image_path.with_suffix(".json").unlink(missing_ok=True)
+
+    def _write_sidecar(self, image_path: Path, artwork: Artwork) -> int:
+        """Write the artwork's JSON sidecar next to its renditions; returns bytes written."""
+        if not self.sidecars:
+            return 0
+        data = json.dumps(asdict(artwork), indent=2).encode("utf-8")
+        image_path.with_suffix(".json").write_bytes(data)
+        return len(data)
+
+    def _cpu_pool(self) -> ContextManager[Optional[ProcessPoolExecutor]]:
+        if self.workers == 0:
+            return nullcontext()
+        if not self._keep_pool:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return nullcontext(self._pool)
 
     @staticmethod
     def _limited(items: Iterable[Artwork], max_items: int) -> Iterable[Artwork]:
@@ -82,23 +676,18 @@ class Harvester:
             count += 1
 
     @staticmethod
-    def _is_landscape(image_path: Path) -> bool:
+    def _image_size(image_path: Path) -> Tuple[int, int]:
+        # Image.open only parses the header; no pixel data is decoded here
         with Image.open(image_path) as img:
-            width, height = img.size
+            return img.size
+
+    @classmethod
+    def _is_landscape(cls, image_path: Path) -> bool:
+        width, height = cls._image_size(image_path)
         return width >= height
 
     @staticmethod
-    def _crop_to_aspect(image_path: Path, aspect_ratio: float) -> None:
-        with Image.open(image_path) as img:
-            width, height = img.size
-            target_width = width
-            target_height = int(width / aspect_ratio)
-            if target_height > height:
-                target_height = height
-                target_width = int(height * aspect_ratio)
-            left = (width - target_width) // 2
-            upper = (height - target_height) // 2
-            right = left + target_width
-            lower = upper + target_height
-            cropped = img.crop((left, upper, right, lower))
-            cropped.save(image_path, quality=95)
+    def _crop_to_aspect(
+        image_path: Path, aspect_ratio: float, target_size: Optional[Tuple[int, int]] = None
+    ) -> None:
+        render_image(image_path, RenderOptions(aspect_ratios=(aspect_ratio,), target_size=target_size))
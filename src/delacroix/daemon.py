@@ -0,0 +1,257 @@
+"""Rotating library: keep a harvested library at a target size, refreshing part of it on a schedule."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from .core import Harvester
+from .library import RecordKey, open_manifest
+from .platforms.base import Artwork
+from .render import aspect_label
+
+# lru: least recently displayed first (never-displayed artworks count from when they were added);
+# oldest: first added first
+EVICTION_POLICIES = ("lru", "oldest")
+
+DEFAULT_REFRESH_FRACTION = 0.1
+
+DEFAULT_INTERVAL = 6 * 3600.0
+
+
+@dataclass(frozen=True)
+class LibraryEntry:
+    platform: str
+    id: str
+    title: str
+    files: Tuple[Path, ...]
+    bytes: int
+    added_at: float
+    displayed_at: Optional[float] = None
+
+    @property
+    def key(self) -> RecordKey:
+        return (self.platform, self.id)
+
+    @property
+    def last_used(self) -> float:
+        return max(self.displayed_at or 0.0, self.added_at)
+
+
+@dataclass(frozen=True)
+class CycleResult:
+    cycle: int
+    evicted: int
+    evicted_bytes: int
+    kept: int
+    bytes_written: int
+    # Library size once the cycle is done
+    count: int
+    bytes: int
+    wall_seconds: float
+
+    def to_dict(self):
+        return asdict(self)
+
+
+class LibraryDaemon:
+    """Keeps ``library_dir`` at ``target_count`` artworks within ``max_bytes``.
+
+    Each cycle evicts a ``refresh_fraction`` of a full library (plus anything over
+    budget) by the ``eviction`` policy, then harvests replacements. The Harvester,
+    and with it the platform's HTTP session, search cache and render pool, is reused
+    from cycle to cycle.
+    """
+
+    def __init__(
+        self,
+        harvester: Harvester,
+        library_dir: Path,
+        *,
+        target_count: int,
+        max_bytes: Optional[int] = None,
+        refresh_fraction: float = DEFAULT_REFRESH_FRACTION,
+        eviction: str = "lru",
+        tags: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+    ) -> None:
+        if target_count < 1:
+            raise ValueError("target_count must be >= 1")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        if not 0 <= refresh_fraction <= 1:
+            raise ValueError("refresh_fraction must be between 0 and 1")
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"eviction must be one of: {', '.join(EVICTION_POLICIES)}")
+        if harvester.manifest is None:
+            raise ValueError("the daemon tracks the library through its manifest; the harvester must write one")
+        self.harvester = harvester
+        self.library_dir = library_dir
+        self.target_count = target_count
+        self.max_bytes = max_bytes
+        self.refresh_fraction = refresh_fraction
+        self.eviction = eviction
+        self.tags = tags
+        self.types = types
+        self.cycles = 0
+        self._base_seed = harvester.platform.seed
+        self._stop = threading.Event()
+        # Evicted artworks aren't harvested again; the manifest remembers them across restarts
+        manifest = self._manifest()
+        try:
+            self._evicted: Set[RecordKey] = manifest.evicted()
+        finally:
+            manifest.close()
+
+    def _manifest(self):
+        return open_manifest(self.library_dir, self.harvester.manifest, fsync=self.harvester.fsync)
+
+    def entries(self) -> List[LibraryEntry]:
+        """The library's artworks, in eviction order."""
+        manifest = self._manifest()
+        try:
+            records = list(manifest.records())
+        finally:
+            manifest.close()
+        entries = [
+            LibraryEntry(
+                platform=record["platform"],
+                id=record["id"],
+                title=record.get("title") or "",
+                files=tuple(self.library_dir / f["path"] for f in record["files"]),
+                bytes=record["bytes"],
+                added_at=record["added_at"],
+                displayed_at=record.get("displayed_at"),
+            )
+            for record in records
+        ]
+        if self.eviction == "lru":
+            entries.sort(key=lambda e: (e.last_used, e.added_at))
+        else:
+            entries.sort(key=lambda e: e.added_at)
+        return entries
+
+    def plan_evictions(self, entries: List[LibraryEntry], *, refresh: bool = True) -> List[LibraryEntry]:
+        """Entries to evict, from ``entries`` in eviction order: the refresh share, then any over budget."""
+        count = 0
+        if refresh and len(entries) >= self.target_count:
+            count = math.ceil(self.refresh_fraction * self.target_count)
+        count = max(count, len(entries) - self.target_count)
+        remaining = sum(e.bytes for e in entries[count:])
+        while self.max_bytes is not None and remaining > self.max_bytes and count < len(entries):
+            remaining -= entries[count].bytes
+            count += 1
+        return entries[:count]
+
+    def evict(self, entries: List[LibraryEntry], reason: str) -> int:
+        """Delete the entries' files and manifest records; returns the bytes freed."""
+        if not entries:
+            return 0
+        freed = 0
+        events = self.harvester.platform.events
+        for entry in entries:
+            for path in self._entry_paths(entry):
+                path.unlink(missing_ok=True)
+            freed += entry.bytes
+            self._evicted.add(entry.key)
+            events.emit("evicted", platform=entry.platform, id=entry.id, title=entry.title, bytes=entry.bytes, reason=reason)
+        manifest = self._manifest()
+        try:
+            manifest.remove([e.key for e in entries], evicted=True)
+            manifest.compact()
+        finally:
+            manifest.close()
+        return freed
+
+    def _entry_paths(self, entry: LibraryEntry) -> Iterator[Path]:
+        yield from entry.files
+        if not self.harvester.sidecars:
+            return
+        # The sidecar is named after the download, which renditions only suffix when there are several
+        labels = [f"-{aspect_label(r)}" for r in self.harvester.aspect_ratios] if len(self.harvester.aspect_ratios) > 1 else []
+        for path in entry.files:
+            stem = next((path.stem[: -len(label)] for label in labels if path.stem.endswith(label)), path.stem)
+            yield path.with_name(f"{stem}.json")
+
+    def run_cycle(self) -> CycleResult:
+        """Evict, then harvest until the library is back at its target count or byte budget."""
+        started = time.perf_counter()
+        self.cycles += 1
+        # A new query order each cycle, so refreshes bring in different artworks
+        self.harvester.platform.seed = self._base_seed + self.cycles - 1
+
+        entries = self.entries()
+        evictions = self.plan_evictions(entries)
+        evicted_bytes = self.evict(evictions, "refresh")
+        evicted = {e.key for e in evictions}
+        remaining = [e for e in entries if e.key not in evicted]
+        library_bytes = sum(e.bytes for e in remaining)
+
+        kept = 0
+        bytes_written = 0
+        need = self.target_count - len(remaining)
+        if need > 0 and not self._stop.is_set():
+            exclude = {e.key for e in remaining} | self._evicted
+            candidates = self._fresh(self.harvester.discover(self.tags, self.types), exclude)
+            outcomes = self.harvester.iter_harvest(
+                self.library_dir, max_items=need, tags=self.tags, types=self.types, candidates=candidates
+            )
+            try:
+                for outcome in outcomes:
+                    if outcome.kept:
+                        kept += 1
+                        bytes_written += outcome.bytes_written
+                    if self._stop.is_set():
+                        break
+                    if self.max_bytes is not None and library_bytes + bytes_written >= self.max_bytes:
+                        break
+            finally:
+                outcomes.close()
+
+        # The last artwork kept may have gone over the byte budget
+        over = self.plan_evictions(self.entries(), refresh=False)
+        evicted_bytes += self.evict(over, "budget")
+        final = self.entries()
+        result = CycleResult(
+            cycle=self.cycles,
+            evicted=len(evictions) + len(over),
+            evicted_bytes=evicted_bytes,
+            kept=kept,
+            bytes_written=bytes_written,
+            count=len(final),
+            bytes=sum(e.bytes for e in final),
+            wall_seconds=time.perf_counter() - started,
+        )
+        self.harvester.platform.events.emit("cycle_finished", **result.to_dict())
+        return result
+
+    def _fresh(self, candidates: Iterable[Artwork], exclude: Set[RecordKey]) -> Iterator[Artwork]:
+        """Candidates not already in the library and not evicted before."""
+        platform = self.harvester.platform.name
+        iterator = iter(candidates)
+        try:
+            for artwork in iterator:
+                if (platform, artwork.id) not in exclude:
+                    yield artwork
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def run(self, *, interval: float = DEFAULT_INTERVAL, cycles: Optional[int] = None) -> None:
+        """Run a cycle every ``interval`` seconds until ``stop`` is called or ``cycles`` have run."""
+        with self.harvester:
+            while not self._stop.is_set():
+                started = time.monotonic()
+                self.run_cycle()
+                if cycles is not None and self.cycles >= cycles:
+                    return
+                self._stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    def stop(self) -> None:
+        """Stop after the artwork being harvested, or before the next cycle."""
+        self._stop.set()
@@ -0,0 +1,214 @@
+"""Structured progress events with pluggable sinks (pretty text, JSON Lines, Prometheus textfile)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Events emitted by platforms (search, found, discovery_summary, error), by
+# Harvester (harvest_started, discovered, kept, skipped, failed, harvest_finished)
+# and by LibraryDaemon (evicted, cycle_finished)
+Event = Dict[str, Any]
+
+
+class EventSink:
+    def handle(self, event: Event) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class EventBus:
+    """Fans each event out to every sink; events are dicts with ``event`` and ``ts`` keys."""
+
+    def __init__(self, sinks: Sequence[EventSink] = ()) -> None:
+        self.sinks: List[EventSink] = list(sinks)
+        self._lock = threading.Lock()
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        if not self.sinks:
+            return
+        event = {"event": kind, "ts": time.time(), **fields}
+        with self._lock:
+            for sink in self.sinks:
+                sink.handle(event)
+
+    def close(self) -> None:
+        with self._lock:
+            for sink in self.sinks:
+                sink.close()
+
+
+# Search banners per platform; "{queries}" is replaced by the first few queries
+SEARCH_BANNERS = {
+    "chicago": "🏛️ Searching Art Institute of Chicago...",
+    "met": "🎨 Searching for: {queries}...",
+    "rijksmuseum": "🇳🇱 Searching Rijksmuseum for: {queries}",
+}
+
+
+class PrettyRenderer(EventSink):
+    """Human-readable progress lines, as platforms used to print them."""
+
+    def __init__(self, stream: Optional[IO[str]] = None) -> None:
+        self.stream = stream
+
+    def handle(self, event: Event) -> None:
+        line = self.format(event)
+        if line is not None:
+            print(line, file=self.stream or sys.stdout)
+
+    @staticmethod
+    def format(event: Event) -> Optional[str]:
+        kind = event["event"]
+        if kind == "search":
+            banner = SEARCH_BANNERS.get(event["platform"], "🔎 Searching {platform} for: {queries}")
+            return banner.format(platform=event["platform"], queries=", ".join(event.get("queries", [])[:5]))
+        if kind == "found":
+            return f"✓ Found: {event['title']} by {event['artist']}"
+        if kind == "discovery_summary":
+            return f"📊 {event['platform']}: {event['famous']} famous, {event['regular']} others"
+        if kind == "error":
+            return f"Error fetching from {event['platform']}: {event['message']}"
+        if kind == "cycle_finished":
+            return (
+                f"♻️ Cycle {event['cycle']}: evicted {event['evicted']}, kept {event['kept']}; "
+                f"library has {event['count']} artworks, {event['bytes']} bytes"
+            )
+        return None
+
+
+class JsonlSink(EventSink):
+    """Writes one JSON object per line and flushes it, so the stream can be tailed live."""
+
+    def __init__(self, target: Union[str, Path, IO[str]]) -> None:
+        if isinstance(target, (str, Path)):
+            path = Path(target)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file: IO[str] = open(path, "a", encoding="utf-8")
+            self._owned = True
+        else:
+            self._file = target
+            self._owned = False
+
+    def handle(self, event: Event) -> None:
+        self._file.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+class PrometheusTextfile(EventSink):
+    """Aggregates events into counters for node_exporter's textfile collector.
+
+    The file is rewritten atomically at most every ``interval`` seconds and on close.
+    """
+
+    OUTCOMES = ("discovered", "kept", "skipped", "failed")
+
+    def __init__(self, path: Union[str, Path], *, interval: float = 5.0) -> None:
+        self.path = Path(path)
+        self.interval = interval
+        self.counts: Dict[Tuple[Tuple[str, str], ...], int] = {}
+        self.latency: Dict[Tuple[Tuple[str, str], ...], List[float]] = {}
+        self.bytes_written = 0
+        self.evicted = 0
+        # Library size reported by the daemon after each cycle
+        self.library: Optional[Tuple[int, int]] = None
+        self.running = 0
+        self.last_event = 0.0
+        self._last_write = 0.0
+
+    def handle(self, event: Event) -> None:
+        kind = event["event"]
+        platform = event.get("platform", "")
+        self.last_event = event["ts"]
+        if kind == "harvest_started":
+            self.running = 1
+        elif kind == "harvest_finished":
+            self.running = 0
+        elif kind in self.OUTCOMES:
+            # Every sample has the same labels; failure reasons are error messages,
+            # unbounded in number, so only skip reasons are used
+            reason = event.get("reason") if kind == "skipped" else None
+            key = (("platform", platform), ("outcome", kind), ("reason", str(reason or "")))
+            self.counts[key] = self.counts.get(key, 0) + 1
+            if "latency_s" in event:
+                latency = self.latency.setdefault((("platform", platform), ("outcome", kind)), [0.0, 0])
+                latency[0] += event["latency_s"]
+                latency[1] += 1
+            self.bytes_written += event.get("bytes", 0) if kind == "kept" else 0
+        elif kind == "evicted":
+            self.evicted += 1
+        elif kind == "cycle_finished":
+            self.library = (event["count"], event["bytes"])
+        if kind in ("harvest_started", "harvest_finished", "cycle_finished") or time.monotonic() - self._last_write >= self.interval:
+            self.write()
+
+    def render(self) -> str:
+        lines = [
+            "# HELP delacroix_artworks_total Artworks by harvest outcome.",
+            "# TYPE delacroix_artworks_total counter",
+        ]
+        lines += [f"delacroix_artworks_total{_labels(k)} {v}" for k, v in sorted(self.counts.items())]
+        lines += [
+            "# HELP delacroix_outcome_latency_seconds Wait for discovery, or time from discovery to the outcome.",
+            "# TYPE delacroix_outcome_latency_seconds summary",
+        ]
+        for key, (total, count) in sorted(self.latency.items()):
+            lines.append(f"delacroix_outcome_latency_seconds_sum{_labels(key)} {total}")
+            lines.append(f"delacroix_outcome_latency_seconds_count{_labels(key)} {count}")
+        lines += [
+            "# HELP delacroix_bytes_written_total Bytes of renditions kept.",
+            "# TYPE delacroix_bytes_written_total counter",
+            f"delacroix_bytes_written_total {self.bytes_written}",
+            "# HELP delacroix_harvest_running Whether a harvest is in progress.",
+            "# TYPE delacroix_harvest_running gauge",
+            f"delacroix_harvest_running {self.running}",
+            "# HELP delacroix_last_event_timestamp_seconds Unix time of the latest event.",
+            "# TYPE delacroix_last_event_timestamp_seconds gauge",
+            f"delacroix_last_event_timestamp_seconds {self.last_event}",
+        ]
+        if self.library is not None:
+            lines += [
+                "# HELP delacroix_evicted_total Artworks evicted from the library by the daemon.",
+                "# TYPE delacroix_evicted_total counter",
+                f"delacroix_evicted_total {self.evicted}",
+                "# HELP delacroix_library_artworks Artworks in the library after the latest daemon cycle.",
+                "# TYPE delacroix_library_artworks gauge",
+                f"delacroix_library_artworks {self.library[0]}",
+                "# HELP delacroix_library_bytes Bytes of renditions in the library after the latest daemon cycle.",
+                "# TYPE delacroix_library_bytes gauge",
+                f"delacroix_library_bytes {self.library[1]}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        self._last_write = time.monotonic()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The collector may read at any moment; never let it see a partial file
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def close(self) -> None:
+        self.write()
+
+
+def default_event_bus() -> EventBus:
+    return EventBus([PrettyRenderer()])
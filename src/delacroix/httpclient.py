@@ -0,0 +1,103 @@
+"""Shared HTTP session with per-host request accounting."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from .tracing import NULL_TRACER, Tracer
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    status: Dict[str, int] = field(default_factory=dict)
+
+
+class HttpStats:
+    """Request counts, status codes, bytes and time per host, plus time per stage label."""
+
+    def __init__(self) -> None:
+        self.hosts: Dict[str, HostStats] = {}
+        self.stage_seconds: Dict[str, float] = {}
+
+    def _host(self, url: str) -> HostStats:
+        host = urlsplit(url).netloc or "unknown"
+        if host not in self.hosts:
+            self.hosts[host] = HostStats()
+        return self.hosts[host]
+
+    def record(
+        self, url: str, status: Optional[int], seconds: float, nbytes: int = 0, stage: Optional[str] = None
+    ) -> None:
+        stats = self._host(url)
+        stats.requests += 1
+        stats.seconds += seconds
+        stats.bytes += nbytes
+        if status is None:
+            stats.errors += 1
+        else:
+            stats.status[str(status)] = stats.status.get(str(status), 0) + 1
+        if stage:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def add_bytes(self, url: str, nbytes: int) -> None:
+        """Count body bytes of a streamed response, which ``record`` can't see."""
+        self._host(url).bytes += nbytes
+
+    @property
+    def requests(self) -> int:
+        return sum(s.requests for s in self.hosts.values())
+
+    def reset(self) -> None:
+        self.hosts.clear()
+        self.stage_seconds.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            host: {
+                "requests": s.requests,
+                "errors": s.errors,
+                "bytes": s.bytes,
+                "seconds": s.seconds,
+                "status": dict(s.status),
+            }
+            for host, s in sorted(self.hosts.items())
+        }
+
+
+class HttpClient:
+    """One ``requests.Session`` (so connections are reused) that accounts for every request.
+
+    ``stage`` labels the purpose of a request (e.g. ``"metadata"``), so time spent
+    on it can be reported separately from the rest of discovery.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None, *, tracer: Tracer = NULL_TRACER) -> None:
+        self.session = session or requests.Session()
+        self.stats = HttpStats()
+        self.tracer = tracer
+
+    def get(self, url: str, *, stage: Optional[str] = None, **kwargs: Any) -> requests.Response:
+        with self.tracer.span(f"GET {stage or 'other'}", cat="http", url=url) as span:
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.RequestException:
+                self.stats.record(url, None, time.perf_counter() - start, stage=stage)
+                raise
+            # Streamed bodies are counted by the caller as they are read
+            nbytes = 0 if kwargs.get("stream") else len(response.content)
+            self.stats.record(url, response.status_code, time.perf_counter() - start, nbytes, stage)
+            span["status"] = response.status_code
+        return response
+
+    def close(self) -> None:
+        self.session.close()
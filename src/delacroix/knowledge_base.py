@@ -1,46 +1,29 @@
 """Knowledge base loader and intelligent query builder."""
 
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Set
+import random
+from typing import Dict, List, Optional, Set, Tuple
 from functools import lru_cache
 
-# Cache the loaded databases
-_ARTISTS_DB = None
-_MOVEMENTS_DB = None
-_PAINTINGS_DB = None
+from .snapshot import load_snapshot
+from .stats import QueryStatsStore, type_key
 
-
-def _load_json(filename: str) -> dict:
-    """Load a JSON database file."""
-    data_dir = Path(__file__).parent / "data"
-    file_path = data_dir / filename
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+# Seed used for query ordering when none is given; rotate it for variety
+DEFAULT_SEED = 0
 
 
 def get_artists_db() -> List[Dict]:
     """Get the artists database."""
-    global _ARTISTS_DB
-    if _ARTISTS_DB is None:
-        _ARTISTS_DB = _load_json("artists.json")["artists"]
-    return _ARTISTS_DB
+    return load_snapshot()["artists"]
 
 
 def get_movements_db() -> List[Dict]:
     """Get the movements database."""
-    global _MOVEMENTS_DB
-    if _MOVEMENTS_DB is None:
-        _MOVEMENTS_DB = _load_json("movements.json")["movements"]
-    return _MOVEMENTS_DB
+    return load_snapshot()["movements"]
 
 
 def get_paintings_db() -> List[Dict]:
     """Get the paintings database."""
-    global _PAINTINGS_DB
-    if _PAINTINGS_DB is None:
-        _PAINTINGS_DB = _load_json("paintings.json")["paintings"]
-    return _PAINTINGS_DB
+    return load_snapshot()["paintings"]
 
 
 @lru_cache(maxsize=128)
@@ -77,22 +60,12 @@ def find_artists_by_period(start_year: int, end_year: int, limit: int = 20) -> L
 def find_artists_by_nationality(nationality: str, limit: int = 15) -> List[str]:
     """Find artists by nationality."""
     artists_db = get_artists_db()
-    nationality_lower = nationality.lower()
-    matching_artists = []
-    
-    for artist in artists_db:
-        if artist["nationality"].lower() == nationality_lower:
-            matching_artists.append({
-                "name": artist["name"],
-                "priority": artist.get("priority", 50),
-                "aliases": artist.get("aliases", [])
-            })
-    
-    # Sort by priority
-    matching_artists.sort(key=lambda x: x["priority"], reverse=True)
+    # Prebuilt index is already sorted by priority
+    matching = load_snapshot()["indexes"]["nationality"].get(nationality.lower(), [])
     
     result = []
-    for artist in matching_artists[:limit]:
+    for idx in matching[:limit]:
+        artist = artists_db[idx]
         result.append(artist["name"])
         if artist["aliases"]:
             result.append(artist["aliases"][0])
@@ -105,24 +78,20 @@ def find_artists_by_movement(movement: str, limit: int = 15) -> List[str]:
     """Find artists by art movement."""
     artists_db = get_artists_db()
     movement_lower = movement.lower()
-    matching_artists = []
     
-    for artist in artists_db:
-        movements = [m.lower() for m in artist.get("movements", [])]
-        if movement_lower in movements or any(movement_lower in m for m in movements):
-            matching_artists.append({
-                "name": artist["name"],
-                "priority": artist.get("priority", 50),
-                "aliases": artist.get("aliases", [])
-            })
-    
-    # Sort by priority
-    matching_artists.sort(key=lambda x: x["priority"], reverse=True)
+    # Substring match against the (few) indexed movement names
+    matching = set()
+    for name, idxs in load_snapshot()["indexes"]["movement"].items():
+        if movement_lower in name:
+            matching.update(idxs)
+    # Sort by priority, keeping database order for ties
+    ordered = sorted(matching, key=lambda i: (-artists_db[i].get("priority", 50), i))
     
     result = []
-    for artist in matching_artists[:limit]:
+    for idx in ordered[:limit]:
+        artist = artists_db[idx]
         result.append(artist["name"])
-        if artist["aliases"]:
+        if artist.get("aliases"):
             result.append(artist["aliases"][0])
     
     return result
@@ -192,85 +161,120 @@ def extract_movement_from_tags(tags: List[str]) -> Optional[str]:
     return None
 
 
-def build_smart_queries(tags: Optional[List[str]] = None, types: Optional[List[str]] = None) -> List[str]:
-    """Build intelligent queries based on art knowledge database."""
-    import random
+def artists_for_tags(tags: List[str]) -> Set[str]:
+    """Lowercased names and aliases of every artist the tags' period, nationality or movement implies."""
+    artists: List[str] = []
+    period = extract_period_from_tags(tags)
+    if period:
+        artists += find_artists_by_period(period[0], period[1], limit=len(get_artists_db()))
+    movement = extract_movement_from_tags(tags)
+    if movement:
+        artists += find_artists_by_movement(movement, limit=len(get_artists_db()))
+    nationality = extract_nationality_from_tags(tags)
+    if nationality:
+        if nationality == "European":
+            nationalities = ["French", "Italian", "Dutch", "Spanish", "German", "Flemish"]
+        else:
+            nationalities = [nationality]
+        for nat in nationalities:
+            artists += find_artists_by_nationality(nat, limit=len(get_artists_db()))
+    return {artist.lower() for artist in artists}
+
+
+def plan_smart_queries(
+    tags: Optional[List[str]] = None,
+    types: Optional[List[str]] = None,
+    seed: int = DEFAULT_SEED,
+    stats: Optional[QueryStatsStore] = None,
+    platform: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """Build (query, source) pairs; the order is fully determined by ``seed``.
+
+    With a stats store and platform name, queries are ordered by expected
+    yield per request, the seeded order breaking ties.
+    """
+    rng = random.Random(seed)
+    
+    def rank(queries: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        if stats is None or platform is None:
+            return queries
+        yields = stats.expected_yields(platform, [q for q, _ in queries], type_key(types))
+        return sorted(queries, key=lambda q: yields[q[0]], reverse=True)
     
     if not tags:
-        # Default: mix of famous artists from different movements - randomized
+        # Default: mix of famous artists from different movements - seeded shuffle
         default_artists = ["Rembrandt", "Monet", "Van Gogh", "Picasso", "Renoir", "Degas", 
                           "Cézanne", "Gauguin", "Turner", "Delacroix", "Manet", "Pissarro",
                           "Velázquez", "Caravaggio", "Rubens", "Raphael", "Titian"]
-        random.shuffle(default_artists)
-        return default_artists[:10]
+        rng.shuffle(default_artists)
+        return rank([(artist, "default") for artist in default_artists])[:10]
     
     queries = []
     seen = set()
     
+    def add(artists: List[str], source: str) -> None:
+        for artist in artists:
+            if artist not in seen:
+                queries.append((artist, source))
+                seen.add(artist)
+    
     # Extract information from tags
     period = extract_period_from_tags(tags)
     nationality = extract_nationality_from_tags(tags)
     movement = extract_movement_from_tags(tags)
     
-    # Build queries based on extracted information
+    # Build queries based on extracted information. The finders are
+    # lru_cached, so shuffle copies rather than the cached lists.
     if period:
-        artists = find_artists_by_period(period[0], period[1], limit=20)
-        random.shuffle(artists)
-        for artist in artists[:15]:
-            if artist not in seen:
-                queries.append(artist)
-                seen.add(artist)
+        artists = list(find_artists_by_period(period[0], period[1], limit=20))
+        rng.shuffle(artists)
+        add(artists[:15], "period")
     
     if movement:
-        artists = find_artists_by_movement(movement, limit=20)
-        random.shuffle(artists)
-        for artist in artists[:15]:
-            if artist not in seen:
-                queries.append(artist)
-                seen.add(artist)
+        artists = list(find_artists_by_movement(movement, limit=20))
+        rng.shuffle(artists)
+        add(artists[:15], "movement")
     
     if nationality:
         if nationality == "European":
             # Get mix from major European countries
             nationalities = ["French", "Italian", "Dutch", "Spanish", "German", "Flemish"]
-            random.shuffle(nationalities)
+            rng.shuffle(nationalities)
             for nat in nationalities:
-                artists = find_artists_by_nationality(nat, limit=3)
-                random.shuffle(artists)
-                for artist in artists:
-                    if artist not in seen:
-                        queries.append(artist)
-                        seen.add(artist)
+                artists = list(find_artists_by_nationality(nat, limit=3))
+                rng.shuffle(artists)
+                add(artists, "nationality")
         else:
-            artists = find_artists_by_nationality(nationality, limit=20)
-            random.shuffle(artists)
-            for artist in artists[:15]:
-                if artist not in seen:
-                    queries.append(artist)
-                    seen.add(artist)
+            artists = list(find_artists_by_nationality(nationality, limit=20))
+            rng.shuffle(artists)
+            add(artists[:15], "nationality")
     
     # If no specific criteria found, use high-priority artists
     if not queries:
         artists_db = get_artists_db()
-        high_priority = [a for a in artists_db if a.get("priority", 0) >= 90]
-        random.shuffle(high_priority)
-        for artist in high_priority[:15]:
-            queries.append(artist["name"])
+        high_priority = [a["name"] for a in artists_db if a.get("priority", 0) >= 90]
+        rng.shuffle(high_priority)
+        add(high_priority[:15], "priority")
     
-    # Shuffle final queries for variety
-    random.shuffle(queries)
-    return queries[:15]  # Limit to 15 queries
+    # Shuffle final queries for variety, then let known yields reorder them
+    rng.shuffle(queries)
+    return rank(queries)[:15]  # Limit to 15 queries
+
+
+def build_smart_queries(
+    tags: Optional[List[str]] = None,
+    types: Optional[List[str]] = None,
+    seed: int = DEFAULT_SEED,
+    stats: Optional[QueryStatsStore] = None,
+    platform: Optional[str] = None,
+) -> List[str]:
+    """Build intelligent queries based on art knowledge database."""
+    return [query for query, _ in plan_smart_queries(tags, types, seed, stats, platform)]
 
 
 def get_met_department_for_query(types: Optional[List[str]] = None, tags: Optional[List[str]] = None) -> Optional[int]:
     """Get the best Met Museum department ID for the query."""
-    departments = {
-        "european_paintings": 11,
-        "american_paintings": 21,
-        "drawings_prints": 5,
-        "photographs": 19,
-        "asian_art": 6,
-    }
+    departments = load_snapshot()["tables"]["met_departments"]
     
     # Check type first
     if types:
@@ -306,6 +310,10 @@ def is_artist_famous(artist_name: str) -> bool:
     artists_db = get_artists_db()
     artist_lower = artist_name.lower()
     
+    # Exact name/alias hits are answered by the prebuilt index
+    if artist_lower in load_snapshot()["indexes"]["artist"]:
+        return True
+    
     for artist in artists_db:
         # Check name
         if artist["name"].lower() == artist_lower:
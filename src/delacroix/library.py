@@ -0,0 +1,329 @@
+"""Library manifest: one record per kept artwork, in a JSONL log or a SQLite database."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .platforms.base import Artwork
+from .render import Rendition
+
+MANIFEST_FORMATS = {"jsonl": "library.jsonl", "sqlite": "library.sqlite"}
+
+# always: fsync every record; batch: fsync each flushed batch; never: leave it to the OS
+FSYNC_POLICIES = ("always", "batch", "never")
+
+DEFAULT_BATCH_SIZE = 64
+
+# (platform, id) of a manifest record
+RecordKey = Tuple[str, str]
+
+
+def manifest_record(platform: str, artwork: Artwork, renditions: List[Rendition], library_dir: Path) -> Dict[str, Any]:
+    """Manifest record for a kept artwork, with rendition paths relative to the library."""
+    files = []
+    for rendition in renditions:
+        try:
+            path = rendition.path.relative_to(library_dir)
+        except ValueError:
+            path = rendition.path
+        files.append({"path": str(path), "bytes": rendition.bytes, "width": rendition.size[0], "height": rendition.size[1]})
+    return {
+        **asdict(artwork),
+        "platform": platform,
+        "files": files,
+        "bytes": sum(r.bytes for r in renditions),
+        "added_at": time.time(),
+    }
+
+
+def _matches(record: Dict[str, Any], platform: Optional[str], text: Optional[str]) -> bool:
+    if platform and record.get("platform") != platform:
+        return False
+    if text:
+        haystack = " ".join(str(record.get(k) or "") for k in ("title", "artist", "date", "culture", "classification"))
+        return text.lower() in haystack.lower()
+    return True
+
+
+class JsonlManifest:
+    """Append-only JSON Lines log; later records for the same artwork win.
+
+    Removing an artwork appends a tombstone (``{"platform", "id", "removed_at"}``,
+    plus ``"evicted": true`` for evictions); ``compact`` rewrites the log with only
+    the live records and the eviction tombstones.
+    """
+
+    def __init__(self, path: Path, *, fsync: str = "batch") -> None:
+        self.path = path
+        self.fsync = fsync
+        self._file = None
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Unbuffered append: each write() below is one O_APPEND syscall, so
+            # workers sharing a library don't interleave partial lines
+            self._file = open(self.path, "ab", buffering=0)
+        lines = [
+            (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            for record in records
+        ]
+        if self.fsync == "always":
+            for line in lines:
+                self._file.write(line)
+                os.fsync(self._file.fileno())
+            return
+        self._file.write(b"".join(lines))
+        if self.fsync == "batch":
+            os.fsync(self._file.fileno())
+
+    def _latest(self) -> Dict[tuple, Dict[str, Any]]:
+        latest: Dict[tuple, Dict[str, Any]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted run
+                        continue
+                    latest[(record.get("platform"), record.get("id"))] = record
+        except FileNotFoundError:
+            pass
+        return latest
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        yield from (record for record in self._latest().values() if "removed_at" not in record)
+
+    def remove(self, keys: Iterable[RecordKey], *, evicted: bool = False) -> None:
+        """Remove artworks; ``evicted`` ones are remembered (see ``evicted``) until added again."""
+        now = time.time()
+        tombstone: Dict[str, Any] = {"removed_at": now, "evicted": True} if evicted else {"removed_at": now}
+        self.write([{"platform": platform, "id": artwork_id, **tombstone} for platform, artwork_id in keys])
+
+    def evicted(self) -> Set[RecordKey]:
+        """Artworks removed with ``evicted=True`` and not added back since."""
+        return {key for key, record in self._latest().items() if record.get("evicted")}
+
+    def mark_displayed(self, keys: Iterable[RecordKey], when: Optional[float] = None) -> int:
+        """Record that artworks were shown on a display; returns how many were found."""
+        wanted = set(keys)
+        when = time.time() if when is None else when
+        updated = [
+            {**record, "displayed_at": when}
+            for record in self.records()
+            if (record.get("platform"), record.get("id")) in wanted
+        ]
+        if updated:
+            self.write(updated)
+        return len(updated)
+
+    def compact(self) -> None:
+        """Rewrite the log without superseded records and tombstones (but eviction ones), atomically."""
+        self.close()
+        records = [r for r in self._latest().values() if "removed_at" not in r or r.get("evicted")]
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(b"".join(
+                (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                for record in records
+            ))
+            if self.fsync != "never":
+                os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def query(
+        self, *, platform: Optional[str] = None, text: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        results = [r for r in self.records() if _matches(r, platform, text)]
+        results.sort(key=lambda r: r.get("added_at", 0), reverse=True)
+        return results[:limit] if limit else results
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SqliteManifest:
+    """SQLite manifest keyed by (platform, id); each batch is one transaction."""
+
+    _COLUMNS = (
+        "platform", "id", "title", "artist", "date", "culture", "classification",
+        "source_url", "license", "query", "image_url", "files", "bytes", "added_at", "displayed_at",
+    )
+
+    def __init__(self, path: Path, *, fsync: str = "batch") -> None:
+        self.path = path
+        self.fsync = fsync
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Sharded workers may write the same library; wait out each other's batches
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            synchronous = {"always": "FULL", "batch": "NORMAL", "never": "OFF"}[self.fsync]
+            self._conn.execute(f"PRAGMA synchronous={synchronous}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS artworks ("
+                "platform TEXT NOT NULL, id TEXT NOT NULL, title TEXT, artist TEXT, date TEXT, culture TEXT, "
+                "classification TEXT, source_url TEXT, license TEXT, query TEXT, image_url TEXT, "
+                "files TEXT NOT NULL, bytes INTEGER NOT NULL, added_at REAL NOT NULL, displayed_at REAL, "
+                "PRIMARY KEY (platform, id))"
+            )
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(artworks)")}
+            if "displayed_at" not in columns:
+                # Libraries written before display times were tracked
+                self._conn.execute("ALTER TABLE artworks ADD COLUMN displayed_at REAL")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS artworks_added_at ON artworks (added_at)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evicted (platform TEXT NOT NULL, id TEXT NOT NULL, "
+                "evicted_at REAL NOT NULL, PRIMARY KEY (platform, id))"
+            )
+        return self._conn
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        conn = self._connect()
+        placeholders = ", ".join("?" for _ in self._COLUMNS)
+        rows = [
+            tuple(json.dumps(r["files"]) if c == "files" else r.get(c) for c in self._COLUMNS)
+            for r in records
+        ]
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO artworks ({', '.join(self._COLUMNS)}) VALUES ({placeholders})", rows
+            )
+            # An evicted artwork that is harvested again is back in the library
+            conn.executemany(
+                "DELETE FROM evicted WHERE platform = ? AND id = ?", [(r["platform"], r["id"]) for r in records]
+            )
+
+    def query(
+        self, *, platform: Optional[str] = None, text: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        sql = "SELECT * FROM artworks WHERE 1=1"
+        params: List[Any] = []
+        if platform:
+            sql += " AND platform = ?"
+            params.append(platform)
+        if text:
+            like = f"%{text}%"
+            sql += " AND (title LIKE ? OR artist LIKE ? OR date LIKE ? OR culture LIKE ? OR classification LIKE ?)"
+            params.extend([like] * 5)
+        sql += " ORDER BY added_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        results = []
+        for row in self._connect().execute(sql, params):
+            record = dict(row)
+            record["files"] = json.loads(record["files"])
+            results.append(record)
+        return results
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        yield from self.query()
+
+    def remove(self, keys: Iterable[RecordKey], *, evicted: bool = False) -> None:
+        """Remove artworks; ``evicted`` ones are remembered (see ``evicted``) until added again."""
+        keys = list(keys)
+        conn = self._connect()
+        with conn:
+            conn.executemany("DELETE FROM artworks WHERE platform = ? AND id = ?", keys)
+            if evicted:
+                now = time.time()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO evicted (platform, id, evicted_at) VALUES (?, ?, ?)",
+                    [(platform, artwork_id, now) for platform, artwork_id in keys],
+                )
+
+    def evicted(self) -> Set[RecordKey]:
+        """Artworks removed with ``evicted=True`` and not added back since."""
+        if not self.path.exists():
+            return set()
+        return {(row["platform"], row["id"]) for row in self._connect().execute("SELECT platform, id FROM evicted")}
+
+    def mark_displayed(self, keys: Iterable[RecordKey], when: Optional[float] = None) -> int:
+        """Record that artworks were shown on a display; returns how many were found."""
+        conn = self._connect()
+        when = time.time() if when is None else when
+        with conn:
+            cursor = conn.executemany(
+                "UPDATE artworks SET displayed_at = ? WHERE platform = ? AND id = ?",
+                [(when, platform, artwork_id) for platform, artwork_id in keys],
+            )
+        return cursor.rowcount
+
+    def compact(self) -> None:
+        """Nothing to do; SQLite reuses the space of deleted rows."""
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def open_manifest(library_dir: Path, format: str = "jsonl", *, fsync: str = "batch"):
+    """Open the library's manifest in the given format."""
+    if format not in MANIFEST_FORMATS:
+        raise ValueError(f"manifest format must be one of: {', '.join(MANIFEST_FORMATS)}")
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"fsync must be one of: {', '.join(FSYNC_POLICIES)}")
+    path = library_dir / MANIFEST_FORMATS[format]
+    if format == "sqlite":
+        return SqliteManifest(path, fsync=fsync)
+    return JsonlManifest(path, fsync=fsync)
+
+
+def find_manifest(library_dir: Path):
+    """Open whichever manifest exists in ``library_dir`` (SQLite preferred), or None."""
+    for format in ("sqlite", "jsonl"):
+        if (library_dir / MANIFEST_FORMATS[format]).exists():
+            return open_manifest(library_dir, format)
+    return None
+
+
+class ManifestWriter:
+    """Buffers manifest records and writes them in batches through a single handle."""
+
+    def __init__(self, manifest, *, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.manifest = manifest
+        self.batch_size = max(1, batch_size)
+        self._pending: List[Dict[str, Any]] = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.add(record)
+
+    def flush(self) -> None:
+        if self._pending:
+            self.manifest.write(self._pending)
+            self._pending = []
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self.manifest.close()
+
+    def __enter__(self) -> "ManifestWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,87 @@
+"""Deterministic, seedable query plans."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from .knowledge_base import DEFAULT_SEED, plan_smart_queries
+from .platforms.base import BasePlatform
+
+
+@dataclass(frozen=True)
+class PlannedQuery:
+    rank: int
+    query: str
+    source: str
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    seed: int
+    tags: Tuple[str, ...]
+    types: Tuple[str, ...]
+    queries: Tuple[PlannedQuery, ...]
+    platform: Optional[str] = None
+    requests: Tuple[str, ...] = field(default_factory=tuple)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "seed": self.seed,
+            "tags": list(self.tags),
+            "types": list(self.types),
+            "platform": self.platform,
+            "queries": [
+                {"rank": q.rank, "query": q.query, "source": q.source} for q in self.queries
+            ],
+            "requests": list(self.requests),
+        }
+
+
+def build_query_plan(
+    tags: Optional[List[str]] = None,
+    types: Optional[List[str]] = None,
+    *,
+    seed: int = DEFAULT_SEED,
+    platform: Optional[BasePlatform] = None,
+) -> QueryPlan:
+    """Build the ranked query plan for a run; the same inputs always give the same plan.
+
+    When ``platform`` is given, queries are ordered with its seed and query stats,
+    exactly as its own searches are, and the exact search URLs it will request are
+    included, so HTTP caches can be warmed ahead of the run. Without one, queries
+    are in seeded order: yield statistics are kept per platform.
+    """
+    stats = None
+    if platform is not None:
+        seed = platform.seed
+        stats = platform.stats
+    queries = tuple(
+        PlannedQuery(rank=rank, query=query, source=source)
+        for rank, (query, source) in enumerate(
+            plan_smart_queries(
+                tags,
+                types,
+                seed,
+                stats=stats,
+                platform=platform.name if platform is not None else None,
+            ),
+            start=1,
+        )
+    )
+    urls: Tuple[str, ...] = ()
+    if platform is not None:
+        urls = tuple(
+            requests.Request("GET", url, params=params).prepare().url
+            for _, url, params in platform.plan_requests(tags, types)
+        )
+    return QueryPlan(
+        seed=seed,
+        tags=tuple(tags or ()),
+        types=tuple(types or ()),
+        queries=queries,
+        platform=platform.name if platform is not None else None,
+        requests=urls,
+    )
@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+import os
+import tempfile
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from ..cache import SearchCache
+from ..events import EventBus, default_event_bus
+from ..httpclient import HttpClient
+from ..knowledge_base import DEFAULT_SEED
+from ..stats import QueryStatsStore, type_key
+from ..tracing import NULL_TRACER, Tracer
+from ..triage import MAX_THUMBNAIL_BYTES
+
+if TYPE_CHECKING:
+    from ..catalog import Catalog
 
 
 @dataclass(frozen=True)
@@ -14,13 +30,146 @@ class Artwork:
     date: Optional[str] = None
     culture: Optional[str] = None
     classification: Optional[str] = None
+    query: Optional[str] = None
+    # Small variant of the image used for triage before the full download
+    thumbnail_url: Optional[str] = None
+    # Museum page for the object and the image's license/rights statement
+    source_url: Optional[str] = None
+    license: Optional[str] = None
+
+
+# Default cap on a single image download
+DEFAULT_MAX_DOWNLOAD_BYTES = 200 * 1024 * 1024
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+class PriorityBuffer:
+    """Streams famous artworks immediately and holds back a bounded number of regular ones.
+
+    Regular artworks are released oldest first once ``capacity`` is exceeded, once
+    ``max_queries`` queries have ended since they were found (see ``end_query``), or
+    when discovery finishes and the buffer is drained. Downloads therefore start
+    within the first query even when it finds no famous work.
+    """
+
+    def __init__(self, capacity: int = 50, max_queries: int = 1) -> None:
+        self.capacity = capacity
+        self.max_queries = max_queries
+        self.famous = 0
+        self.regular = 0
+        self._queries = 0
+        # Held artworks, with the number of queries ended before each was found
+        self._pending: Deque[Tuple[int, Artwork]] = deque()
+
+    def push(self, artwork: Artwork, famous: bool) -> Iterator[Artwork]:
+        if famous:
+            self.famous += 1
+            yield artwork
+            return
+        self.regular += 1
+        self._pending.append((self._queries, artwork))
+        if len(self._pending) > self.capacity:
+            yield self._pending.popleft()[1]
+
+    def end_query(self) -> Iterator[Artwork]:
+        """Mark the end of a query, releasing regular artworks held for ``max_queries`` queries."""
+        self._queries += 1
+        while self._pending and self._queries - self._pending[0][0] >= self.max_queries:
+            yield self._pending.popleft()[1]
+
+    def drain(self) -> Iterator[Artwork]:
+        while self._pending:
+            yield self._pending.popleft()[1]
 
 
 class BasePlatform:
     name: str = "base"
 
+    def __init__(
+        self,
+        *,
+        seed: int = DEFAULT_SEED,
+        stats: Optional[QueryStatsStore] = None,
+        search_cache: Optional[SearchCache] = None,
+        max_download_bytes: Optional[int] = DEFAULT_MAX_DOWNLOAD_BYTES,
+        http: Optional[HttpClient] = None,
+        tracer: Tracer = NULL_TRACER,
+        events: Optional[EventBus] = None,
+        catalog: Optional[Catalog] = None,
+    ) -> None:
+        self.seed = seed
+        self.stats = stats
+        self.search_cache = search_cache
+        self.max_download_bytes = max_download_bytes
+        # Spans for this platform's requests; Harvester adds per-artwork spans to the same tracer
+        self.tracer = tracer
+        self.http = http or HttpClient(tracer=tracer)
+        # Progress events; the default bus prints them as human-readable lines
+        self.events = events or default_event_bus()
+        # Every record fetched during discovery is cataloged here, matching or not
+        self.catalog = catalog
+
+    def plan_requests(
+        self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None
+    ) -> List[Tuple[str, str, Dict[str, object]]]:
+        """Return the (query, url, params) searches ``list_artworks`` will issue, in order."""
+        return []
+
+    def record_query_stats(self, query: Optional[str], types: Optional[list[str]], **counts: int) -> None:
+        """Add seen/kept/rejected/requests counts for a query to the stats store."""
+        if self.stats is not None and query:
+            self.stats.record(self.name, query, type_key(types), **counts)
+
+    def record_discovery(self, artwork: Artwork, status: str = "seen", reason: Optional[str] = None) -> None:
+        """Catalog an artwork as it is fetched; ones passed over with the reason why."""
+        if self.catalog is not None:
+            self.catalog.record(self.name, artwork, status, reason=reason)
+
     def list_artworks(self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Iterable[Artwork]:
         raise NotImplementedError
 
     def download_image(self, artwork: Artwork, output_dir: Path) -> Optional[Path]:
         raise NotImplementedError
+
+    def fetch_thumbnail(self, artwork: Artwork, *, timeout: float = 15) -> Optional[bytes]:
+        """Return the thumbnail bytes, or None if there is none or it can't be fetched."""
+        if not artwork.thumbnail_url:
+            return None
+        try:
+            with self.http.get(artwork.thumbnail_url, stage="triage", stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                data = response.raw.read(MAX_THUMBNAIL_BYTES + 1, decode_content=True)
+            self.http.stats.add_bytes(artwork.thumbnail_url, len(data))
+        except requests.RequestException:
+            return None
+        if len(data) > MAX_THUMBNAIL_BYTES:
+            return None
+        return data
+
+    def _stream_download(self, url: str, destination: Path, *, timeout: float = 60) -> None:
+        """Stream ``url`` in chunks to a temp file and atomically rename it to ``destination``.
+
+        Raises ``ValueError`` if the body is larger than ``max_download_bytes``.
+        """
+        limit = self.max_download_bytes
+        with self.http.get(url, stage="download", stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            length = response.headers.get("Content-Length", "")
+            if limit and length.isdigit() and int(length) > limit:
+                raise ValueError(f"{url} is {length} bytes, over the {limit} byte limit")
+
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{destination.name}.", suffix=".part", dir=destination.parent)
+            try:
+                written = 0
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        written += len(chunk)
+                        if limit and written > limit:
+                            raise ValueError(f"{url} exceeded the {limit} byte limit")
+                        f.write(chunk)
+                os.replace(tmp_name, destination)
+                self.http.stats.add_bytes(url, written)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
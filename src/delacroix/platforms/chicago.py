@@ -1,47 +1,36 @@
 from __future__ import annotations
 
-import json
 import re
-from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-import requests
 from PIL import Image
 
-from .base import Artwork, BasePlatform
+from .base import Artwork, BasePlatform, PriorityBuffer
 from ..knowledge_base import is_artist_famous, build_smart_queries
+from ..triage import THUMBNAIL_SIZE
+from ..types import compile_filter
 
 
 class ChicagoPlatform(BasePlatform):
     name = "chicago"
     base_url = "https://api.artic.edu/api/v1"
+    # Used when a response doesn't carry its own IIIF config
+    iiif_url = "https://www.artic.edu/iiif/2"
 
     def list_artworks(self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Iterable[Artwork]:
         """List artworks from Art Institute of Chicago."""
         
-        print(f"🏛️ Searching Art Institute of Chicago...")
+        plan = self.plan_requests(tags, types)
+        self.events.emit("search", platform=self.name, queries=[query for query, _, _ in plan])
         
-        famous_artworks = []
-        regular_artworks = []
+        # Famous works stream out as soon as they're found
+        buffer = PriorityBuffer()
         
-        # Use smart queries from knowledge base
-        artist_queries = build_smart_queries(tags, types)
-        
-        for query in artist_queries[:5]:  # Try top 5 artists
-            # Add painting filter to query if type is painting
-            search_query = query
-            if types and "painting" in types[0].lower():
-                search_query = f"{query} painting"
-            
-            params = {
-                "q": search_query,
-                "fields": "id,title,artist_display,date_display,image_id,artwork_type_title,classification_title,medium_display",
-                "limit": 30,
-            }
-            
+        for query, url, params in plan:
             try:
-                response = requests.get(f"{self.base_url}/artworks/search", params=params, timeout=30)
+                self.record_query_stats(query, types, requests=1)
+                response = self.http.get(url, stage="search", params=params, timeout=30)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -50,91 +39,92 @@ class ChicagoPlatform(BasePlatform):
                     if not artwork_id:
                         continue
                     
-                    artwork = self._fetch_artwork(artwork_id, tags, types)
-                    if artwork and artwork.image_url:
-                        if is_artist_famous(artwork.artist):
-                            famous_artworks.append(artwork)
-                            print(f"✓ Found: {artwork.title} by {artwork.artist}")
-                        else:
-                            regular_artworks.append(artwork)
+                    artwork = self._fetch_artwork(artwork_id, tags, types, query)
+                    self.record_query_stats(query, types, seen=1, requests=1)
+                    if not artwork:
+                        self.record_query_stats(query, types, rejected=1)
+                    else:
+                        famous = is_artist_famous(artwork.artist)
+                        if famous:
+                            self.events.emit(
+                                "found", platform=self.name, id=artwork.id, title=artwork.title, artist=artwork.artist
+                            )
+                        yield from buffer.push(artwork, famous)
                         
-                        if len(famous_artworks) >= 20:
+                        if buffer.famous >= 20:
                             break
                 
-                if len(famous_artworks) >= 20:
+                yield from buffer.end_query()
+                if buffer.famous >= 20:
                     break
                     
             except Exception as e:
                 continue
         
-        print(f"📊 Chicago: {len(famous_artworks)} famous, {len(regular_artworks)} others")
+        self.events.emit("discovery_summary", platform=self.name, famous=buffer.famous, regular=buffer.regular)
         
-        # Yield famous first
-        for art in famous_artworks:
-            yield art
-        for art in regular_artworks:
-            yield art
+        yield from buffer.drain()
 
-    def _fetch_artwork(self, artwork_id: int, tags: Optional[list[str]], types: Optional[list[str]]) -> Optional[Artwork]:
-        """Fetch detailed artwork information."""
+    def plan_requests(
+        self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None
+    ) -> List[Tuple[str, str, Dict[str, object]]]:
+        # Use smart queries from knowledge base, best expected yield first
+        artist_queries = build_smart_queries(tags, types, seed=self.seed, stats=self.stats, platform=self.name)
+        
+        plan = []
+        for query in artist_queries[:5]:  # Try top 5 artists
+            # Add painting filter to query if type is painting
+            search_query = query
+            if types and "painting" in types[0].lower():
+                search_query = f"{query} painting"
+            
+            plan.append((query, f"{self.base_url}/artworks/search", {
+                "q": search_query,
+                "fields": "id,title,artist_display,date_display,image_id,artwork_type_title,classification_title,medium_display",
+                "limit": 30,
+            }))
+        return plan
+
+    def _fetch_artwork(
+        self, artwork_id: int, tags: Optional[list[str]], types: Optional[list[str]], query: Optional[str] = None
+    ) -> Optional[Artwork]:
+        """Fetch detailed artwork information, or None if it can't be used; fetched works are cataloged."""
         try:
-            response = requests.get(f"{self.base_url}/artworks/{artwork_id}", timeout=30)
+            response = self.http.get(f"{self.base_url}/artworks/{artwork_id}", stage="metadata", timeout=30)
             response.raise_for_status()
-            data = response.json().get("data", {})
-            
-            # Check if has image
-            image_id = data.get("image_id")
-            if not image_id:
-                return None
-            
-            # Filter by type if specified
-            artwork_type = data.get("artwork_type_title", "").lower()
-            classification = data.get("classification_title", "").lower()
-            medium = data.get("medium_display", "").lower()
-            
-            if types:
-                type_filter = types[0].lower()
-                
-                # For paintings, be strict - exclude drawings, prints, sketches
-                if "painting" in type_filter:
-                    # Must be a painting
-                    if "painting" not in artwork_type and "painting" not in classification:
-                        return None
-                    # Exclude drawings, prints, sketches, watercolors
-                    exclude_terms = ["drawing", "print", "sketch", "watercolor", "etching", "lithograph", "engraving"]
-                    if any(term in artwork_type or term in classification or term in medium for term in exclude_terms):
-                        return None
-                    # Prefer oil paintings
-                    if "oil" not in medium and "canvas" not in medium:
-                        # Allow but deprioritize
-                        pass
-                
-                elif "photograph" in type_filter:
-                    if "photograph" not in artwork_type and "photograph" not in classification:
-                        return None
-                
-                elif "drawing" in type_filter:
-                    if "drawing" not in artwork_type and "drawing" not in classification:
-                        return None
+            payload = response.json()
+            data = payload.get("data", {})
             
             # Build IIIF image URL
-            iiif_url = data.get("config", {}).get("iiif_url")
-            if not iiif_url:
-                iiif_url = "https://www.artic.edu/iiif/2"
-            
-            image_url = f"{iiif_url}/{image_id}/full/843,/0/default.jpg"
+            iiif_url = payload.get("config", {}).get("iiif_url") or self.iiif_url
+            image_id = data.get("image_id")
             
-            return Artwork(
+            artwork = Artwork(
                 id=str(artwork_id),
                 title=data.get("title", "Untitled"),
                 artist=data.get("artist_display", "Unknown").split("\n")[0],  # First line is artist name
-                image_url=image_url,
+                image_url=f"{iiif_url}/{image_id}/full/843,/0/default.jpg" if image_id else None,
+                thumbnail_url=f"{iiif_url}/{image_id}/full/{THUMBNAIL_SIZE},/0/default.jpg" if image_id else None,
+                source_url=f"https://www.artic.edu/artworks/{artwork_id}",
+                license="CC0" if data.get("is_public_domain") else None,
                 date=data.get("date_display"),
                 culture=data.get("place_of_origin"),
                 classification=data.get("artwork_type_title"),
+                query=query,
             )
         except Exception:
             return None
+        
+        if not image_id:
+            self.record_discovery(artwork, "skipped", reason="missing_image")
+            return None
+        
+        # Filter by type if specified; paintings also exclude drawings, prints, sketches
+        if not compile_filter(types, platform=self.name).matches(data):
+            self.record_discovery(artwork, "rejected", reason="filtered")
+            return None
+        self.record_discovery(artwork)
+        return artwork
 
     def download_image(self, artwork: Artwork, output_dir: Path) -> Optional[Path]:
         """Download image from Chicago."""
@@ -144,18 +134,8 @@ class ChicagoPlatform(BasePlatform):
         filename = self._safe_filename(f"chicago-{artwork.id}-{artwork.title}") + ".jpg"
         destination = output_dir / filename
         
-        try:
-            response = requests.get(artwork.image_url, timeout=60)
-            response.raise_for_status()
-            destination.write_bytes(response.content)
-            
-            # Save metadata
-            json_file = output_dir / (self._safe_filename(f"chicago-{artwork.id}-{artwork.title}") + ".json")
-            json_file.write_text(json.dumps(asdict(artwork), indent=2), encoding="utf-8")
-            
-            return destination
-        except Exception:
-            return None
+        self._stream_download(artwork.image_url, destination)
+        return destination
 
     @staticmethod
     def _safe_filename(value: str) -> str:
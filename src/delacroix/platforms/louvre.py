@@ -6,24 +6,28 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Iterable, Optional
 
-import requests
 from PIL import Image
 
 from .base import Artwork, BasePlatform
+from ..types import compile_filter
 
 
 class LouvrePlatform(BasePlatform):
     name = "louvre"
+    base_url = "https://collections.louvre.fr"
+    # Pause between object requests to stay polite to the collections site
+    request_delay = 0.1
 
     def list_artworks(self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Iterable[Artwork]:
         ns = {"s": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-        index_url = "https://collections.louvre.fr/sitemap.xml"
-        index_xml = requests.get(index_url, timeout=30).text
+        index_url = f"{self.base_url}/sitemap.xml"
+        index_xml = self.http.get(index_url, stage="search", timeout=30).text
         index_root = ET.fromstring(index_xml)
         sitemap_urls = [loc.text for loc in index_root.findall("s:sitemap/s:loc", ns)]
+        predicate = compile_filter(types, tags, self.name)
 
         for sitemap_url in sitemap_urls:
-            sitemap_xml = requests.get(sitemap_url, timeout=30).text
+            sitemap_xml = self.http.get(sitemap_url, stage="search", timeout=30).text
             sitemap_root = ET.fromstring(sitemap_xml)
             for loc in sitemap_root.findall("s:url/s:loc", ns):
                 url = loc.text
@@ -31,19 +35,19 @@ class LouvrePlatform(BasePlatform):
                     continue
                 json_url = url + ".json"
                 try:
-                    data = requests.get(json_url, timeout=30).json()
+                    data = self.http.get(json_url, stage="metadata", timeout=30).json()
                 except Exception:
                     continue
                 artwork = self._louvre_artwork_from_json(data)
                 if artwork:
-                    # Filter by tags if provided
-                    if tags and not self._matches_tags(artwork, tags):
-                        continue
-                    # Filter by types if provided
-                    if types and not self._matches_types(artwork, types):
+                    # Filter by types and tags if provided
+                    record = {**data, "title": artwork.title, "artist": artwork.artist}
+                    if not predicate.matches(record):
+                        self.record_discovery(artwork, "rejected", reason="filtered")
                         continue
+                    self.record_discovery(artwork)
                     yield artwork
-                time.sleep(0.1)
+                time.sleep(self.request_delay)
 
     def download_image(self, artwork: Artwork, output_dir: Path) -> Optional[Path]:
         if not artwork.image_url:
@@ -52,17 +56,7 @@ class LouvrePlatform(BasePlatform):
         filename = self._safe_filename(f"louvre-{artwork.id}-{artwork.title}") + ".jpg"
         destination = output_dir / filename
         
-        response = requests.get(artwork.image_url, timeout=60)
-        response.raise_for_status()
-        destination.write_bytes(response.content)
-        self._embed_metadata(destination, artwork.artist, artwork.title)
-        
-        # Save metadata to JSON
-        import json
-        from dataclasses import asdict
-        json_file = output_dir / (self._safe_filename(f"louvre-{artwork.id}-{artwork.title}") + ".json")
-        json_file.write_text(json.dumps(asdict(artwork), indent=2), encoding="utf-8")
-        
+        self._stream_download(artwork.image_url, destination)
         return destination
 
     def _louvre_artwork_from_json(self, data: Dict) -> Optional[Artwork]:
@@ -71,6 +65,7 @@ class LouvrePlatform(BasePlatform):
             return None
 
         image_url = None
+        license = None
         for img in images:
             if not isinstance(img, dict):
                 continue
@@ -79,6 +74,7 @@ class LouvrePlatform(BasePlatform):
                 continue
             image_url = img.get("urlImage")
             if image_url:
+                license = (img.get("copyright") or "").strip() or None
                 break
 
         if not image_url:
@@ -93,6 +89,8 @@ class LouvrePlatform(BasePlatform):
             title=(data.get("title") or "").strip() or "Untitled",
             artist=artist,
             image_url=image_url,
+            source_url=data.get("url") or None,
+            license=license,
         )
 
     @staticmethod
@@ -119,32 +117,3 @@ class LouvrePlatform(BasePlatform):
         value = re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-")
         return value.lower() or "artwork"
 
-    @staticmethod
-    def _embed_metadata(image_path: Path, artist: str, title: str) -> None:
-        # Metadata is saved in accompanying JSON file
-        pass
-
-    def _matches_tags(self, artwork: Artwork, tags: list[str]) -> bool:
-        """Check if artwork matches the provided tags."""
-        searchable_text = " ".join([
-            artwork.title,
-            artwork.artist,
-        ]).lower()
-        
-        for tag in tags:
-            if tag.lower() in searchable_text:
-                return True
-        return False
-
-    def _matches_types(self, artwork: Artwork, types: list[str]) -> bool:
-        """Check if artwork matches the provided type filters."""
-        from ..types import get_type_keywords
-        
-        searchable_text = artwork.title.lower()
-        
-        for type_filter in types:
-            keywords = get_type_keywords(type_filter)
-            for keyword in keywords:
-                if keyword.lower() in searchable_text:
-                    return True
-        return False
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
+import itertools
 import re
-from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-import requests
 from PIL import Image
 
-from .base import Artwork, BasePlatform
-from ..types import get_type_keywords
+from .base import Artwork, BasePlatform, PriorityBuffer
+from ..cache import CachedSearch
+from ..types import compile_filter
 from ..knowledge_base import build_smart_queries, get_met_department_for_query, is_artist_famous
 
 
@@ -19,19 +18,84 @@ class MetMuseumPlatform(BasePlatform):
     base_url = "https://collectionapi.metmuseum.org/public/collection/v1"
 
     def list_artworks(self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Iterable[Artwork]:
-        # Build intelligent queries using art knowledge database
-        queries = build_smart_queries(tags, types)
-        department_id = get_met_department_for_query(types, tags)
+        plan = self.plan_requests(tags, types)
         
-        print(f"🎨 Searching for: {', '.join(queries[:5])}...")
+        self.events.emit("search", platform=self.name, queries=[query for query, _, _ in plan])
         
         # Collect artworks from multiple targeted queries
-        famous_artworks = []
-        regular_artworks = []
+        # Famous works stream out as soon as they're found
+        buffer = PriorityBuffer()
         seen_ids = set()
         
+        for query, url, params in plan:
+            try:
+                object_ids, cached = self._search_ids(query, url, params, types)
+                # Continue from where earlier runs stopped in the ID list, wrapping around
+                start = cached.cursor if cached is not None else 0
+                ordered = itertools.chain(
+                    itertools.islice(object_ids, start, None), itertools.islice(object_ids, start)
+                )
+                # IDs taken from the list, and those this run is done with: yielded,
+                # rejected or already examined for another query
+                examined: List[str] = []
+                done: Set[str] = set()
+                try:
+                    # Limit objects per query to avoid slowness
+                    for object_id in itertools.islice(ordered, 30):
+                        examined.append(str(object_id))
+                        if object_id in seen_ids:
+                            done.add(str(object_id))
+                            continue
+                        seen_ids.add(object_id)
+                        
+                        art = self._fetch_object(object_id, tags, types, query)
+                        self.record_query_stats(query, types, seen=1, requests=1)
+                        if not art:
+                            self.record_query_stats(query, types, rejected=1)
+                            done.add(str(object_id))
+                        else:
+                            famous = is_artist_famous(art.artist)
+                            if famous:
+                                self.events.emit(
+                                    "found", platform=self.name, id=art.id, title=art.title, artist=art.artist
+                                )
+                            for released in buffer.push(art, famous):
+                                done.add(released.id)
+                                yield released
+                            
+                            # Early exit if we have enough famous artworks
+                            if buffer.famous >= 30:
+                                break
+                    for released in buffer.end_query():
+                        done.add(released.id)
+                        yield released
+                finally:
+                    # Runs even if the consumer stops iterating early; works still held
+                    # in the buffer are examined again by the next run
+                    if cached is not None and self.search_cache is not None:
+                        processed = next((i for i, oid in enumerate(examined) if oid not in done), len(examined))
+                        self.search_cache.set_cursor(params, cached, start + processed)
+                
+                if buffer.famous >= 30:
+                    break
+                    
+            except Exception as e:
+                continue
+        
+        self.events.emit("discovery_summary", platform=self.name, famous=buffer.famous, regular=buffer.regular)
+        
+        yield from buffer.drain()
+
+    def plan_requests(
+        self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None
+    ) -> List[Tuple[str, str, Dict[str, object]]]:
+        # Build intelligent queries using art knowledge database, best expected yield first
+        queries = build_smart_queries(tags, types, seed=self.seed, stats=self.stats, platform=self.name)
+        department_id = get_met_department_for_query(types, tags)
+        
+        plan = []
         for query in queries:
-            params = {
+            params: Dict[str, object] = {
                 "hasImages": "true",
                 "isPublicDomain": "true",
                 "q": query,
@@ -40,148 +104,75 @@ class MetMuseumPlatform(BasePlatform):
             # Add department filter for faster results
             if department_id:
                 params["departmentId"] = department_id
-            
-            try:
-                response = requests.get(f"{self.base_url}/search", params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-                object_ids = data.get("objectIDs") or []
-                
-                # Limit objects per query to avoid slowness
-                for object_id in object_ids[:30]:
-                    if object_id in seen_ids:
-                        continue
-                    seen_ids.add(object_id)
-                    
-                    art = self._fetch_object(object_id, tags, types)
-                    if art:
-                        if is_artist_famous(art.artist):
-                            famous_artworks.append(art)
-                            print(f"✓ Found: {art.title} by {art.artist}")
-                        else:
-                            regular_artworks.append(art)
-                        
-                        # Early exit if we have enough famous artworks
-                        if len(famous_artworks) >= 30:
-                            break
-                
-                if len(famous_artworks) >= 30:
-                    break
-                    
-            except Exception as e:
-                continue
-        
-        print(f"📊 Found {len(famous_artworks)} famous artworks, {len(regular_artworks)} others")
+            plan.append((query, f"{self.base_url}/search", params))
+        return plan
+
+    def _search_ids(
+        self, query: str, url: str, params: Dict[str, object], types: Optional[list[str]]
+    ) -> Tuple[List[int], Optional[CachedSearch]]:
+        """Return the object IDs for a search, from the search cache when fresh."""
+        if self.search_cache is not None:
+            cached = self.search_cache.get(params)
+            if cached is not None:
+                return cached.ids, cached
         
-        # Yield famous artists first, then regular ones
-        for art in famous_artworks:
-            yield art
-        for art in regular_artworks:
-            yield art
+        self.record_query_stats(query, types, requests=1)
+        response = self.http.get(url, stage="search", params=params, timeout=30)
+        response.raise_for_status()
+        object_ids = response.json().get("objectIDs") or []
+        if self.search_cache is None:
+            return object_ids, None
+        return object_ids, self.search_cache.put(params, object_ids)
 
-    def _fetch_object(self, object_id: int, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Optional[Artwork]:
+    def _fetch_object(
+        self,
+        object_id: int,
+        tags: Optional[list[str]] = None,
+        types: Optional[list[str]] = None,
+        query: Optional[str] = None,
+    ) -> Optional[Artwork]:
+        """Fetch an object, or None if it can't be used; every fetched object is cataloged."""
         try:
-            response = requests.get(f"{self.base_url}/objects/{object_id}", timeout=30)
+            response = self.http.get(f"{self.base_url}/objects/{object_id}", stage="metadata", timeout=30)
             response.raise_for_status()
             data = response.json()
         except Exception:
             return None
             
-        if not data.get("isPublicDomain"):
-            return None
-        
-        # Filter by tags if provided
-        if tags and not self._matches_tags(data, tags):
-            return None
-        
-        # Filter by types if provided
-        if types and not self._matches_types(data, types):
-            return None
-            
+        public_domain = bool(data.get("isPublicDomain"))
         image_url = data.get("primaryImage") or data.get("primaryImageSmall")
-        return Artwork(
+        artwork = Artwork(
             id=str(data.get("objectID")),
             title=data.get("title") or "Untitled",
             artist=data.get("artistDisplayName") or "Unknown",
             image_url=image_url,
+            # Only worth triaging when the small variant differs from the full image
+            thumbnail_url=data.get("primaryImageSmall") if data.get("primaryImage") else None,
+            source_url=data.get("objectURL") or None,
+            # The Met releases its public-domain objects as CC0
+            license="CC0" if public_domain else None,
             date=data.get("objectDate"),
             culture=data.get("culture"),
             classification=data.get("classification"),
+            query=query,
         )
-
-    def _matches_tags(self, data: dict, tags: list[str]) -> bool:
-        """Check if artwork matches the provided tags."""
-        searchable_text = " ".join([
-            str(data.get("artistDisplayName", "")),
-            str(data.get("culture", "")),
-            str(data.get("objectDate", "")),
-            str(data.get("classification", "")),
-            str(data.get("medium", "")),
-            str(data.get("artistNationality", "")),
-            str(data.get("period", "")),
-        ]).lower()
-        
-        # Check if any tag matches
-        for tag in tags:
-            tag_lower = tag.lower()
-            
-            # Handle century tags (e.g., "1800s", "19th century")
-            if tag_lower.endswith("s") and tag_lower[:-1].isdigit():
-                century = tag_lower[:-1]
-                if century in searchable_text:
-                    return True
-            elif "century" in tag_lower:
-                if tag_lower in searchable_text:
-                    return True
-            # Handle year ranges
-            elif tag_lower.isdigit() and len(tag_lower) == 4:
-                if tag_lower in searchable_text:
-                    return True
-            # Handle general tags (baroque, european, etc.)
-            elif tag_lower in searchable_text:
-                return True
-        
-        return False
-
-    def _matches_types(self, data: dict, types: list[str]) -> bool:
-        """Check if artwork matches the provided type filters (strict matching)."""
-        classification = str(data.get("classification", "")).lower()
-        object_name = str(data.get("objectName", "")).lower()
-        
-        # For strict type filtering, check classification field primarily
-        for type_filter in types:
-            keywords = get_type_keywords(type_filter)
-            
-            # Check if classification exactly matches the type
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                # Exact match in classification (most reliable)
-                if keyword_lower in classification:
-                    return True
-                # For paintings, also check object name
-                if type_filter.lower() == "painting" and "painting" in object_name:
-                    return True
-                # For photographs, be strict
-                if type_filter.lower() == "photograph" and "photograph" in classification:
-                    return True
-                # For drawings, check both fields
-                if type_filter.lower() == "drawing" and ("drawing" in classification or "drawing" in object_name):
-                    return True
+        if not public_domain:
+            self.record_discovery(artwork, "skipped", reason="not_public_domain")
+            return None
         
-        return False
+        # Filter by types and tags if provided
+        if not compile_filter(types, tags, self.name).matches(data):
+            self.record_discovery(artwork, "rejected", reason="filtered")
+            return None
+        self.record_discovery(artwork)
+        return artwork
 
     def download_image(self, artwork: Artwork, output_dir: Path) -> Optional[Path]:
         if not artwork.image_url:
             return None
         filename = self._safe_filename(f"met-{artwork.id}-{artwork.title}") + ".jpg"
         destination = output_dir / filename
-        response = requests.get(artwork.image_url, timeout=60)
-        response.raise_for_status()
-        destination.write_bytes(response.content)
-        self._embed_metadata(destination, artwork.artist, artwork.title)
-        (output_dir / f"{self._safe_filename(f'met-{artwork.id}-{artwork.title}')}.json").write_text(
-            json.dumps(asdict(artwork), indent=2), encoding="utf-8"
-        )
+        self._stream_download(artwork.image_url, destination)
         return destination
 
     @staticmethod
@@ -190,8 +181,3 @@ class MetMuseumPlatform(BasePlatform):
         value = re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-")
         return value.lower() or "artwork"
 
-    @staticmethod
-    def _embed_metadata(image_path: Path, artist: str, title: str) -> None:
-        # Metadata is saved in accompanying JSON file
-        # JPEG EXIF metadata can be unreliable across different viewers
-        pass
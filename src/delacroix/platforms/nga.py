@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import io
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Iterator, Optional
 
-import requests
 from PIL import Image
 
 from .base import Artwork, BasePlatform
+from ..triage import THUMBNAIL_SIZE
+from ..types import compile_filter
 
 
 class NGAPlatform(BasePlatform):
     name = "nga"
+    base_url = "https://raw.githubusercontent.com/NationalGalleryOfArt/opendata/main/data"
 
     def list_artworks(self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Iterable[Artwork]:
         candidates = list(self._nga_candidates(500))
@@ -22,28 +26,33 @@ class NGAPlatform(BasePlatform):
         
         object_meta = self._nga_object_metadata({c["object_id"] for c in candidates})
         
+        artworks = []
+        records = []
         for candidate in candidates:
             meta = object_meta.get(candidate["object_id"], {})
             title = meta.get("title") or "Untitled"
             artist = meta.get("artist") or "Unknown"
             image_url = self._nga_iiif_image_url(candidate["iiif_url"], candidate.get("maxpixels"))
             
-            artwork = Artwork(
+            artworks.append(Artwork(
                 id=candidate["object_id"],
                 title=title,
                 artist=artist,
                 image_url=image_url,
-            )
-            
-            # Filter by tags if provided
-            if tags and not self._matches_tags(artwork, tags):
-                continue
-            
-            # Filter by types if provided (NGA has limited type info)
-            if types and not self._matches_types(artwork, types):
-                continue
-                
-            yield artwork
+                thumbnail_url=f"{candidate['iiif_url']}/full/!{THUMBNAIL_SIZE},{THUMBNAIL_SIZE}/0/default.jpg",
+                date=meta.get("date") or None,
+                classification=meta.get("classification") or None,
+            ))
+            records.append({**meta, "title": title, "artist": artist})
+        
+        # Filter by types and tags in one pass over all candidates
+        matches = compile_filter(types, tags, self.name).matches_many(records)
+        for artwork, matched in zip(artworks, matches):
+            if matched:
+                self.record_discovery(artwork)
+                yield artwork
+            else:
+                self.record_discovery(artwork, "rejected", reason="filtered")
 
     def download_image(self, artwork: Artwork, output_dir: Path) -> Optional[Path]:
         if not artwork.image_url:
@@ -52,56 +61,49 @@ class NGAPlatform(BasePlatform):
         filename = self._safe_filename(f"nga-{artwork.id}-{artwork.title}") + ".jpg"
         destination = output_dir / filename
         
-        response = requests.get(artwork.image_url, timeout=60)
-        response.raise_for_status()
-        destination.write_bytes(response.content)
-        self._embed_metadata(destination, artwork.artist, artwork.title)
-        
-        # Save metadata to JSON
-        import json
-        from dataclasses import asdict
-        json_file = output_dir / (self._safe_filename(f"nga-{artwork.id}-{artwork.title}") + ".json")
-        json_file.write_text(json.dumps(asdict(artwork), indent=2), encoding="utf-8")
-        
+        self._stream_download(artwork.image_url, destination)
         return destination
 
     def _nga_candidates(self, limit: int) -> Iterable[Dict[str, str]]:
-        url = "https://raw.githubusercontent.com/NationalGalleryOfArt/opendata/main/data/published_images.csv"
-        reader = self._stream_csv(url)
+        url = f"{self.base_url}/published_images.csv"
         count = 0
-        for row in reader:
-            if row.get("viewtype") != "primary":
-                continue
-            if not row.get("iiifurl"):
-                continue
-            width = self._to_int(row.get("width"))
-            height = self._to_int(row.get("height"))
-            if width and height and width < height:
-                continue
-            count += 1
-            yield {
-                "object_id": row.get("depictstmsobjectid", "").strip(),
-                "iiif_url": row.get("iiifurl", "").strip(),
-                "maxpixels": row.get("maxpixels", "").strip(),
-            }
-            if count >= limit:
-                break
+        with self._stream_csv(url) as reader:
+            for row in reader:
+                if row.get("viewtype") != "primary":
+                    continue
+                if not row.get("iiifurl"):
+                    continue
+                width = self._to_int(row.get("width"))
+                height = self._to_int(row.get("height"))
+                if width and height and width < height:
+                    continue
+                count += 1
+                yield {
+                    "object_id": row.get("depictstmsobjectid", "").strip(),
+                    "iiif_url": row.get("iiifurl", "").strip(),
+                    "maxpixels": row.get("maxpixels", "").strip(),
+                }
+                if count >= limit:
+                    break
 
     def _nga_object_metadata(self, object_ids: set[str]) -> Dict[str, Dict[str, str]]:
-        url = "https://raw.githubusercontent.com/NationalGalleryOfArt/opendata/main/data/objects.csv"
-        reader = self._stream_csv(url)
+        url = f"{self.base_url}/objects.csv"
         metadata: Dict[str, Dict[str, str]] = {}
         remaining = set(object_ids)
-        for row in reader:
-            object_id = row.get("objectid", "").strip()
-            if object_id in remaining:
-                metadata[object_id] = {
-                    "title": row.get("title", "").strip(),
-                    "artist": row.get("attribution", "").strip(),
-                }
-                remaining.remove(object_id)
-                if not remaining:
-                    break
+        with self._stream_csv(url) as reader:
+            for row in reader:
+                object_id = row.get("objectid", "").strip()
+                if object_id in remaining:
+                    metadata[object_id] = {
+                        "title": row.get("title", "").strip(),
+                        "artist": row.get("attribution", "").strip(),
+                        "date": row.get("displaydate", "").strip(),
+                        "classification": row.get("classification", "").strip(),
+                        "medium": row.get("medium", "").strip(),
+                    }
+                    remaining.remove(object_id)
+                    if not remaining:
+                        break
         return metadata
 
     @staticmethod
@@ -111,17 +113,22 @@ class NGAPlatform(BasePlatform):
             size = f"!{maxpixels},{maxpixels}"
         return f"{base_url}/full/{size}/0/default.jpg"
 
-    @staticmethod
-    def _stream_csv(url: str) -> Iterable[Dict[str, str]]:
-        response = requests.get(url, stream=True, timeout=60)
-        response.raise_for_status()
-        # Handle gzip compression
-        import gzip
-        if response.headers.get('Content-Encoding') == 'gzip':
-            text_stream = io.TextIOWrapper(gzip.GzipFile(fileobj=response.raw), encoding="utf-8")
-        else:
-            text_stream = io.TextIOWrapper(response.raw, encoding="utf-8")
-        return csv.DictReader(text_stream)
+    @contextmanager
+    def _stream_csv(self, url: str) -> Iterator[csv.DictReader]:
+        """Stream a CSV's rows; callers may stop early, and only the bytes read are counted."""
+        with self.http.get(url, stage="search", stream=True, timeout=60) as response:
+            response.raise_for_status()
+            # Report EOF to the text wrapper instead of closing the stream under it
+            response.raw.auto_close = False
+            if response.headers.get("Content-Encoding") == "gzip":
+                text_stream = io.TextIOWrapper(gzip.GzipFile(fileobj=response.raw), encoding="utf-8")
+            else:
+                text_stream = io.TextIOWrapper(response.raw, encoding="utf-8")
+            try:
+                yield csv.DictReader(text_stream)
+            finally:
+                # Bytes taken off the wire, compressed, including the text wrapper's read-ahead
+                self.http.stats.add_bytes(url, response.raw.tell())
 
     @staticmethod
     def _safe_filename(value: str) -> str:
@@ -129,10 +136,6 @@ class NGAPlatform(BasePlatform):
         value = re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-")
         return value.lower() or "artwork"
 
-    @staticmethod
-    def _embed_metadata(image_path: Path, artist: str, title: str) -> None:
-        # Metadata is saved in accompanying JSON file
-        pass
 
     @staticmethod
     def _to_int(value: Optional[str]) -> int:
@@ -142,28 +145,3 @@ class NGAPlatform(BasePlatform):
             return int(float(value))
         except ValueError:
             return 0
-
-    def _matches_tags(self, artwork: Artwork, tags: list[str]) -> bool:
-        """Check if artwork matches the provided tags."""
-        searchable_text = " ".join([
-            artwork.title,
-            artwork.artist,
-        ]).lower()
-        
-        for tag in tags:
-            if tag.lower() in searchable_text:
-                return True
-        return False
-
-    def _matches_types(self, artwork: Artwork, types: list[str]) -> bool:
-        """Check if artwork matches the provided type filters."""
-        from ..types import get_type_keywords
-        
-        searchable_text = artwork.title.lower()
-        
-        for type_filter in types:
-            keywords = get_type_keywords(type_filter)
-            for keyword in keywords:
-                if keyword.lower() in searchable_text:
-                    return True
-        return False
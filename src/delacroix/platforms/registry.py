@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Type
+from typing import Any, Dict, Type
 
 from .base import BasePlatform
 from .chicago import ChicagoPlatform
@@ -19,8 +19,8 @@ PLATFORM_REGISTRY: Dict[str, Type[BasePlatform]] = {
 }
 
 
-def get_platform(name: str) -> BasePlatform:
+def get_platform(name: str, **options: Any) -> BasePlatform:
     if name not in PLATFORM_REGISTRY:
         available = ", ".join(sorted(PLATFORM_REGISTRY))
         raise KeyError(f"Unknown platform '{name}'. Available: {available}")
-    return PLATFORM_REGISTRY[name]()
+    return PLATFORM_REGISTRY[name](**options)
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
 import re
-from dataclasses import asdict
+from dataclasses import replace
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-import requests
 from PIL import Image
 
-from .base import Artwork, BasePlatform
+from .base import Artwork, BasePlatform, PriorityBuffer
 from ..knowledge_base import is_artist_famous
+from ..types import compile_filter
 
 
 class RijksmuseumPlatform(BasePlatform):
@@ -22,6 +21,55 @@ class RijksmuseumPlatform(BasePlatform):
     def list_artworks(self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None) -> Iterable[Artwork]:
         """List artworks from Rijksmuseum."""
         
+        query, url, params = self.plan_requests(tags, types)[0]
+        
+        self.events.emit("search", platform=self.name, queries=[query])
+        
+        # Famous works stream out as soon as they're found
+        buffer = PriorityBuffer()
+        
+        try:
+            self.record_query_stats(query, types, requests=1)
+            response = self.http.get(url, stage="search", params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            
+            art_objects = data.get("artObjects", [])
+            # Filter by types and tags in one pass; paintings also exclude drawings, prints, sketches
+            matches = compile_filter(types, tags, self.name).matches_many(art_objects)
+            
+            for obj, matched in zip(art_objects, matches):
+                artwork = self._parse_artwork(obj)
+                self.record_query_stats(query, types, seen=1)
+                if artwork is not None:
+                    artwork = replace(artwork, query=query)
+                    if matched:
+                        self.record_discovery(artwork)
+                    else:
+                        self.record_discovery(artwork, "rejected", reason="filtered")
+                if not (matched and artwork and artwork.image_url):
+                    self.record_query_stats(query, types, rejected=1)
+                else:
+                    famous = is_artist_famous(artwork.artist)
+                    if famous:
+                        self.events.emit(
+                            "found", platform=self.name, id=artwork.id, title=artwork.title, artist=artwork.artist
+                        )
+                    yield from buffer.push(artwork, famous)
+                    
+                    if buffer.famous >= 20:
+                        break
+        
+        except Exception as e:
+            self.events.emit("error", platform=self.name, message=str(e))
+        
+        self.events.emit("discovery_summary", platform=self.name, famous=buffer.famous, regular=buffer.regular)
+        
+        yield from buffer.drain()
+
+    def plan_requests(
+        self, tags: Optional[list[str]] = None, types: Optional[list[str]] = None
+    ) -> List[Tuple[str, str, Dict[str, object]]]:
         # Build query
         query_parts = []
         if types and "painting" in types[0].lower():
@@ -35,48 +83,13 @@ class RijksmuseumPlatform(BasePlatform):
         
         query = " ".join(query_parts) if query_parts else "painting"
         
-        print(f"🇳🇱 Searching Rijksmuseum for: {query}")
-        
-        params = {
+        return [(query, self.base_url, {
             "key": self.api_key,
             "q": query,
             "imgonly": "true",
             "ps": 100,  # results per page
             "p": 0,
-        }
-        
-        famous_artworks = []
-        regular_artworks = []
-        
-        try:
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            art_objects = data.get("artObjects", [])
-            
-            for obj in art_objects:
-                artwork = self._parse_artwork(obj)
-                if artwork and artwork.image_url:
-                    if is_artist_famous(artwork.artist):
-                        famous_artworks.append(artwork)
-                        print(f"✓ Found: {artwork.title} by {artwork.artist}")
-                    else:
-                        regular_artworks.append(artwork)
-                    
-                    if len(famous_artworks) >= 20:
-                        break
-        
-        except Exception as e:
-            print(f"Error fetching from Rijksmuseum: {e}")
-        
-        print(f"📊 Rijksmuseum: {len(famous_artworks)} famous, {len(regular_artworks)} others")
-        
-        # Yield famous first
-        for art in famous_artworks:
-            yield art
-        for art in regular_artworks:
-            yield art
+        })]
 
     def _parse_artwork(self, obj: dict) -> Optional[Artwork]:
         """Parse Rijksmuseum API object into Artwork."""
@@ -91,6 +104,7 @@ class RijksmuseumPlatform(BasePlatform):
                 title=obj.get("title", "Untitled"),
                 artist=obj.get("principalOrFirstMaker", "Unknown"),
                 image_url=image_url,
+                source_url=obj.get("links", {}).get("web"),
                 date=obj.get("dating", {}).get("presentingDate"),
                 culture="Dutch",
                 classification=obj.get("objectTypes", [""])[0] if obj.get("objectTypes") else None,
@@ -106,18 +120,8 @@ class RijksmuseumPlatform(BasePlatform):
         filename = self._safe_filename(f"rijks-{artwork.id}-{artwork.title}") + ".jpg"
         destination = output_dir / filename
         
-        try:
-            response = requests.get(artwork.image_url, timeout=60)
-            response.raise_for_status()
-            destination.write_bytes(response.content)
-            
-            # Save metadata
-            json_file = output_dir / (self._safe_filename(f"rijks-{artwork.id}-{artwork.title}") + ".json")
-            json_file.write_text(json.dumps(asdict(artwork), indent=2), encoding="utf-8")
-            
-            return destination
-        except Exception:
-            return None
+        self._stream_download(artwork.image_url, destination)
+        return destination
 
     @staticmethod
     def _safe_filename(value: str) -> str:
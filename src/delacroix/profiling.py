@@ -0,0 +1,89 @@
+"""Whole-run profilers: deterministic (cProfile) and a stdlib sampling profiler."""
+
+from __future__ import annotations
+
+import cProfile
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+PROFILE_MODES = ("cprofile", "sample")
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+class SamplingProfiler:
+    """Samples every thread's Python stack at a fixed interval.
+
+    Output is in the "folded stacks" format (``frame;frame;frame count`` per line)
+    read by flamegraph.pl, speedscope and similar tools. Overhead is roughly
+    independent of how many calls the harvest makes, unlike cProfile.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="delacroix-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profiled(path: Optional[Path], mode: str = "cprofile", *, interval: float = DEFAULT_SAMPLE_INTERVAL) -> Iterator[None]:
+    """Profile the block and write the result to ``path``; no-op when ``path`` is None.
+
+    ``cprofile`` writes a pstats file (``python -m pstats``, snakeviz); ``sample``
+    writes folded stacks. Only the main process is profiled, not render workers.
+    """
+    if path is None:
+        yield
+        return
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"profile mode must be one of: {', '.join(PROFILE_MODES)}")
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(path))
+        return
+    sampler = SamplingProfiler(interval)
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        sampler.write(path)
@@ -1,40 +1,34 @@
 """Smart query optimization for faster artwork discovery."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-# Famous artists by time period for targeted queries
-ARTISTS_BY_PERIOD = {
-    "1400s": ["van eyck", "fra angelico", "masaccio"],
-    "1500s": ["leonardo", "michelangelo", "raphael", "titian", "dürer", "holbein"],
-    "1600s": ["caravaggio", "rembrandt", "vermeer", "rubens", "velázquez", "poussin"],
-    "1700s": ["watteau", "canaletto", "tiepolo", "gainsborough", "reynolds", "goya", "david"],
-    "1800s": ["turner", "delacroix", "courbet", "monet", "renoir", "degas", "van gogh", "cézanne"],
-    "1900s": ["picasso", "matisse", "kandinsky", "klimt", "munch", "hopper"],
-}
+from .snapshot import load_snapshot
 
-# European regions and their famous artists
-ARTISTS_BY_REGION = {
-    "french": ["monet", "renoir", "degas", "cézanne", "gauguin", "delacroix", "poussin", "watteau", "ingres", "david"],
-    "italian": ["leonardo", "michelangelo", "raphael", "titian", "caravaggio", "botticelli"],
-    "dutch": ["rembrandt", "vermeer", "van gogh", "mondrian", "bosch"],
-    "spanish": ["velázquez", "goya", "picasso", "dalí", "el greco", "murillo"],
-    "german": ["dürer", "friedrich", "holbein", "kandinsky", "klee"],
-    "flemish": ["rubens", "van eyck", "bruegel", "van der weyden"],
-    "british": ["turner", "constable", "gainsborough", "reynolds"],
-    "european": ["monet", "rembrandt", "van gogh", "picasso", "leonardo", "michelangelo"],
-}
 
-# Met Museum department IDs for faster filtering
-MET_DEPARTMENTS = {
-    "european_paintings": 11,
-    "drawings_prints": 5,
-    "photographs": 19,
-    "american_paintings": 21,
-    "asian_art": 6,
-    "greek_roman": 13,
+def _table(name: str) -> Dict:
+    """One of the lookup tables in ``data/tables.json``.
+
+    artists_by_period: famous artists by time period, for targeted queries;
+    artists_by_region: European regions and their famous artists;
+    met_departments: Met Museum department IDs for faster filtering.
+    """
+    return load_snapshot()["tables"][name]
+
+
+# The tables used to be module constants; keep those names importable
+_TABLE_ALIASES = {
+    "ARTISTS_BY_PERIOD": "artists_by_period",
+    "ARTISTS_BY_REGION": "artists_by_region",
+    "MET_DEPARTMENTS": "met_departments",
 }
 
 
+def __getattr__(name: str):
+    if name in _TABLE_ALIASES:
+        return _table(_TABLE_ALIASES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def build_optimized_queries(
     tags: Optional[List[str]] = None,
     types: Optional[List[str]] = None
@@ -57,24 +51,27 @@ def build_optimized_queries(
                         time_period = century
                         break
             # Check for regions
-            for region_key in ARTISTS_BY_REGION:
+            for region_key in _table("artists_by_region"):
                 if region_key in tag_lower:
                     region = region_key
                     break
     
     # Build queries targeting famous artists
     target_artists = set()
+    artists_by_period = _table("artists_by_period")
+    artists_by_region = _table("artists_by_region")
     
-    if time_period and time_period in ARTISTS_BY_PERIOD:
-        target_artists.update(ARTISTS_BY_PERIOD[time_period])
+    if time_period and time_period in artists_by_period:
+        target_artists.update(artists_by_period[time_period])
     
-    if region and region in ARTISTS_BY_REGION:
-        target_artists.update(ARTISTS_BY_REGION[region])
+    if region and region in artists_by_region:
+        target_artists.update(artists_by_region[region])
     
     # If we have specific artists, query for them
     if target_artists:
-        # Create queries for top artists (limit to avoid too many queries)
-        for artist in list(target_artists)[:10]:
+        # Create queries for top artists (limit to avoid too many queries);
+        # sorted, since set order changes from one process to the next
+        for artist in sorted(target_artists)[:10]:
             queries.append(artist)
     else:
         # Fallback to generic query
@@ -90,22 +87,23 @@ def build_optimized_queries(
 
 def get_met_department_id(types: Optional[List[str]] = None, tags: Optional[List[str]] = None) -> Optional[int]:
     """Get the most relevant Met department ID for filtering."""
+    departments = _table("met_departments")
     if not types and not tags:
-        return MET_DEPARTMENTS["european_paintings"]
+        return departments["european_paintings"]
     
     if types:
         type_lower = types[0].lower()
         if "painting" in type_lower:
             # Check if European or American
             if tags and any("american" in t.lower() for t in tags):
-                return MET_DEPARTMENTS["american_paintings"]
-            return MET_DEPARTMENTS["european_paintings"]
+                return departments["american_paintings"]
+            return departments["european_paintings"]
         elif "photograph" in type_lower:
-            return MET_DEPARTMENTS["photographs"]
+            return departments["photographs"]
         elif "drawing" in type_lower or "print" in type_lower:
-            return MET_DEPARTMENTS["drawings_prints"]
+            return departments["drawings_prints"]
     
-    return MET_DEPARTMENTS["european_paintings"]
+    return departments["european_paintings"]
 
 
 def should_prioritize_artist(artist_name: str, tags: Optional[List[str]] = None) -> bool:
@@ -118,13 +116,13 @@ def should_prioritize_artist(artist_name: str, tags: Optional[List[str]] = None)
     # Check if artist matches time period
     for tag in tags:
         tag_lower = tag.lower()
-        for century, artists in ARTISTS_BY_PERIOD.items():
+        for century, artists in _table("artists_by_period").items():
             if century[:3] in tag_lower:
                 if any(artist in artist_lower for artist in artists):
                     return True
         
         # Check if artist matches region
-        for region, artists in ARTISTS_BY_REGION.items():
+        for region, artists in _table("artists_by_region").items():
             if region in tag_lower:
                 if any(artist in artist_lower for artist in artists):
                     return True
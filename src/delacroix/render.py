@@ -0,0 +1,317 @@
+"""Crop, resize and encode harvested images for display."""
+
+from __future__ import annotations
+
+import io
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from xml.sax.saxutils import escape
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, features
+
+# Largest image a 4K Frame TV can display; decoding beyond this is wasted work
+FRAME_TV_4K = (3840, 2160)
+
+RESOLUTION_PRESETS: Dict[str, Optional[Tuple[int, int]]] = {
+    "4k": FRAME_TV_4K,
+    "1440p": (2560, 1440),
+    "1080p": (1920, 1080),
+    "720p": (1280, 720),
+    "original": None,
+}
+
+RESAMPLE_FILTERS = {
+    "nearest": Image.Resampling.NEAREST,
+    "box": Image.Resampling.BOX,
+    "bilinear": Image.Resampling.BILINEAR,
+    "hamming": Image.Resampling.HAMMING,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+
+# Names used for rendition files when several aspect ratios are requested
+COMMON_ASPECT_RATIOS: Dict[str, float] = {
+    "16x9": 16 / 9,
+    "16x10": 16 / 10,
+    "21x9": 21 / 9,
+    "32x9": 32 / 9,
+    "4x3": 4 / 3,
+    "3x2": 3 / 2,
+    "5x4": 5 / 4,
+    "1x1": 1.0,
+}
+
+
+# Output format -> (Pillow format name, file suffix, Pillow feature to check)
+OUTPUT_FORMATS: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "jpeg": ("JPEG", ".jpg", None),
+    "webp": ("WEBP", ".webp", "webp"),
+    "avif": ("AVIF", ".avif", "avif"),
+}
+
+# Encoder settings per format for each speed/size trade-off
+ENCODE_PROFILES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "jpeg": {
+        "fast": {"quality": 95},
+        "balanced": {"quality": 95, "optimize": True},
+        "small": {"quality": 85, "optimize": True, "progressive": True},
+    },
+    "webp": {
+        "fast": {"quality": 90, "method": 0},
+        "balanced": {"quality": 88, "method": 4},
+        "small": {"quality": 80, "method": 6},
+    },
+    "avif": {
+        "fast": {"quality": 80, "speed": 10},
+        "balanced": {"quality": 75, "speed": 6},
+        "small": {"quality": 65, "speed": 4},
+    },
+}
+
+
+def available_formats() -> List[str]:
+    """Output formats the installed Pillow can encode."""
+    return [name for name, (_, _, feature) in OUTPUT_FORMATS.items() if feature is None or features.check(feature)]
+
+
+def parse_resolution(value: str) -> Optional[Tuple[int, int]]:
+    """Parse a preset name or ``WIDTHxHEIGHT``; ``original`` means no cap."""
+    key = value.lower().strip()
+    if key in RESOLUTION_PRESETS:
+        return RESOLUTION_PRESETS[key]
+    try:
+        width, height = (int(part) for part in key.split("x"))
+    except ValueError:
+        presets = ", ".join(RESOLUTION_PRESETS)
+        raise ValueError(f"Invalid resolution '{value}'. Use WIDTHxHEIGHT or one of: {presets}") from None
+    if width <= 0 or height <= 0:
+        raise ValueError("resolution must be positive")
+    return width, height
+
+
+def parse_aspect_ratios(value: str) -> Tuple[float, ...]:
+    """Parse a comma-separated list of ``W:H`` ratios or decimals, e.g. ``16:9,4:3,2.35``.
+
+    Ratios that share a file label (e.g. ``16:9`` and ``1.778``) are kept once.
+    """
+    ratios = []
+    labels = set()
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if ":" in part:
+                width, height = (float(x) for x in part.split(":"))
+                ratio = width / height
+            else:
+                ratio = float(part)
+        except (ValueError, ZeroDivisionError):
+            raise ValueError(f"Invalid aspect ratio '{part}'. Use W:H (e.g. 16:9) or a decimal") from None
+        if ratio <= 0:
+            raise ValueError("aspect ratio must be > 0")
+        label = aspect_label(ratio)
+        if label not in labels:
+            labels.add(label)
+            ratios.append(ratio)
+    if not ratios:
+        raise ValueError("at least one aspect ratio is required")
+    return tuple(ratios)
+
+
+def aspect_label(ratio: float) -> str:
+    """Filename-safe label for a ratio, e.g. ``16x9``."""
+    for label, known in COMMON_ASPECT_RATIOS.items():
+        if abs(ratio - known) < 0.005:
+            return label
+    return f"{ratio:.3f}".rstrip("0").rstrip(".").replace(".", "_")
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    # One rendition is written per ratio, all from a single decode
+    aspect_ratios: Tuple[float, ...] = (16 / 9,)
+    # Output is capped to fit this box; None keeps the source resolution
+    target_size: Optional[Tuple[int, int]] = FRAME_TV_4K
+    resample: str = "lanczos"
+    format: str = "jpeg"
+    profile: str = "balanced"
+    # Overrides the profile's quality when set
+    quality: Optional[int] = None
+    # Encoder threads for codecs that support them (AVIF)
+    threads: int = 1
+
+    def save_params(self) -> Dict[str, Any]:
+        params = dict(ENCODE_PROFILES[self.format][self.profile])
+        if self.quality is not None:
+            params["quality"] = self.quality
+        if self.format == "avif":
+            params["max_threads"] = max(1, self.threads)
+        return params
+
+
+@dataclass(frozen=True)
+class ImageMetadata:
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    date: Optional[str] = None
+    source_url: Optional[str] = None
+    license: Optional[str] = None
+
+    def exif(self) -> Image.Exif:
+        exif = Image.Exif()
+        for tag, value in (
+            (0x010E, self.title),  # ImageDescription
+            (0x013B, self.artist),  # Artist
+            (0x8298, self.license),  # Copyright
+        ):
+            if value:
+                exif[tag] = value
+        return exif
+
+    def xmp(self) -> bytes:
+        fields = []
+        if self.title:
+            fields.append(f"<dc:title><rdf:Alt><rdf:li xml:lang='x-default'>{escape(self.title)}</rdf:li></rdf:Alt></dc:title>")
+        if self.artist:
+            fields.append(f"<dc:creator><rdf:Seq><rdf:li>{escape(self.artist)}</rdf:li></rdf:Seq></dc:creator>")
+        if self.date:
+            fields.append(f"<dc:date><rdf:Seq><rdf:li>{escape(self.date)}</rdf:li></rdf:Seq></dc:date>")
+        if self.source_url:
+            fields.append(f"<dc:source>{escape(self.source_url)}</dc:source>")
+        if self.license:
+            fields.append(f"<dc:rights><rdf:Alt><rdf:li xml:lang='x-default'>{escape(self.license)}</rdf:li></rdf:Alt></dc:rights>")
+        return (
+            "<?xpacket begin='\ufeff' id='W5M0MpCehiHzreSzNTczkc9d'?>"
+            "<x:xmpmeta xmlns:x='adobe:ns:meta/'><rdf:RDF xmlns:rdf='http://www.w3.org/1999/02/22-rdf-syntax-ns#'>"
+            "<rdf:Description rdf:about='' xmlns:dc='http://purl.org/dc/elements/1.1/'>"
+            + "".join(fields)
+            + "</rdf:Description></rdf:RDF></x:xmpmeta><?xpacket end='w'?>"
+        ).encode("utf-8")
+
+    def comment(self) -> str:
+        parts = [f"{self.title or 'Untitled'} by {self.artist or 'Unknown'}"]
+        parts.extend(value for value in (self.date, self.source_url, self.license) if value)
+        return " | ".join(parts)
+
+    def save_params(self, format: str) -> Dict[str, Any]:
+        """Encoder arguments that embed this metadata in the given output format."""
+        params: Dict[str, Any] = {"exif": self.exif(), "xmp": self.xmp()}
+        if format == "jpeg":
+            params["comment"] = self.comment()
+        return params
+
+
+@dataclass(frozen=True)
+class Rendition:
+    path: Path
+    bytes: int
+    size: Tuple[int, int]
+
+
+def crop_box(width: int, height: int, aspect_ratio: float) -> Tuple[int, int, int, int]:
+    """Centered crop box of the given aspect ratio."""
+    target_width = width
+    target_height = int(width / aspect_ratio)
+    if target_height > height:
+        target_height = height
+        target_width = int(height * aspect_ratio)
+    left = (width - target_width) // 2
+    upper = (height - target_height) // 2
+    return left, upper, left + target_width, upper + target_height
+
+
+def fit_size(aspect_ratio: float, target_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Largest size of the given aspect ratio that fits in ``target_size``."""
+    target_width, target_height = target_size
+    width = min(target_width, target_height * aspect_ratio)
+    return max(1, round(width)), max(1, round(width / aspect_ratio))
+
+
+def draft_for_target(img: Image.Image, aspect_ratios: Iterable[float], target_size: Tuple[int, int]) -> None:
+    """Ask the JPEG decoder for the smallest power-of-two scale whose crops still cover ``target_size``."""
+    width, height = img.size
+    scale = 0.0
+    for aspect_ratio in aspect_ratios:
+        left, _, right, _ = crop_box(width, height, aspect_ratio)
+        scale = max(scale, fit_size(aspect_ratio, target_size)[0] / max(1, right - left))
+    if scale >= 1:
+        return
+    # draft() never goes below the requested size, so the crop stays >= target
+    img.draft(img.mode, (max(1, math.ceil(width * scale)), max(1, math.ceil(height * scale))))
+
+
+def _render_crop(img: Image.Image, aspect_ratio: float, options: RenderOptions) -> Image.Image:
+    box = crop_box(*img.size, aspect_ratio)
+    size = (box[2] - box[0], box[3] - box[1])
+    if options.target_size is not None:
+        fitted = fit_size(aspect_ratio, options.target_size)
+        if fitted[0] < size[0]:
+            size = fitted
+    if size == (box[2] - box[0], box[3] - box[1]):
+        return img.crop(box)
+    # Crop and resize in a single resampling pass
+    return img.resize(size, RESAMPLE_FILTERS[options.resample], box=box, reducing_gap=3.0)
+
+
+def rendition_path(image_path: Path, aspect_ratio: float, options: RenderOptions) -> Path:
+    """Output path for one rendition; ratio-suffixed only when several are requested."""
+    suffix = OUTPUT_FORMATS[options.format][1]
+    if len(options.aspect_ratios) == 1:
+        return image_path.with_suffix(suffix)
+    return image_path.with_name(f"{image_path.stem}-{aspect_label(aspect_ratio)}{suffix}")
+
+
+def render_image(
+    image_path: Path,
+    options: RenderOptions,
+    metadata: Optional[ImageMetadata] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Rendition]:
+    """Crop to each aspect ratio, downscale to the target and encode in the output format.
+
+    The image is decoded once; the renditions replace ``image_path`` and carry
+    ``metadata`` as EXIF/XMP (and a JPEG comment) written by the same encode.
+    Seconds spent on decode, crop_encode and write are added to ``timings``.
+    """
+    timings = {} if timings is None else timings
+    pil_format = OUTPUT_FORMATS[options.format][0]
+    params = options.save_params()
+    if metadata is not None:
+        params.update(metadata.save_params(options.format))
+
+    start = time.perf_counter()
+    with Image.open(image_path) as img:
+        if options.target_size is not None:
+            draft_for_target(img, options.aspect_ratios, options.target_size)
+        icc_profile = img.info.get("icc_profile")
+        img.load()
+        decoded = time.perf_counter()
+        crops = [(ratio, _render_crop(img, ratio, options)) for ratio in options.aspect_ratios]
+    if icc_profile:
+        params["icc_profile"] = icc_profile
+
+    encoded = []
+    for aspect_ratio, rendered in crops:
+        if options.format != "jpeg" and rendered.mode not in ("RGB", "RGBA", "L"):
+            rendered = rendered.convert("RGB")
+        buffer = io.BytesIO()
+        rendered.save(buffer, format=pil_format, **params)
+        encoded.append((rendition_path(image_path, aspect_ratio, options), buffer.getvalue(), rendered.size))
+    written = time.perf_counter()
+
+    renditions = []
+    for output_path, data, size in encoded:
+        output_path.write_bytes(data)
+        renditions.append(Rendition(path=output_path, bytes=len(data), size=size))
+    if all(r.path != image_path for r in renditions):
+        image_path.unlink(missing_ok=True)
+
+    timings["decode"] = timings.get("decode", 0.0) + decoded - start
+    timings["crop_encode"] = timings.get("crop_encode", 0.0) + written - decoded
+    timings["write"] = timings.get("write", 0.0) + time.perf_counter() - written
+    return renditions
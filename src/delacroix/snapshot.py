@@ -0,0 +1,198 @@
+"""Precompiled snapshot of the art knowledge data.
+
+The JSON databases in ``data/`` are merged into one snapshot with lookup indexes
+prebuilt, so a cold process loads everything in a single read. The smaller
+tables in ``data/tables.json`` (used by ``art_knowledge``, ``artists``,
+``query_optimizer`` and ``knowledge_base``) are carried along as they are.
+The snapshot is invalidated when a source file's mtime/size changes and its
+content hash no longer matches.
+
+The snapshot is stored as JSON, not pickle: it lives in the user's cache
+directory, and loading it must never run code written there by someone else.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cache import atomic_write_bytes, cache_dir
+
+SNAPSHOT_VERSION = 3
+
+_PACKAGE_DIR = Path(__file__).parent
+_SOURCE_FILES = (
+    "data/artists.json",
+    "data/movements.json",
+    "data/paintings.json",
+    "data/tables.json",
+)
+
+_SNAPSHOT: Optional[dict] = None
+
+
+def snapshot_path() -> Path:
+    """Location of the snapshot file in the local cache directory."""
+    return cache_dir() / f"knowledge-v{SNAPSHOT_VERSION}.json"
+
+
+def _source_stats() -> Dict[str, List[int]]:
+    stats = {}
+    for rel in _SOURCE_FILES:
+        st = (_PACKAGE_DIR / rel).stat()
+        stats[rel] = [st.st_mtime_ns, st.st_size]
+    return stats
+
+
+def _source_digest() -> str:
+    digest = hashlib.sha256()
+    for rel in _SOURCE_FILES:
+        digest.update(rel.encode("utf-8"))
+        digest.update((_PACKAGE_DIR / rel).read_bytes())
+    return digest.hexdigest()
+
+
+def _load_json(filename: str) -> dict:
+    with open(_PACKAGE_DIR / "data" / filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _merge_artists(artist_database: Dict[str, Dict]) -> List[Dict]:
+    artists: List[Dict] = []
+    known_names = set()
+    for artist in _load_json("artists.json")["artists"]:
+        name_lower = artist["name"].lower()
+        if name_lower in known_names:
+            continue
+        known_names.add(name_lower)
+        artists.append(artist)
+
+    known = set(known_names)
+    for artist in artists:
+        known.update(alias.lower() for alias in artist.get("aliases", []))
+
+    # Add artists only present in the lifespan table, in the JSON schema
+    for name, info in artist_database.items():
+        if name in known or any(name in full_name for full_name in known_names):
+            continue
+        birth, death = info["years"]
+        artists.append({
+            "name": name.title(),
+            "aliases": [],
+            "birth": birth,
+            "death": death,
+            "nationality": info["nationality"].title(),
+            "movements": [m.title() for m in info["movements"]],
+            "specialties": ["painting"],
+            "famous_works": [],
+            "keywords": [],
+        })
+        known.add(name)
+    return artists
+
+
+def _merge_paintings(
+    famous_paintings: Dict[str, str], artist_index: Dict[str, int], artists: List[Dict]
+) -> List[Dict]:
+    paintings = _load_json("paintings.json")["paintings"]
+    titles = {p["title"].lower() for p in paintings}
+    for title, artist in famous_paintings.items():
+        if title in titles:
+            continue
+        idx = artist_index.get(artist)
+        paintings.append({
+            "title": title.title(),
+            "artist": artists[idx]["name"] if idx is not None else artist.title(),
+            "type": "painting",
+            "keywords": [],
+        })
+    return paintings
+
+
+def _index_by(artists: List[Dict], values) -> Dict[str, List[int]]:
+    """Map each lowercased value to artist indexes, highest priority first."""
+    index: Dict[str, List[int]] = {}
+    for idx, artist in enumerate(artists):
+        for value in values(artist):
+            index.setdefault(value.lower(), []).append(idx)
+    for idxs in index.values():
+        idxs.sort(key=lambda i: artists[i].get("priority", 50), reverse=True)
+    return index
+
+
+def build_snapshot() -> dict:
+    """Merge every knowledge source into a snapshot dict with prebuilt indexes."""
+    sources = _source_stats()
+    digest = _source_digest()
+
+    tables = _load_json("tables.json")
+    artists = _merge_artists(tables["artist_database"])
+    artist_index: Dict[str, int] = {}
+    for idx, artist in enumerate(artists):
+        for name in [artist["name"], *artist.get("aliases", [])]:
+            artist_index.setdefault(name.lower(), idx)
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "sources": sources,
+        "digest": digest,
+        "artists": artists,
+        "movements": _load_json("movements.json")["movements"],
+        "paintings": _merge_paintings(tables["famous_paintings"], artist_index, artists),
+        "indexes": {
+            "artist": artist_index,
+            "nationality": _index_by(artists, lambda a: [a["nationality"]]),
+            "movement": _index_by(artists, lambda a: a.get("movements", [])),
+        },
+        "tables": {**tables, "famous_artists": frozenset(tables["famous_artists"])},
+    }
+
+
+def write_snapshot(path: Optional[Path] = None) -> dict:
+    """Build the snapshot and write it to disk, returning it."""
+    snapshot = build_snapshot()
+    _save(snapshot, path or snapshot_path())
+    return snapshot
+
+
+def _save(snapshot: dict, path: Path) -> None:
+    data = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"), default=sorted)
+    try:
+        atomic_write_bytes(path, data.encode("utf-8"))
+    except OSError:
+        # Read-only cache directory: the in-memory snapshot is still usable
+        pass
+
+
+def read_snapshot(path: Optional[Path] = None) -> Optional[dict]:
+    """Read the snapshot from disk, or return None if it is missing or stale."""
+    path = path or snapshot_path()
+    try:
+        snapshot = json.loads(path.read_bytes())
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        # JSON has no sets; famous_artists was written as a sorted list
+        tables = snapshot["tables"]
+        tables["famous_artists"] = frozenset(tables["famous_artists"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    stats = _source_stats()
+    if snapshot.get("sources") == stats:
+        return snapshot
+    # Sources were touched (e.g. fresh checkout); only rebuild if content changed
+    if snapshot.get("digest") != _source_digest():
+        return None
+    snapshot["sources"] = stats
+    _save(snapshot, path)
+    return snapshot
+
+
+def load_snapshot() -> dict:
+    """Return the process-wide snapshot, rebuilding it if stale."""
+    global _SNAPSHOT
+    if _SNAPSHOT is None:
+        _SNAPSHOT = read_snapshot() or write_snapshot()
+    return _SNAPSHOT
@@ -0,0 +1,197 @@
+"""Persisted per-query yield statistics used to rank artist queries."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cache import cache_dir
+
+# Observations lose half their weight after this many days
+HALF_LIFE_DAYS = 14.0
+
+# Pseudo-requests at the platform's mean yield, so one lucky hit can't dominate
+PRIOR_REQUESTS = 2.0
+
+
+def type_key(types: Optional[Iterable[str]]) -> str:
+    """Canonical key for a set of type filters."""
+    return ",".join(sorted(t.lower().strip() for t in types or ()))
+
+
+@dataclass
+class QueryStats:
+    seen: float = 0.0
+    kept: float = 0.0
+    rejected: float = 0.0
+    requests: float = 0.0
+    updated: float = 0.0
+
+    def decayed(self, now: float, half_life_days: float) -> "QueryStats":
+        age_days = max(0.0, now - self.updated) / 86400
+        factor = 0.5 ** (age_days / half_life_days)
+        return QueryStats(
+            seen=self.seen * factor,
+            kept=self.kept * factor,
+            rejected=self.rejected * factor,
+            requests=self.requests * factor,
+            updated=now,
+        )
+
+    def plus(self, other: "QueryStats") -> "QueryStats":
+        """Sum of two sets of counts taken at the same time."""
+        return QueryStats(
+            seen=self.seen + other.seen,
+            kept=self.kept + other.kept,
+            rejected=self.rejected + other.rejected,
+            requests=self.requests + other.requests,
+            updated=max(self.updated, other.updated),
+        )
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_stats (
+    platform TEXT NOT NULL,
+    query TEXT NOT NULL,
+    types TEXT NOT NULL,
+    seen REAL NOT NULL,
+    kept REAL NOT NULL,
+    rejected REAL NOT NULL,
+    requests REAL NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (platform, query, types)
+);
+"""
+
+_FIELDS = ("seen", "kept", "rejected", "requests", "updated")
+
+StatsKey = Tuple[str, str, str]
+
+
+class QueryStatsStore:
+    """Per (platform, query, type) counts of candidates seen/kept/rejected and requests made.
+
+    Counts recorded by this process are kept apart from the stored ones and added to
+    whatever is stored when saved, so concurrent harvests don't overwrite each other.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, half_life_days: float = HALF_LIFE_DAYS) -> None:
+        self.path = path or cache_dir() / "query_stats.sqlite"
+        self.half_life_days = half_life_days
+        self._entries: Optional[Dict[StatsKey, QueryStats]] = None
+        self._pending: Dict[StatsKey, QueryStats] = {}
+
+    @staticmethod
+    def _key(platform: str, query: str, types: str) -> StatsKey:
+        return (platform, query.lower(), types)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Harvests sharing the cache dir wait for each other's saves
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _load(self) -> Dict[StatsKey, QueryStats]:
+        if self._entries is None:
+            self._entries = {}
+            if not self.path.exists():
+                return self._entries
+            try:
+                with closing(self._connect()) as conn:
+                    rows = conn.execute(f"SELECT platform, query, types, {', '.join(_FIELDS)} FROM query_stats").fetchall()
+            except (OSError, sqlite3.Error):
+                # A damaged store only costs the ranking; harvests run without it
+                return self._entries
+            for platform, query, types, *values in rows:
+                self._entries[(platform, query, types)] = QueryStats(*values)
+        return self._entries
+
+    def get(self, platform: str, query: str, types: str, *, now: Optional[float] = None) -> Optional[QueryStats]:
+        """Return decayed stats for a query, or None if it was never recorded."""
+        entry = self._load().get(self._key(platform, query, types))
+        if entry is None:
+            return None
+        return entry.decayed(time.time() if now is None else now, self.half_life_days)
+
+    def record(
+        self,
+        platform: str,
+        query: str,
+        types: str,
+        *,
+        seen: int = 0,
+        kept: int = 0,
+        rejected: int = 0,
+        requests: int = 0,
+        now: Optional[float] = None,
+    ) -> None:
+        now = time.time() if now is None else now
+        key = self._key(platform, query, types)
+        added = QueryStats(seen=seen, kept=kept, rejected=rejected, requests=requests, updated=now)
+        for entries in (self._load(), self._pending):
+            entry = entries.get(key)
+            entries[key] = added if entry is None else entry.decayed(now, self.half_life_days).plus(added)
+
+    def expected_yields(
+        self, platform: str, queries: List[str], types: str, *, now: Optional[float] = None
+    ) -> Dict[str, float]:
+        """Expected kept artworks per request for each query.
+
+        Unseen queries get the mean yield of the platform's queries for the same
+        types, so they rank above known poor performers but below known good ones.
+        """
+        now = time.time() if now is None else now
+        stats = {q: self.get(platform, q, types, now=now) for q in queries}
+        mean = self._platform_mean(platform, types, now)
+
+        yields = {}
+        for query, s in stats.items():
+            if s is None:
+                yields[query] = mean
+            else:
+                yields[query] = (s.kept + mean * PRIOR_REQUESTS) / (s.requests + PRIOR_REQUESTS)
+        return yields
+
+    def _platform_mean(self, platform: str, types: str, now: float) -> float:
+        """Kept artworks per request over the platform's recorded queries for ``types``.
+
+        Falls back to every type filter when none was recorded for ``types``.
+        """
+        entries = [(key, entry) for key, entry in self._load().items() if key[0] == platform]
+        for selected in ([e for key, e in entries if key[2] == types], [e for _, e in entries]):
+            known = [entry.decayed(now, self.half_life_days) for entry in selected]
+            total_requests = sum(s.requests for s in known)
+            if total_requests:
+                return sum(s.kept for s in known) / total_requests
+        return 0.0
+
+    def save(self) -> None:
+        """Add the counts recorded since the last save to the stored ones."""
+        if not self._pending:
+            return
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for key, added in self._pending.items():
+                    row = conn.execute(
+                        f"SELECT {', '.join(_FIELDS)} FROM query_stats WHERE platform = ? AND query = ? AND types = ?",
+                        key,
+                    ).fetchone()
+                    entry = added.decayed(now, self.half_life_days)
+                    if row is not None:
+                        entry = QueryStats(*row).decayed(now, self.half_life_days).plus(entry)
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO query_stats (platform, query, types, {', '.join(_FIELDS)}) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (*key, entry.seen, entry.kept, entry.rejected, entry.requests, entry.updated),
+                    )
+                conn.execute("COMMIT")
+        except (OSError, sqlite3.Error):
+            return
+        self._pending = {}
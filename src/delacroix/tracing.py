@@ -0,0 +1,85 @@
+"""Lightweight spans written as a Chrome trace (viewable in Perfetto or chrome://tracing)."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+
+def now_us() -> float:
+    """Monotonic timestamp in microseconds, comparable across processes on one host."""
+    return time.perf_counter_ns() / 1000
+
+
+class Tracer:
+    """Collects complete ("X") trace events; call ``write`` to save them."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        name: str,
+        start_us: float,
+        duration_us: float,
+        *,
+        cat: str = "harvest",
+        pid: Optional[int] = None,
+        tid: Optional[int] = None,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a span that has already finished, possibly in another process."""
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start_us,
+            "dur": duration_us,
+            "pid": os.getpid() if pid is None else pid,
+            "tid": threading.get_ident() if tid is None else tid,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, *, cat: str = "harvest", **args: Any) -> Iterator[Dict[str, Any]]:
+        """Time the block as a span; the yielded dict can take extra args."""
+        start = now_us()
+        try:
+            yield args
+        finally:
+            self.add(name, start, now_us() - start, cat=cat, args=args)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._events)
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+
+class NullTracer(Tracer):
+    """Tracer that records nothing, so call sites needn't check for one."""
+
+    enabled = False
+
+    def add(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def span(self, name: str, *, cat: str = "harvest", **args: Any) -> ContextManager[Dict[str, Any]]:
+        return nullcontext(args)
+
+
+NULL_TRACER = NullTracer()
@@ -0,0 +1,94 @@
+"""Cheap accept/reject checks on small image variants before the full download."""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from PIL import Image, ImageStat, UnidentifiedImageError
+
+from .types import normalize_type
+
+# Width requested from IIIF servers for triage thumbnails
+THUMBNAIL_SIZE = 200
+
+# Largest thumbnail body we are willing to read
+MAX_THUMBNAIL_BYTES = 2 * 1024 * 1024
+
+HASH_SIZE = 8
+
+# Artwork types that are often black and white; the monochrome check is skipped when one is requested
+MONOCHROME_TYPES = ("photograph", "drawing", "print")
+
+
+@dataclass(frozen=True)
+class TriageOptions:
+    # Thumbnails smaller than this (shorter side, px) suggest a tiny or broken source
+    min_thumbnail_side: int = 64
+    # Luminance standard deviation below which an image is treated as blank
+    min_contrast: float = 8.0
+    # Mean saturation (0-255) below which an image is treated as near-monochrome
+    min_saturation: float = 10.0
+    # Hamming distance between average hashes at or below which images are duplicates
+    duplicate_distance: int = 4
+
+
+def average_hash(img: Image.Image, size: int = HASH_SIZE) -> int:
+    """64-bit average hash of an image."""
+    small = img.convert("L").resize((size, size), Image.Resampling.BOX)
+    pixels = list(small.getdata())
+    mean = sum(pixels) / len(pixels)
+    bits = 0
+    for value in pixels:
+        bits = (bits << 1) | (value > mean)
+    return bits
+
+
+class ThumbnailTriage:
+    """Rejects thumbnails that are vertical, tiny, blank, near-monochrome or duplicates.
+
+    Hashes of accepted thumbnails are remembered, so one instance should be
+    used per harvest. When the requested ``types`` include one of
+    ``MONOCHROME_TYPES``, low saturation is not a reason to reject.
+    """
+
+    def __init__(self, options: Optional[TriageOptions] = None, *, types: Optional[Iterable[str]] = None) -> None:
+        self.options = options or TriageOptions()
+        self.check_saturation = not any(normalize_type(t) in MONOCHROME_TYPES for t in types or ())
+        self.checked = 0
+        self.rejected = 0
+        self._hashes: List[int] = []
+
+    def check(self, data: bytes) -> Optional[str]:
+        """Return a rejection reason for the thumbnail, or None if it passes."""
+        self.checked += 1
+        reason = self._reason(data)
+        if reason is not None:
+            self.rejected += 1
+        return reason
+
+    def _reason(self, data: bytes) -> Optional[str]:
+        options = self.options
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                width, height = img.size
+                if width < height:
+                    return "vertical"
+                if min(width, height) < options.min_thumbnail_side:
+                    return "too_small"
+                rgb = img.convert("RGB")
+        except (UnidentifiedImageError, OSError):
+            # Not an image we can judge; leave the decision to the full download
+            return None
+
+        if ImageStat.Stat(rgb.convert("L")).stddev[0] < options.min_contrast:
+            return "blank"
+        if self.check_saturation and ImageStat.Stat(rgb.convert("HSV")).mean[1] < options.min_saturation:
+            return "monochrome"
+
+        image_hash = average_hash(rgb)
+        if any(bin(image_hash ^ seen).count("1") <= options.duplicate_distance for seen in self._hashes):
+            return "duplicate"
+        self._hashes.append(image_hash)
+        return None
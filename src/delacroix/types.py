@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple
 
 # Common artwork types that users can filter by
 ARTWORK_TYPES = {
@@ -21,10 +25,30 @@ ARTWORK_TYPES = {
     "book": ["book", "books", "album"],
 }
 
-# Platform-specific type mappings
+# Terms that disqualify a candidate for a type even when a type keyword matches;
+# only applied on platforms that name ``exclude_field_names``
+EXCLUDE_TERMS = {
+    "painting": ["drawing", "print", "sketch", "watercolor", "etching", "lithograph", "engraving"],
+}
+
+# Platform-specific type mappings. ``field_names`` are searched for type
+# keywords, ``exclude_field_names`` for exclude terms and ``tag_field_names``
+# for tags; the keys are those of the platform's raw records. Exclusions are
+# limited to structured type/medium fields: free text such as titles ("Study
+# for a Painting", "The Print Seller") would drop works of the requested type.
 PLATFORM_TYPE_FIELDS = {
     "met": {
-        "field_names": ["classification", "objectName", "medium"],
+        # Not medium: "gelatin silver print" would make photographs match print
+        "field_names": ["classification", "objectName"],
+        "tag_field_names": [
+            "artistDisplayName",
+            "culture",
+            "objectDate",
+            "classification",
+            "medium",
+            "artistNationality",
+            "period",
+        ],
         "available_types": [
             "painting",
             "drawing",
@@ -41,8 +65,36 @@ PLATFORM_TYPE_FIELDS = {
             "book",
         ],
     },
+    "chicago": {
+        "field_names": ["artwork_type_title", "classification_title"],
+        "exclude_field_names": ["artwork_type_title", "classification_title", "medium_display"],
+        "tag_field_names": [],
+        "available_types": [
+            "painting",
+            "drawing",
+            "photograph",
+            "print",
+            "sculpture",
+            "textile",
+        ],
+    },
     "nga": {
-        "field_names": ["classification", "medium"],
+        "field_names": ["classification", "title"],
+        "tag_field_names": ["title", "artist"],
+        "available_types": [
+            "painting",
+            "drawing",
+            "photograph",
+            "print",
+            "sculpture",
+        ],
+    },
+    "rijksmuseum": {
+        "field_names": ["objectTypes"],
+        "exclude_field_names": ["objectTypes"],
+        # Searches are already narrowed by the Dutch tags; other tags (e.g. european,
+        # 1800s) don't appear in the records' text, so they don't filter here
+        "tag_field_names": [],
         "available_types": [
             "painting",
             "drawing",
@@ -52,7 +104,8 @@ PLATFORM_TYPE_FIELDS = {
         ],
     },
     "louvre": {
-        "field_names": ["objectType", "category"],
+        "field_names": ["objectType", "category", "title"],
+        "tag_field_names": ["title", "artist"],
         "available_types": [
             "painting",
             "drawing",
@@ -65,23 +118,160 @@ PLATFORM_TYPE_FIELDS = {
     },
 }
 
+# Fields of ``Artwork`` used when no platform mapping applies
+DEFAULT_TYPE_FIELDS = ["classification", "title"]
+DEFAULT_TAG_FIELDS = ["title", "artist", "culture", "date", "classification"]
+
+# Reverse lookup from any variant to its canonical type (first match wins)
+_CANONICAL_TYPES: Dict[str, str] = {}
+for _canonical, _variants in ARTWORK_TYPES.items():
+    for _variant in [_canonical, *_variants]:
+        _CANONICAL_TYPES.setdefault(_variant, _canonical)
+
 
 def normalize_type(type_str: str) -> str:
     """Normalize a type string to a canonical form."""
     type_lower = type_str.lower().strip()
-    for canonical, variants in ARTWORK_TYPES.items():
-        if type_lower in variants or type_lower == canonical:
-            return canonical
-    return type_lower
+    return _CANONICAL_TYPES.get(type_lower, type_lower)
 
 
 def get_type_keywords(type_filter: str) -> List[str]:
     """Get all keyword variants for a given type filter."""
     type_lower = type_filter.lower().strip()
-    for canonical, variants in ARTWORK_TYPES.items():
-        if type_lower in variants or type_lower == canonical:
-            return variants
-    return [type_lower]
+    canonical = _CANONICAL_TYPES.get(type_lower)
+    if canonical is None:
+        return [type_lower]
+    return ARTWORK_TYPES[canonical]
+
+
+def _tag_term(tag: str) -> str:
+    tag_lower = tag.lower().strip()
+    # Century/decade tags like "1800s" match years such as "1800" or "1800-1810"
+    if tag_lower.endswith("s") and tag_lower[:-1].isdigit():
+        return tag_lower[:-1]
+    return tag_lower
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> Optional[Pattern[str]]:
+    # Longest first so alternation prefers the most specific keyword
+    unique = sorted({k for k in keywords if k}, key=lambda k: (-len(k), k))
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(k) for k in unique))
+
+
+def _field_text(record: Mapping[str, Any], fields: Sequence[str]) -> str:
+    parts = []
+    for field in fields:
+        value = record.get(field)
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            parts.extend(str(v) for v in value)
+        else:
+            parts.append(str(value))
+    # Newlines keep keywords from matching across field boundaries
+    return "\n".join(parts).lower()
+
+
+def _batch_search(pattern: Pattern[str], texts: List[str]) -> List[bool]:
+    """Search many texts with one regex pass over their concatenation."""
+    hits = [False] * len(texts)
+    if not texts:
+        return hits
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    joined = "\x00".join(texts)
+    pos = 0
+    while True:
+        match = pattern.search(joined, pos)
+        if match is None:
+            break
+        idx = bisect_right(starts, match.start()) - 1
+        hits[idx] = True
+        # Skip to the next record; one hit per record is enough
+        if idx + 1 >= len(starts):
+            break
+        pos = starts[idx + 1]
+    return hits
+
+
+@dataclass(frozen=True)
+class ArtworkFilter:
+    """Precompiled include/exclude/tag predicate over raw artwork records."""
+
+    type_fields: Tuple[str, ...]
+    exclude_fields: Tuple[str, ...]
+    tag_fields: Tuple[str, ...]
+    include: Optional[Pattern[str]] = None
+    exclude: Optional[Pattern[str]] = None
+    tags: Optional[Pattern[str]] = None
+
+    def matches(self, record: Mapping[str, Any]) -> bool:
+        if self.include is not None and not self.include.search(_field_text(record, self.type_fields)):
+            return False
+        if self.exclude is not None and self.exclude.search(_field_text(record, self.exclude_fields)):
+            return False
+        if self.tags is not None and not self.tags.search(_field_text(record, self.tag_fields)):
+            return False
+        return True
+
+    def matches_many(self, records: Sequence[Mapping[str, Any]]) -> List[bool]:
+        """Evaluate the predicate over many records at once."""
+        result = [True] * len(records)
+        checks = [
+            (self.include, self.type_fields, True),
+            (self.exclude, self.exclude_fields, False),
+            (self.tags, self.tag_fields, True),
+        ]
+        for pattern, fields, wanted in checks:
+            if pattern is None:
+                continue
+            hits = _batch_search(pattern, [_field_text(r, fields) for r in records])
+            result = [ok and hit == wanted for ok, hit in zip(result, hits)]
+        return result
+
+
+@lru_cache(maxsize=128)
+def _compile_filter(platform: Optional[str], types: Tuple[str, ...], tags: Tuple[str, ...]) -> ArtworkFilter:
+    fields = PLATFORM_TYPE_FIELDS.get(platform or "", {})
+    type_fields = tuple(fields.get("field_names", DEFAULT_TYPE_FIELDS))
+    exclude_fields = tuple(fields.get("exclude_field_names", ()))
+    tag_fields = tuple(fields.get("tag_field_names", DEFAULT_TAG_FIELDS))
+
+    include_terms = {k.lower() for t in types for k in get_type_keywords(t)}
+    exclude_terms = set()
+    if exclude_fields:
+        exclude_terms = {term for t in types for term in EXCLUDE_TERMS.get(normalize_type(t), [])}
+        # Never exclude something another requested type asks for
+        exclude_terms -= include_terms
+
+    return ArtworkFilter(
+        type_fields=type_fields,
+        exclude_fields=exclude_fields,
+        tag_fields=tag_fields,
+        include=_keyword_pattern(include_terms),
+        exclude=_keyword_pattern(exclude_terms),
+        tags=_keyword_pattern(_tag_term(t) for t in tags) if tag_fields else None,
+    )
+
+
+def compile_filter(
+    types: Optional[Iterable[str]] = None,
+    tags: Optional[Iterable[str]] = None,
+    platform: Optional[str] = None,
+) -> ArtworkFilter:
+    """Compile ``--types``/``--tags`` into a predicate over a platform's raw records."""
+    return _compile_filter(platform, tuple(types or ()), tuple(tags or ()))
+
+
+def compile_filter_cache_info() -> Tuple[int, int]:
+    """Hits and misses of the compiled filter cache so far."""
+    info = _compile_filter.cache_info()
+    return info.hits, info.misses
 
 
 def list_available_types(platform: str = None) -> List[str]:
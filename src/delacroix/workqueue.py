@@ -0,0 +1,345 @@
+"""Shared work queue for sharded harvests: one coordinator discovers, N workers download and render.
+
+The queue is a SQLite file on a filesystem every worker can reach. Candidates are
+assigned to a shard by a stable hash of their ID; workers lease items from their
+own shard (and, once they've waited too long, from others), so a crashed worker's
+leases expire and its items are picked up again. Leases are only granted while
+``kept + active leases < max_items``, so the global ``max_items`` is never exceeded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+from .events import Event, EventSink
+from .platforms.base import Artwork
+
+if TYPE_CHECKING:
+    from .core import Harvester, HarvestResult
+
+DEFAULT_LEASE_SECONDS = 600.0
+
+# Pending items of another shard become claimable after waiting this long
+DEFAULT_STEAL_AFTER = 60.0
+
+# An item whose lease expires this many times is marked failed instead of retried
+MAX_ATTEMPTS = 3
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    platform TEXT NOT NULL,
+    id TEXT NOT NULL,
+    shard INTEGER NOT NULL,
+    artwork TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    reason TEXT,
+    enqueued_at REAL NOT NULL,
+    PRIMARY KEY (platform, id)
+);
+CREATE INDEX IF NOT EXISTS items_claim ON items (state, shard);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Harvester outcome events mapped to final item states
+_OUTCOME_STATES = {"kept": "kept", "skipped": "skipped", "failed": "failed"}
+
+
+def shard_for(platform: str, artwork_id: str, shards: int) -> int:
+    """Stable shard of an artwork, the same on every host and Python version."""
+    return zlib.crc32(f"{platform}:{artwork_id}".encode("utf-8")) % shards
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@dataclass(frozen=True)
+class QueueStatus:
+    pending: int
+    leased: int
+    kept: int
+    skipped: int
+    failed: int
+    max_items: int
+    discovery_done: bool
+
+    @property
+    def finished(self) -> bool:
+        return self.kept >= self.max_items or (self.discovery_done and not self.pending and not self.leased)
+
+
+class WorkQueue:
+    """Lease-based queue of candidate artworks in a SQLite file."""
+
+    def __init__(self, path: Path, *, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> None:
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit; transactions are explicit. Rollback journal rather than WAL,
+            # which needs shared memory and so doesn't work across hosts.
+            self._conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _transaction(self):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        return conn
+
+    def _commit(self, conn: sqlite3.Connection, ok: bool) -> None:
+        conn.execute("COMMIT" if ok else "ROLLBACK")
+
+    def initialize(self, *, shards: int, max_items: int, config: Dict[str, Any]) -> None:
+        """Set up a run; ``config`` is whatever workers need to build their Harvester."""
+        conn = self._transaction()
+        try:
+            values = {"shards": shards, "max_items": max_items, "config": config, "discovery_done": False}
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in values.items()],
+            )
+        except BaseException:
+            self._commit(conn, False)
+            raise
+        self._commit(conn, True)
+
+    def meta(self, key: str, default: Any = None) -> Any:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row else default
+
+    def enqueue(self, platform: str, artworks: Iterable[Artwork]) -> int:
+        """Add candidates; ones already queued (by platform and ID) are ignored. Returns how many were new."""
+        shards = self.meta("shards", 1)
+        now = time.time()
+        rows = [
+            (platform, a.id, shard_for(platform, a.id, shards), json.dumps(asdict(a)), now)
+            for a in artworks
+        ]
+        conn = self._transaction()
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO items (platform, id, shard, artwork, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = conn.total_changes - before
+        except BaseException:
+            self._commit(conn, False)
+            raise
+        self._commit(conn, True)
+        return added
+
+    def finish_discovery(self) -> None:
+        self._connect().execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('discovery_done', 'true')")
+
+    def status(self) -> QueueStatus:
+        conn = self._connect()
+        now = time.time()
+        counts: Dict[str, int] = {}
+        for row in conn.execute(
+            "SELECT CASE WHEN state = 'leased' AND lease_expires < ? THEN 'pending' ELSE state END AS s, "
+            "COUNT(*) AS n FROM items GROUP BY s",
+            (now,),
+        ):
+            counts[row["s"]] = row["n"]
+        return QueueStatus(
+            pending=counts.get("pending", 0),
+            leased=counts.get("leased", 0),
+            kept=counts.get("kept", 0),
+            skipped=counts.get("skipped", 0),
+            failed=counts.get("failed", 0),
+            max_items=self.meta("max_items", 0),
+            discovery_done=self.meta("discovery_done", False),
+        )
+
+    def claim(self, shard: int, owner: str, *, steal_after: float = DEFAULT_STEAL_AFTER) -> Optional[Artwork]:
+        """Lease the next item for ``shard``, or None if nothing is available right now."""
+        now = time.time()
+        conn = self._transaction()
+        try:
+            # Leases that expired too often are given up on
+            conn.execute(
+                "UPDATE items SET state = 'failed', reason = 'lease expired', owner = NULL "
+                "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, MAX_ATTEMPTS),
+            )
+            kept = conn.execute("SELECT COUNT(*) FROM items WHERE state = 'kept'").fetchone()[0]
+            active = conn.execute(
+                "SELECT COUNT(*) FROM items WHERE state = 'leased' AND lease_expires >= ?", (now,)
+            ).fetchone()[0]
+            row = None
+            if kept + active < self.meta("max_items", 0):
+                row = conn.execute(
+                    "SELECT platform, id, artwork FROM items "
+                    "WHERE (state = 'pending' OR (state = 'leased' AND lease_expires < ?)) "
+                    "AND (shard = ? OR enqueued_at < ?) "
+                    "ORDER BY shard != ?, enqueued_at LIMIT 1",
+                    (now, shard, now - steal_after, shard),
+                ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE items SET state = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1 "
+                    "WHERE platform = ? AND id = ?",
+                    (owner, now + self.lease_seconds, row["platform"], row["id"]),
+                )
+        except BaseException:
+            self._commit(conn, False)
+            raise
+        self._commit(conn, True)
+        return Artwork(**json.loads(row["artwork"])) if row is not None else None
+
+    def renew(self, owner: str) -> None:
+        """Extend every lease ``owner`` holds."""
+        self._connect().execute(
+            "UPDATE items SET lease_expires = ? WHERE owner = ? AND state = 'leased'",
+            (time.time() + self.lease_seconds, owner),
+        )
+
+    def leased_by(self, owner: str) -> int:
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM items WHERE state = 'leased' AND owner = ?", (owner,)
+        ).fetchone()[0]
+
+    def leased_by_others(self, owner: str) -> int:
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM items WHERE state = 'leased' AND lease_expires >= ? AND owner != ?",
+            (time.time(), owner),
+        ).fetchone()[0]
+
+    def complete(self, platform: str, artwork_id: str, owner: str, state: str, reason: Optional[str] = None) -> None:
+        """Record an item's outcome; ignored if ``owner``'s lease was lost to another worker."""
+        self._connect().execute(
+            "UPDATE items SET state = ?, reason = ?, owner = NULL, lease_expires = NULL "
+            "WHERE platform = ? AND id = ? AND owner = ? AND state = 'leased'",
+            (state, reason, platform, artwork_id, owner),
+        )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def enqueue_candidates(
+    queue: WorkQueue,
+    platform: str,
+    candidates: Iterable[Artwork],
+    *,
+    batch_size: int = 32,
+    depth: int = 256,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> int:
+    """Coordinator loop: feed discovered candidates to the queue until the run has enough.
+
+    Discovery pauses while ``depth`` items are waiting, and stops once ``max_items``
+    are kept. Returns the number of candidates queued.
+    """
+    queued = 0
+    batch: List[Artwork] = []
+    iterator = iter(candidates)
+    try:
+        for artwork in iterator:
+            batch.append(artwork)
+            if len(batch) < batch_size:
+                continue
+            queued += queue.enqueue(platform, batch)
+            batch = []
+            while True:
+                status = queue.status()
+                if status.kept >= status.max_items:
+                    return queued
+                if status.pending < depth:
+                    break
+                time.sleep(poll_interval)
+        queued += queue.enqueue(platform, batch)
+        return queued
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        queue.finish_discovery()
+
+
+def leased_candidates(
+    queue: WorkQueue,
+    shard: int,
+    owner: str,
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> Iterator[Artwork]:
+    """Yield leased artworks until none can be claimed while this worker still holds leases.
+
+    Stopping then lets the Harvester finish the worker's in-flight items, which frees
+    their slots under ``max_items``; ``run_worker`` calls this again until the run is done.
+    """
+    while True:
+        queue.renew(owner)
+        artwork = queue.claim(shard, owner)
+        if artwork is not None:
+            yield artwork
+            continue
+        if queue.leased_by(owner) or queue.status().finished:
+            return
+        # Waiting on discovery, or on other workers whose leases may yet expire
+        time.sleep(poll_interval)
+
+
+def run_worker(
+    harvester: "Harvester",
+    queue: WorkQueue,
+    shard: int,
+    output_dir: Path,
+    *,
+    tags: Optional[List[str]] = None,
+    types: Optional[List[str]] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> List["HarvestResult"]:
+    """Harvest leased candidates from ``queue`` until the run is finished; one result per pass."""
+    owner = worker_id()
+    harvester.platform.events.sinks.append(QueueOutcomeSink(queue, owner))
+    results = []
+    while not queue.status().finished:
+        candidates = leased_candidates(queue, shard, owner, poll_interval=poll_interval)
+        # The queue enforces the global max_items; this only bounds a single pass
+        max_items = queue.meta("max_items", 0)
+        # Items are marked kept in the queue as they're reported, so they must be in the manifest by then
+        results.append(
+            harvester.harvest(
+                output_dir, max_items=max_items, tags=tags, types=types, candidates=candidates, flush_kept=True
+            )
+        )
+    return results
+
+
+class QueueOutcomeSink(EventSink):
+    """Marks leased items done as the worker's Harvester reports their outcomes."""
+
+    def __init__(self, queue: WorkQueue, owner: str) -> None:
+        self.queue = queue
+        self.owner = owner
+
+    def handle(self, event: Event) -> None:
+        state = _OUTCOME_STATES.get(event["event"])
+        if state is not None:
+            reason = event.get("reason") or event.get("error")
+            self.queue.complete(event["platform"], event["id"], self.owner, state, reason)
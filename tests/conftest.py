@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep every store a test opens out of the user's cache directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("DELACROIX_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture
+def museum(cache_dir):
+    """A local fake museum serving every platform's API."""
+    from delacroix.bench import FakeMuseum
+
+    with FakeMuseum(objects=120) as server:
+        yield server
+
+
+@pytest.fixture
+def make_harvester(museum):
+    """Build a Harvester for a platform served by the fake museum, rendering small and inline."""
+    from delacroix.core import Harvester
+    from delacroix.events import EventBus
+    from delacroix.platforms.registry import get_platform
+
+    def make(name, *, max_download_bytes=None, **options):
+        platform_options = {"max_download_bytes": max_download_bytes} if max_download_bytes else {}
+        platform = museum.configure(get_platform(name, events=EventBus(), **platform_options))
+        options.setdefault("target_size", (320, 180))
+        options.setdefault("workers", 0)
+        return Harvester(platform, **options)
+
+    return make
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from delacroix.catalog import Catalog
+from delacroix.platforms.base import Artwork
+
+
+def art(n: int) -> Artwork:
+    return Artwork(id=str(n), title=f"Harbor {n}", artist="Claude Monet", image_url=f"http://x/{n}.jpg")
+
+
+def statuses(catalog: Catalog):
+    return {row["id"]: (row["status"], row["reason"]) for row in catalog.search(limit=None)}
+
+
+def test_discovery_never_replaces_an_outcome(tmp_path):
+    with Catalog(tmp_path / "catalog.sqlite") as catalog:
+        catalog.record("met", art(1), "kept")
+        catalog.record("met", art(1))
+        catalog.record("met", art(1), "rejected", reason="filtered")
+        catalog.record("met", art(2), "rejected", reason="filtered")
+        catalog.record("met", art(3))
+        catalog.record("met", art(3), "rejected", reason="filtered")
+        catalog.record("met", art(4), "rejected", reason="filtered")
+        catalog.record("met", art(4))
+        assert statuses(catalog) == {
+            "1": ("kept", None),
+            "2": ("rejected", "filtered"),
+            "3": ("rejected", "filtered"),
+            "4": ("seen", None),
+        }
+        assert {row["id"]: row["times_seen"] for row in catalog.search(limit=None)} == {"1": 2, "2": 1, "3": 2, "4": 2}
+
+
+def test_filtered_objects_are_cataloged_with_the_reason(make_harvester, tmp_path):
+    catalog = Catalog(tmp_path / "catalog.sqlite")
+    harvest = make_harvester("met", catalog=catalog)
+    # Every fake object is a painting
+    result = harvest.harvest(tmp_path / "out", max_items=5, types=["drawing"])
+    assert result.downloaded == 0
+    recorded = statuses(catalog)
+    assert len(recorded) >= 30
+    assert set(recorded.values()) == {("rejected", "filtered")}
+    catalog.close()
+
+
+def test_every_fetched_object_is_cataloged(make_harvester, tmp_path):
+    catalog = Catalog(tmp_path / "catalog.sqlite")
+    harvest = make_harvester("met", catalog=catalog)
+    result = harvest.harvest(tmp_path / "out", max_items=2)
+    recorded = statuses(catalog)
+    kept = [key for key, (status, _) in recorded.items() if status == "kept"]
+    assert len(kept) == result.downloaded == 2
+    # Works fetched but never handed to the harvester, e.g. still buffered when it stopped
+    assert sum(status == "seen" for status, _ in recorded.values()) > 2
+    catalog.close()
+
+
+def test_offline_discovery_uses_what_online_runs_fetched(museum, make_harvester, tmp_path):
+    catalog = Catalog(tmp_path / "catalog.sqlite")
+    # Nothing matches online, but every fetched object is cataloged
+    online = make_harvester("met", catalog=catalog).harvest(tmp_path / "out", max_items=5, types=["drawing"])
+    assert online.downloaded == 0
+
+    candidates = list(catalog.candidates("met", types=["painting"]))
+    assert len(candidates) > 20
+
+    museum.stats.reset()
+    offline = make_harvester("met", catalog=catalog, offline_discovery=True)
+    result = offline.harvest(tmp_path / "out", max_items=10, types=["painting"])
+    assert result.downloaded == 10
+    # Only image bytes went online
+    assert set(museum.stats.durations) == {"image"}
+    catalog.close()
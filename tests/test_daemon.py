@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from delacroix.daemon import LibraryDaemon
+
+
+def test_evicted_artworks_stay_out_after_a_restart(make_harvester, tmp_path):
+    library = tmp_path / "library"
+    daemon = LibraryDaemon(make_harvester("met"), library, target_count=3, refresh_fraction=0.5)
+    daemon.run_cycle()
+    first = {entry.key for entry in daemon.entries()}
+    daemon.run_cycle()
+    evicted = first - {entry.key for entry in daemon.entries()}
+    assert len(evicted) == 2
+
+    # A new daemon starts again from the first cycle's query order
+    restarted = LibraryDaemon(make_harvester("met"), library, target_count=3, refresh_fraction=0.5)
+    assert restarted._evicted == evicted
+    restarted.run_cycle()
+    assert not evicted & {entry.key for entry in restarted.entries()}
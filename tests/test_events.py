@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import re
+
+from delacroix.events import EventBus, PrometheusTextfile
+
+
+def test_artwork_counters_share_one_label_set(tmp_path):
+    sink = PrometheusTextfile(tmp_path / "delacroix.prom")
+    bus = EventBus([sink])
+    bus.emit("discovered", platform="met")
+    bus.emit("kept", platform="met", bytes=10, latency_s=1.0)
+    bus.emit("skipped", platform="met", reason="vertical")
+    bus.emit("failed", platform="met", reason="OSError('disk full')")
+    bus.close()
+
+    samples = [line for line in (tmp_path / "delacroix.prom").read_text().splitlines()
+               if line.startswith("delacroix_artworks_total{")]
+    assert len(samples) == 4
+    assert {tuple(re.findall(r'(\w+)="', line)) for line in samples} == {("platform", "outcome", "reason")}
+    assert 'delacroix_artworks_total{platform="met",outcome="skipped",reason="vertical"} 1' in samples
+    assert 'delacroix_artworks_total{platform="met",outcome="failed",reason=""} 1' in samples
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import io
+import itertools
+
+import pytest
+from PIL import Image
+
+
+@pytest.mark.parametrize("name", ["chicago", "rijksmuseum"])
+def test_oversize_download_fails_instead_of_missing_image(make_harvester, tmp_path, name):
+    outcomes = make_harvester(name, max_download_bytes=1000).iter_harvest(tmp_path / "out", max_items=2)
+    first = list(itertools.islice(outcomes, 2))
+    outcomes.close()
+    assert [o.status for o in first] == ["failed", "failed"]
+    assert all("byte limit" in o.reason for o in first)
+
+
+def test_ratios_sharing_a_label_are_rejected(make_harvester):
+    with pytest.raises(ValueError):
+        make_harvester("met", aspect_ratio=(16 / 9, 1.778))
+
+
+def truncated_jpeg() -> bytes:
+    buffer = io.BytesIO()
+    Image.effect_noise((640, 360), 64).convert("RGB").save(buffer, format="JPEG")
+    return buffer.getvalue()[:2000]
+
+
+def leftovers(output_dir):
+    return sorted(p.name for p in output_dir.iterdir() if not p.name.startswith("library."))
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_failed_render_leaves_no_files(make_harvester, tmp_path, workers):
+    harvest = make_harvester("met", workers=workers, sidecars=True)
+    data = truncated_jpeg()
+
+    def download(artwork, output_dir):
+        path = output_dir / f"met-{artwork.id}.jpg"
+        path.write_bytes(data)
+        return path
+
+    harvest.platform.download_image = download
+    outcomes = harvest.iter_harvest(tmp_path / "out", max_items=2)
+    failed = list(itertools.islice(outcomes, 3))
+    outcomes.close()
+    assert [o.status for o in failed] == ["failed"] * 3
+    assert leftovers(tmp_path / "out") == []
+
+
+def test_failed_keep_removes_its_sidecar(make_harvester, tmp_path, monkeypatch):
+    harvest = make_harvester("met", sidecars=True)
+    write_sidecar = harvest._write_sidecar
+
+    def disk_full(image_path, artwork):
+        write_sidecar(image_path, artwork)
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(harvest, "_write_sidecar", disk_full)
+    outcomes = harvest.iter_harvest(tmp_path / "out", max_items=1)
+    outcome = next(outcomes)
+    outcomes.close()
+    assert outcome.status == "failed"
+    assert leftovers(tmp_path / "out") == []
+    assert not (tmp_path / "out" / "library.jsonl").exists()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from delacroix.library import JsonlManifest, ManifestWriter, open_manifest
+
+
+def record(n: int, **fields):
+    return {"platform": "met", "id": str(n), "title": f"Harbor {n}", "files": [], "bytes": 0, "added_at": n, **fields}
+
+
+def lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.mark.parametrize("format", ["jsonl", "sqlite"])
+def test_latest_record_wins_and_removals_hide(tmp_path, format):
+    manifest = open_manifest(tmp_path, format)
+    manifest.write([record(1), record(2), record(1, title="Harbor at Dusk")])
+    manifest.remove([("met", "2")])
+    assert {r["id"]: r["title"] for r in manifest.records()} == {"1": "Harbor at Dusk"}
+    assert manifest.mark_displayed([("met", "1"), ("met", "2")], when=5.0) == 1
+    assert [r["displayed_at"] for r in manifest.records()] == [5.0]
+    manifest.close()
+
+
+def test_compact_keeps_only_live_records(tmp_path):
+    path = tmp_path / "library.jsonl"
+    manifest = JsonlManifest(path)
+    manifest.write([record(1), record(2), record(3)])
+    manifest.write([record(1, title="Harbor at Dusk")])
+    manifest.remove([("met", "2")])
+    with open(path, "ab") as f:
+        f.write(b'{"platform": "met", "id": "4", "tit')
+    before = sorted(manifest.records(), key=lambda r: r["id"])
+
+    manifest.compact()
+    assert sorted(lines(path), key=lambda r: r["id"]) == before
+    assert [r["id"] for r in before] == ["1", "3"]
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    # Writes after compacting go to the new file
+    manifest.write([record(5)])
+    assert sorted(r["id"] for r in manifest.records()) == ["1", "3", "5"]
+    manifest.close()
+
+
+def test_compact_without_a_log(tmp_path):
+    manifest = JsonlManifest(tmp_path / "library.jsonl")
+    manifest.compact()
+    assert list(manifest.records()) == []
+
+
+def test_writer_batches_records(tmp_path):
+    path = tmp_path / "library.jsonl"
+    with ManifestWriter(JsonlManifest(path), batch_size=2) as writer:
+        writer.add(record(1))
+        assert not path.exists()
+        writer.add(record(2))
+        assert len(lines(path)) == 2
+        writer.add(record(3))
+    assert len(lines(path)) == 3
+
+
+@pytest.mark.parametrize("format", ["jsonl", "sqlite"])
+def test_evictions_are_remembered_until_added_again(tmp_path, format):
+    manifest = open_manifest(tmp_path, format)
+    manifest.write([record(1), record(2), record(3)])
+    manifest.remove([("met", "1"), ("met", "2")], evicted=True)
+    manifest.remove([("met", "3")])
+    manifest.compact()
+    manifest.close()
+
+    manifest = open_manifest(tmp_path, format)
+    assert manifest.evicted() == {("met", "1"), ("met", "2")}
+    assert list(manifest.records()) == []
+    manifest.write([record(2)])
+    assert manifest.evicted() == {("met", "1")}
+    manifest.close()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+
+from delacroix.bench import FakeMuseum
+from delacroix.events import EventBus
+from delacroix.platforms.registry import get_platform
+
+
+def test_csv_bytes_counted_as_read(cache_dir):
+    with FakeMuseum(objects=5000) as museum:
+        platform = museum.configure(get_platform("nga", events=EventBus()))
+        full = len(museum.respond("/nga/published_images.csv", {})[2])
+
+        assert len(list(platform._nga_candidates(5))) == 5
+        counted = platform.http.stats.hosts[urlsplit(museum.base_url).netloc].bytes
+        assert 0 < counted < full // 2
+
+        platform.http.stats.reset()
+        assert len(list(platform._nga_candidates(10_000))) > 5
+        assert platform.http.stats.hosts[urlsplit(museum.base_url).netloc].bytes == full
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from delacroix.platforms.base import Artwork, PriorityBuffer
+
+
+def art(n: int) -> Artwork:
+    return Artwork(id=str(n), title=f"Work {n}", artist="Someone", image_url=None)
+
+
+def test_famous_works_stream_immediately():
+    buffer = PriorityBuffer()
+    assert list(buffer.push(art(1), famous=False)) == []
+    assert list(buffer.push(art(2), famous=True)) == [art(2)]
+    assert (buffer.famous, buffer.regular) == (1, 1)
+
+
+def test_regular_works_wait_at_most_one_query():
+    buffer = PriorityBuffer()
+    list(buffer.push(art(1), famous=False))
+    list(buffer.push(art(2), famous=False))
+    assert list(buffer.end_query()) == [art(1), art(2)]
+    assert list(buffer.drain()) == []
+
+
+def test_regular_works_held_for_max_queries():
+    buffer = PriorityBuffer(max_queries=2)
+    list(buffer.push(art(1), famous=False))
+    assert list(buffer.end_query()) == []
+    list(buffer.push(art(2), famous=False))
+    assert list(buffer.end_query()) == [art(1)]
+    assert list(buffer.drain()) == [art(2)]
+
+
+def test_capacity_releases_oldest():
+    buffer = PriorityBuffer(capacity=2)
+    released = [a for n in range(4) for a in buffer.push(art(n), famous=False)]
+    assert released == [art(0), art(1)]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from delacroix.render import aspect_label, parse_aspect_ratios
+
+
+def test_parse_aspect_ratios():
+    assert parse_aspect_ratios("16:9, 4:3,2.35") == (16 / 9, 4 / 3, 2.35)
+
+
+def test_ratios_with_the_same_label_are_kept_once():
+    assert parse_aspect_ratios("16:9,1.778,32:18") == (16 / 9,)
+    assert parse_aspect_ratios("2.3501,2.35") == (2.3501,)
+
+
+def test_labels():
+    assert aspect_label(16 / 9) == "16x9"
+    assert aspect_label(2.35) == "2_35"
+
+
+@pytest.mark.parametrize("value", ["", "16:0", "-1", "wide"])
+def test_invalid_ratios(value):
+    with pytest.raises(ValueError):
+        parse_aspect_ratios(value)
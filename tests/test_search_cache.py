@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import itertools
+
+from delacroix.cache import SearchCache
+from delacroix.events import EventBus
+from delacroix.platforms.registry import get_platform
+
+
+def test_cursor_persists_and_wraps(tmp_path):
+    cache = SearchCache(tmp_path)
+    key = {"q": "monet"}
+    entry = cache.put(key, [1, 2, 3])
+    cache.set_cursor(key, entry, 2)
+    assert cache.get(key).cursor == 2
+    cache.set_cursor(key, entry, 4)
+    assert cache.get(key).cursor == 1
+
+
+def test_fresh_results_keep_the_cursor_when_it_still_fits(tmp_path):
+    cache = SearchCache(tmp_path)
+    key = {"q": "monet"}
+    cache.set_cursor(key, cache.put(key, [1, 2, 3, 4]), 3)
+    assert cache.put(key, [5, 6, 7, 8]).cursor == 3
+    assert cache.put(key, [5, 6]).cursor == 0
+
+
+def test_expired_entries_miss(tmp_path):
+    cache = SearchCache(tmp_path, ttl=-1)
+    cache.put({"q": "monet"}, [1])
+    assert cache.get({"q": "monet"}) is None
+    assert cache.misses == 1
+
+
+def met(museum, tmp_path):
+    platform = get_platform("met", search_cache=SearchCache(tmp_path / "search"), events=EventBus())
+    return museum.configure(platform)
+
+
+def test_met_cursor_skips_only_works_handed_out(museum, tmp_path):
+    platform = met(museum, tmp_path)
+    _, _, params = platform.plan_requests()[0]
+    artworks = platform.list_artworks()
+    taken = {artwork.id for artwork in itertools.islice(artworks, 3)}
+    artworks.close()
+
+    entry = platform.search_cache.get(params)
+    passed = [str(i) for i in entry.ids[:entry.cursor]]
+    assert set(passed) <= taken
+    # Works still held in the buffer when the run stopped are examined again
+    assert len(passed) < 30
+
+
+def test_met_cursor_moves_past_a_finished_query(museum, tmp_path):
+    platform = met(museum, tmp_path)
+    _, _, params = platform.plan_requests()[0]
+    list(platform.list_artworks())
+    assert platform.search_cache.get(params).cursor == 30
+
+    # The next run starts where this one stopped
+    second = met(museum, tmp_path)
+    first_id = next(iter(second.list_artworks())).id
+    ids = [str(i) for i in second.search_cache.get(params).ids]
+    assert ids.index(first_id) >= 30
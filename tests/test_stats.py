@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from delacroix.stats import QueryStatsStore
+
+NOW = 1_700_000_000.0
+
+
+def test_concurrent_saves_add_up(tmp_path):
+    path = tmp_path / "stats.sqlite"
+    first, second = QueryStatsStore(path), QueryStatsStore(path)
+    first._load()
+    second._load()
+    first.record("met", "Monet", "painting", kept=2, requests=3)
+    second.record("met", "monet", "painting", kept=1, requests=1)
+    first.save()
+    second.save()
+
+    stats = QueryStatsStore(path).get("met", "Monet", "painting")
+    assert round(stats.kept, 6) == 3
+    assert round(stats.requests, 6) == 4
+
+
+def test_unseen_query_gets_mean_for_same_types(tmp_path):
+    store = QueryStatsStore(tmp_path / "stats.sqlite")
+    store.record("met", "a", "painting", kept=1, requests=10, now=NOW)
+    store.record("met", "b", "print", kept=9, requests=10, now=NOW)
+    store.record("nga", "c", "painting", kept=10, requests=10, now=NOW)
+
+    assert store.expected_yields("met", ["new"], "painting", now=NOW) == {"new": 0.1}
+    assert store.expected_yields("met", ["new"], "print", now=NOW) == {"new": 0.9}
+
+
+def test_mean_falls_back_to_every_type(tmp_path):
+    store = QueryStatsStore(tmp_path / "stats.sqlite")
+    store.record("met", "a", "painting", kept=1, requests=10, now=NOW)
+    store.record("met", "b", "print", kept=3, requests=10, now=NOW)
+
+    assert store.expected_yields("met", ["new"], "drawing", now=NOW) == {"new": 0.2}
+    assert store.expected_yields("nga", ["new"], "drawing", now=NOW) == {"new": 0.0}
+
+
+def test_damaged_store_is_ignored(tmp_path):
+    path = tmp_path / "stats.sqlite"
+    path.write_bytes(b"not a database")
+    store = QueryStatsStore(path)
+    assert store.get("met", "a", "painting") is None
+    store.record("met", "a", "painting", kept=1, requests=1)
+    store.save()
+    assert store.get("met", "a", "painting").kept > 0
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from delacroix.types import compile_filter, normalize_type
+
+
+def test_normalize_type():
+    assert normalize_type(" Paintings ") == "painting"
+    assert normalize_type("statue") == "sculpture"
+    assert normalize_type("mosaic") == "mosaic"
+
+
+def test_chicago_paintings_exclude_other_media():
+    predicate = compile_filter(["painting"], platform="chicago")
+    assert predicate.matches({"artwork_type_title": "Painting", "medium_display": "Oil on canvas"})
+    assert not predicate.matches({"artwork_type_title": "Painting", "medium_display": "Watercolor on paper"})
+    assert not predicate.matches({"artwork_type_title": "Print"})
+
+
+def test_title_words_do_not_exclude_elsewhere():
+    for platform, record in [
+        ("met", {"classification": "Paintings", "title": "Study for a Drawing Room"}),
+        ("nga", {"classification": "Painting", "title": "The Print Seller"}),
+        ("louvre", {"objectType": "Peinture", "title": "Painting of an etching press"}),
+    ]:
+        assert compile_filter(["painting"], platform=platform).matches(record), platform
+
+
+def test_met_medium_does_not_decide_type():
+    predicate = compile_filter(["print"], platform="met")
+    photograph = {"classification": "Photographs", "objectName": "Photograph", "medium": "Gelatin silver print"}
+    assert not predicate.matches(photograph)
+    assert predicate.matches({"classification": "Prints", "objectName": "Print"})
+
+
+def test_another_requested_type_is_never_excluded():
+    predicate = compile_filter(["painting", "drawing"], platform="chicago")
+    assert predicate.matches({"artwork_type_title": "Drawing", "medium_display": "Graphite"})
+
+
+def test_batch_matches_single():
+    predicate = compile_filter(["painting"], ["1800s"], platform="nga")
+    records = [
+        {"classification": "Painting", "title": "Harbor", "artist": "Monet", "displaydate": "1870"},
+        {"classification": "Painting", "title": "Harbor, 1800", "artist": "Monet"},
+        {"classification": "Print", "title": "Harbor, 1800", "artist": "Monet"},
+        {"classification": "Painting", "title": "Harbor", "artist": "Monet"},
+    ]
+    assert predicate.matches_many(records) == [predicate.matches(r) for r in records]
+    assert predicate.matches_many(records) == [False, True, False, False]
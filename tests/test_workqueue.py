@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from delacroix.platforms.base import Artwork
+from delacroix.workqueue import MAX_ATTEMPTS, WorkQueue, shard_for
+
+
+def art(artwork_id: str) -> Artwork:
+    return Artwork(id=artwork_id, title=f"Work {artwork_id}", artist="Someone", image_url=None)
+
+
+def ids_in_shard(shard: int, shards: int, count: int):
+    ids = (str(n) for n in range(1000))
+    return [i for i in ids if shard_for("met", i, shards) == shard][:count]
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite")
+    yield queue
+    queue.close()
+
+
+def test_claims_stop_at_max_items(queue):
+    queue.initialize(shards=1, max_items=2, config={})
+    queue.enqueue("met", [art(str(n)) for n in range(5)])
+    first = queue.claim(0, "a")
+    second = queue.claim(0, "a")
+    assert first and second and first.id != second.id
+    assert queue.claim(0, "b") is None
+
+    # A skip frees its slot; kept items keep theirs
+    queue.complete("met", first.id, "a", "skipped")
+    third = queue.claim(0, "b")
+    assert third is not None
+    queue.complete("met", second.id, "a", "kept")
+    queue.complete("met", third.id, "b", "kept")
+    assert queue.claim(0, "b") is None
+    assert queue.status().finished
+
+
+def test_own_shard_first_and_others_only_after_waiting(queue):
+    queue.initialize(shards=2, max_items=10, config={})
+    theirs = ids_in_shard(1, 2, 1)
+    ours = ids_in_shard(0, 2, 1)
+    queue.enqueue("met", [art(theirs[0])])
+    queue.enqueue("met", [art(ours[0])])
+
+    assert queue.claim(0, "a").id == ours[0]
+    assert queue.claim(0, "a") is None
+    assert queue.claim(0, "a", steal_after=0).id == theirs[0]
+
+
+def test_expired_leases_are_reclaimed_then_failed(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite", lease_seconds=-1)
+    queue.initialize(shards=1, max_items=1, config={})
+    queue.enqueue("met", [art("1")])
+    for attempt in range(MAX_ATTEMPTS):
+        assert queue.claim(0, f"worker-{attempt}").id == "1"
+    # The item's lease has now expired MAX_ATTEMPTS times
+    assert queue.claim(0, "last") is None
+    status = queue.status()
+    assert (status.failed, status.pending, status.leased) == (1, 0, 0)
+    queue.close()
+
+
+def test_completion_ignored_after_losing_the_lease(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite", lease_seconds=-1)
+    queue.initialize(shards=1, max_items=1, config={})
+    queue.enqueue("met", [art("1")])
+    queue.claim(0, "slow")
+    queue.claim(0, "fast")
+    queue.complete("met", "1", "slow", "kept")
+    assert queue.status().kept == 0
+    queue.complete("met", "1", "fast", "kept")
+    assert queue.status().kept == 1
+    queue.close()
+
+
+def test_duplicates_are_queued_once(queue):
+    queue.initialize(shards=1, max_items=1, config={})
+    assert queue.enqueue("met", [art("1"), art("2")]) == 2
+    assert queue.enqueue("met", [art("2"), art("3")]) == 1